@@ -7,17 +7,306 @@ It supports environment variable overrides, validation, and provides sensible de
 """
 
 import os
+import json
+import sys
 import logging
+import dataclasses
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import cached_property, partial
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
+from types import MappingProxyType
+from typing import Dict, Any, Callable, Final, Iterator, Optional, Set, Union
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Resolved .env path -> mtime of the last parse, so repeated Config()
+# construction does not re-read an unchanged file.
+_DOTENV_LOADED: Dict[Path, float] = {}
+
+_TRUES = frozenset({"true", "1", "yes"})
+
+# Default string values, shared across Config instances
+_DEFAULT_COMPRESSION: Final = "gzip"
+_DEFAULT_PLOT_THEME: Final = sys.intern("plotly_white")
+_DEFAULT_COLOR_FOCUS: Final = "#1f77b4"
+_DEFAULT_COLOR_POAS: Final = "#ff7f0e"
+_DEFAULT_COLOR_SQ_GOOD: Final = "#2ca02c"
+_DEFAULT_COLOR_SQ_POOR: Final = "#d62728"
+_DEFAULT_LOG_FILE: Final = "frenz_collector.log"
+_DEFAULT_LOG_FORMAT: Final = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+_DEFAULT_DATE_FORMAT: Final = "%Y-%m-%d %H:%M:%S"
+
+# LOG_LEVEL names -> logging levels
+_LOG_LEVELS: Final = {
+    "CRITICAL": logging.CRITICAL,
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+    "NOTSET": logging.NOTSET,
+}
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean flag from an environment variable value."""
+    return value.lower() in _TRUES
+
+
+def _parse_log_level(value: str) -> int:
+    """Parse a LOG_LEVEL name, falling back to INFO for unknown names."""
+    return _LOG_LEVELS.get(sys.intern(value.upper()), logging.INFO)
+
+
+# Section schemas: (setting name, environment variable, cast, default).
+# Defaults are already typed, so unset variables are never parsed.
+_DEVICE_SCHEMA: Final = (
+    ("default_device_id", "FRENZ_ID", str, None),
+    ("default_product_key", "FRENZ_KEY", str, None),
+    ("connection_timeout", "CONNECTION_TIMEOUT", int, 30),
+    ("reconnect_attempts", "RECONNECT_ATTEMPTS", int, 3),
+    ("auto_connect_on_start", "AUTO_CONNECT_ON_START", _parse_bool, True),
+    ("scan_timeout", "SCAN_TIMEOUT", int, 10),
+    ("reconnect_delay", "RECONNECT_DELAY", float, 1.0),
+    ("max_reconnect_delay", "MAX_RECONNECT_DELAY", float, 60.0),
+    ("worker_cpu", "FRENZ_WORKER_CPU", int, None),
+)
+
+_STORAGE_SCHEMA: Final = (
+    ("data_dir", "DATA_DIR", str, "./data"),
+    ("buffer_size_minutes", "BUFFER_SIZE_MINUTES", int, 5),
+    ("auto_save_interval", "AUTO_SAVE_INTERVAL", int, 300),
+    ("file_rotation_hours", "FILE_ROTATION_HOURS", int, 24),
+    ("compression", "COMPRESSION", str, _DEFAULT_COMPRESSION),
+    ("compression_level", "COMPRESSION_LEVEL", int, 4),
+    ("chunk_size", "HDF5_CHUNK_SIZE", int, 10000),
+    ("max_file_size_gb", "MAX_FILE_SIZE_GB", float, 10.0),
+    ("backup_enabled", "BACKUP_ENABLED", _parse_bool, False),
+)
+
+_DISPLAY_SCHEMA: Final = (
+    ("default_display_window", "DEFAULT_DISPLAY_WINDOW", int, 600),
+    ("max_display_points", "MAX_DISPLAY_POINTS", int, 1000),
+    ("downsample_threshold", "DOWNSAMPLE_THRESHOLD", int, 5000),
+    ("memory_limit_mb", "MEMORY_LIMIT_MB", int, 500),
+    ("auto_scroll", "AUTO_SCROLL", _parse_bool, True),
+)
+
+_UPDATE_INTERVALS_SCHEMA: Final = (
+    ("focus", "UPDATE_INTERVAL_FOCUS", int, 2),
+    ("poas", "UPDATE_INTERVAL_POAS", int, 30),
+    ("power_bands", "UPDATE_INTERVAL_POWER_BANDS", int, 2),
+    ("signal_quality", "UPDATE_INTERVAL_SIGNAL_QUALITY", int, 5),
+    ("posture", "UPDATE_INTERVAL_POSTURE", int, 5),
+    ("sleep_stage", "UPDATE_INTERVAL_SLEEP_STAGE", int, 30),
+)
+
+_PLOT_SETTINGS_SCHEMA: Final = (
+    ("theme", "PLOT_THEME", sys.intern, _DEFAULT_PLOT_THEME),
+    ("height", "PLOT_HEIGHT", int, 400),
+    ("show_legend", "SHOW_LEGEND", _parse_bool, True),
+    ("animate_transitions", "ANIMATE_TRANSITIONS", _parse_bool, False),
+)
+
+_COLOR_SCHEMES_SCHEMA: Final = (
+    ("focus", "COLOR_FOCUS", str, _DEFAULT_COLOR_FOCUS),
+    ("poas", "COLOR_POAS", str, _DEFAULT_COLOR_POAS),
+    ("signal_quality_good", "COLOR_SQ_GOOD", str, _DEFAULT_COLOR_SQ_GOOD),
+    ("signal_quality_poor", "COLOR_SQ_POOR", str, _DEFAULT_COLOR_SQ_POOR),
+)
+
+_LOGGING_SCHEMA: Final = (
+    ("log_level", "LOG_LEVEL", _parse_log_level, logging.INFO),
+    ("log_file", "LOG_FILE", str, _DEFAULT_LOG_FILE),
+    ("log_dir", "LOG_DIR", str, "./logs"),
+    ("log_rotation", "LOG_ROTATION", _parse_bool, True),
+    ("max_log_size_mb", "MAX_LOG_SIZE_MB", int, 10),
+    ("backup_count", "LOG_BACKUP_COUNT", int, 5),
+    ("console_logging", "CONSOLE_LOGGING", _parse_bool, True),
+    ("debug_mode", "DEBUG_MODE", _parse_bool, False),
+    ("log_format", "LOG_FORMAT", str, _DEFAULT_LOG_FORMAT),
+    ("date_format", "DATE_FORMAT", str, _DEFAULT_DATE_FORMAT),
+)
+
+
+# Every environment variable the loaders read; initialize_config() keys its cache on these
+_ENV_KEYS: Final = tuple(sorted(
+    {key for schema in (_DEVICE_SCHEMA, _STORAGE_SCHEMA, _DISPLAY_SCHEMA, _UPDATE_INTERVALS_SCHEMA,
+                        _PLOT_SETTINGS_SCHEMA, _COLOR_SCHEMES_SCHEMA, _LOGGING_SCHEMA)
+     for _, key, _, _ in schema} | {"BACKUP_DIR"}
+))
+
+
+def _load_schema(env: Mapping, schema) -> Dict[str, Any]:
+    """Build settings from an environment mapping according to a section schema."""
+    return {
+        name: cast(env[key]) if key in env else default
+        for name, key, cast, default in schema
+    }
+
+
+def _load_dotenv_once(env_file: Path) -> None:
+    """Load a .env file unless it was already parsed and has not changed since."""
+    try:
+        env_file = env_file.resolve()
+        mtime = env_file.stat().st_mtime
+    except OSError:
+        return
+
+    if _DOTENV_LOADED.get(env_file) == mtime:
+        return
+
+    load_dotenv(env_file, override=False)
+    _DOTENV_LOADED[env_file] = mtime
+
 
 class ConfigurationError(Exception):
     """Raised when there's an error in configuration."""
     pass
 
 
+# dataclass(slots=True) is only available on Python 3.10+
+_SECTION_OPTIONS = {"frozen": True, "slots": True} if sys.version_info >= (3, 10) else {"frozen": True}
+
+
+class _Deferred:
+    """A configuration value computed on first access and cached afterwards."""
+
+    __slots__ = ("_compute", "_value")
+
+    def __init__(self, compute: Callable[[], Any]):
+        self._compute = compute
+        self._value = None
+
+    def resolve(self) -> Any:
+        """Compute the value if needed and return it."""
+        if self._compute is not None:
+            self._value = self._compute()
+            self._compute = None
+        return self._value
+
+
+def _resolve(value: Any) -> Any:
+    """Materialize a possibly deferred configuration value."""
+    return value.resolve() if isinstance(value, _Deferred) else value
+
+
+class _Section(Mapping):
+    """
+    Base class for immutable settings sections.
+
+    Settings are read as attributes (``config.storage.chunk_size``); the Mapping
+    interface keeps ``config.storage["chunk_size"]`` style callers working.
+    Deferred settings are stored in an underscore-prefixed field and exposed
+    through a property of the public name.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        fields = self.__dataclass_fields__
+        if not key.startswith("_") and (key in fields or "_" + key in fields):
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return (name.lstrip("_") for name in self.__dataclass_fields__)
+
+    def __len__(self) -> int:
+        return len(self.__dataclass_fields__)
+
+    def copy(self) -> Dict[str, Any]:
+        """Return the section as a plain (mutable) dictionary, nested mappings included."""
+        return {key: dict(value) if isinstance(value, Mapping) else value for key, value in self.items()}
+
+    def replace(self, key: str, value: Any) -> "_Section":
+        """Return a copy of the section with one setting changed."""
+        field_name = key if key in self.__dataclass_fields__ else "_" + key
+        return dataclasses.replace(self, **{field_name: value})
+
+
+@dataclass(**_SECTION_OPTIONS)
+class DeviceSettings(_Section):
+    """Device connection settings."""
+    default_device_id: Optional[str]
+    default_product_key: Optional[str]
+    connection_timeout: int
+    reconnect_attempts: int
+    auto_connect_on_start: bool
+    scan_timeout: int
+    reconnect_delay: float
+    max_reconnect_delay: float
+    worker_cpu: Optional[int]
+
+
+@dataclass(**_SECTION_OPTIONS)
+class StorageSettings(_Section):
+    """HDF5 storage and buffering settings."""
+    _data_dir: Union[Path, _Deferred]
+    buffer_size_minutes: int
+    auto_save_interval: int
+    file_rotation_hours: int
+    compression: str
+    compression_level: int
+    chunk_size: int
+    max_file_size_gb: float
+    backup_enabled: bool
+    _backup_dir: Union[Path, _Deferred]
+
+    @property
+    def data_dir(self) -> Path:
+        """Data directory, only built when first needed."""
+        return _resolve(self._data_dir)
+
+    @property
+    def backup_dir(self) -> Path:
+        """Backup directory, only built when first needed."""
+        return _resolve(self._backup_dir)
+
+
+@dataclass(**_SECTION_OPTIONS)
+class DisplaySettings(_Section):
+    """Dashboard display settings."""
+    default_display_window: int
+    max_display_points: int
+    downsample_threshold: int
+    memory_limit_mb: int
+    auto_scroll: bool
+    update_intervals: Mapping[str, int]  # Read-only views, see _load_display_settings()
+    plot_settings: Mapping[str, Any]
+    color_schemes: Mapping[str, str]
+
+
+@dataclass(**_SECTION_OPTIONS)
+class LoggingSettings(_Section):
+    """Logging settings."""
+    log_level: int
+    log_file: str
+    _log_dir: Union[Path, _Deferred]
+    log_rotation: bool
+    max_log_size_mb: int
+    backup_count: int
+    console_logging: bool
+    debug_mode: bool
+    log_format: str
+    date_format: str
+
+    @property
+    def log_dir(self) -> Path:
+        """Log directory, only built when first needed."""
+        return _resolve(self._log_dir)
+
+    @property
+    def log_file_path(self) -> Path:
+        """Full path of the log file."""
+        return self.log_dir / self.log_file
+
+
 class Config:
     """
     Centralized configuration management for FRENZ data collection system.
@@ -28,8 +317,48 @@ class Config:
     - Override capabilities
     - Default fallback values
     - Type checking and conversion
+
+    Sections are loaded, and validated, when first accessed. Call validate()
+    at startup (initialize_config() and get_config() do) so that an invalid
+    value raises there rather than in whichever caller reads it first.
     """
 
+    _SECTIONS: Final = ("device", "storage", "display", "logging")
+
+    # Directories already ensured by create_directories(), shared by all instances
+    _created_dirs: Set[str] = set()
+
+    # Per-key validation rules: (section, key) -> (predicate, error message).
+    # override() checks only the rule for the key being changed; nested values
+    # (update_intervals, plot_settings) fall back to _validate_section().
+    _VALIDATORS = {
+        # Device settings
+        ("device", "connection_timeout"): (lambda v: v > 0, "Connection timeout must be positive"),
+        ("device", "reconnect_attempts"): (lambda v: v >= 0, "Reconnect attempts must be non-negative"),
+        ("device", "scan_timeout"): (lambda v: v > 0, "Scan timeout must be positive"),
+        ("device", "reconnect_delay"): (lambda v: v > 0, "Reconnect delay must be positive"),
+        ("device", "max_reconnect_delay"): (lambda v: v > 0, "Max reconnect delay must be positive"),
+        ("device", "worker_cpu"): (lambda v: v is None or v >= 0, "Worker CPU must be a non-negative CPU index"),
+
+        # Storage settings
+        ("storage", "buffer_size_minutes"): (lambda v: v > 0, "Buffer size must be positive"),
+        ("storage", "auto_save_interval"): (lambda v: v > 0, "Auto-save interval must be positive"),
+        ("storage", "file_rotation_hours"): (lambda v: v > 0, "File rotation hours must be positive"),
+        ("storage", "compression_level"): (lambda v: 0 <= v <= 9, "Compression level must be between 0 and 9"),
+        ("storage", "chunk_size"): (lambda v: v > 0, "HDF5 chunk size must be positive"),
+        ("storage", "max_file_size_gb"): (lambda v: v > 0, "Max file size must be positive"),
+
+        # Display settings
+        ("display", "default_display_window"): (lambda v: v > 0, "Display window must be positive"),
+        ("display", "max_display_points"): (lambda v: v > 0, "Max display points must be positive"),
+        ("display", "downsample_threshold"): (lambda v: v > 0, "Downsample threshold must be positive"),
+        ("display", "memory_limit_mb"): (lambda v: v > 0, "Memory limit must be positive"),
+
+        # Logging settings
+        ("logging", "max_log_size_mb"): (lambda v: v > 0, "Max log size must be positive"),
+        ("logging", "backup_count"): (lambda v: v >= 0, "Backup count must be non-negative"),
+    }
+
     def __init__(self, env_file: Optional[Union[str, Path]] = None, validate: bool = True):
         """
         Initialize configuration.
@@ -41,172 +370,123 @@ class Config:
         # Load environment variables
         if env_file is None:
             env_file = Path.cwd() / ".env"
-        if Path(env_file).exists():
-            load_dotenv(env_file)
-
-        # Initialize configuration sections
-        self._device_settings = self._load_device_settings()
-        self._storage_settings = self._load_storage_settings()
-        self._display_settings = self._load_display_settings()
-        self._logging_settings = self._load_logging_settings()
-
-        if validate:
-            self._validate_config()
-
-    def _load_device_settings(self) -> Dict[str, Any]:
-        """Load device-related configuration settings."""
-        return {
-            "default_device_id": os.getenv("FRENZ_ID"),
-            "default_product_key": os.getenv("FRENZ_KEY"),
-            "connection_timeout": int(os.getenv("CONNECTION_TIMEOUT", "30")),
-            "reconnect_attempts": int(os.getenv("RECONNECT_ATTEMPTS", "3")),
-            "auto_connect_on_start": os.getenv("AUTO_CONNECT_ON_START", "True").lower() == "true",
-            "scan_timeout": int(os.getenv("SCAN_TIMEOUT", "10")),
-            "reconnect_delay": float(os.getenv("RECONNECT_DELAY", "1.0")),
-            "max_reconnect_delay": float(os.getenv("MAX_RECONNECT_DELAY", "60.0")),
-        }
-
-    def _load_storage_settings(self) -> Dict[str, Any]:
-        """Load storage-related configuration settings."""
-        data_dir = Path(os.getenv("DATA_DIR", "./data"))
-        return {
-            "data_dir": data_dir,
-            "buffer_size_minutes": int(os.getenv("BUFFER_SIZE_MINUTES", "5")),
-            "auto_save_interval": int(os.getenv("AUTO_SAVE_INTERVAL", "300")),
-            "file_rotation_hours": int(os.getenv("FILE_ROTATION_HOURS", "24")),
-            "compression": os.getenv("COMPRESSION", "gzip"),
-            "compression_level": int(os.getenv("COMPRESSION_LEVEL", "4")),
-            "chunk_size": int(os.getenv("HDF5_CHUNK_SIZE", "10000")),
-            "max_file_size_gb": float(os.getenv("MAX_FILE_SIZE_GB", "10.0")),
-            "backup_enabled": os.getenv("BACKUP_ENABLED", "False").lower() == "true",
-            "backup_dir": Path(os.getenv("BACKUP_DIR", data_dir / "backups")),
-        }
-
-    def _load_display_settings(self) -> Dict[str, Any]:
-        """Load display-related configuration settings."""
-        return {
-            "default_display_window": int(os.getenv("DEFAULT_DISPLAY_WINDOW", "600")),
-            "max_display_points": int(os.getenv("MAX_DISPLAY_POINTS", "1000")),
-            "downsample_threshold": int(os.getenv("DOWNSAMPLE_THRESHOLD", "5000")),
-            "memory_limit_mb": int(os.getenv("MEMORY_LIMIT_MB", "500")),
-            "auto_scroll": os.getenv("AUTO_SCROLL", "True").lower() == "true",
-            "update_intervals": {
-                "focus": int(os.getenv("UPDATE_INTERVAL_FOCUS", "2")),
-                "poas": int(os.getenv("UPDATE_INTERVAL_POAS", "30")),
-                "power_bands": int(os.getenv("UPDATE_INTERVAL_POWER_BANDS", "2")),
-                "signal_quality": int(os.getenv("UPDATE_INTERVAL_SIGNAL_QUALITY", "5")),
-                "posture": int(os.getenv("UPDATE_INTERVAL_POSTURE", "5")),
-                "sleep_stage": int(os.getenv("UPDATE_INTERVAL_SLEEP_STAGE", "30")),
-            },
-            "plot_settings": {
-                "theme": os.getenv("PLOT_THEME", "plotly_white"),
-                "height": int(os.getenv("PLOT_HEIGHT", "400")),
-                "show_legend": os.getenv("SHOW_LEGEND", "True").lower() == "true",
-                "animate_transitions": os.getenv("ANIMATE_TRANSITIONS", "False").lower() == "true",
-            },
-            "color_schemes": {
-                "focus": os.getenv("COLOR_FOCUS", "#1f77b4"),
-                "poas": os.getenv("COLOR_POAS", "#ff7f0e"),
-                "signal_quality_good": os.getenv("COLOR_SQ_GOOD", "#2ca02c"),
-                "signal_quality_poor": os.getenv("COLOR_SQ_POOR", "#d62728"),
-            }
-        }
-
-    def _load_logging_settings(self) -> Dict[str, Any]:
-        """Load logging-related configuration settings."""
-        log_level_str = os.getenv("LOG_LEVEL", "INFO").upper()
-        log_level = getattr(logging, log_level_str, logging.INFO)
-
-        return {
-            "log_level": log_level,
-            "log_file": os.getenv("LOG_FILE", "frenz_collector.log"),
-            "log_dir": Path(os.getenv("LOG_DIR", "./logs")),
-            "log_rotation": os.getenv("LOG_ROTATION", "True").lower() == "true",
-            "max_log_size_mb": int(os.getenv("MAX_LOG_SIZE_MB", "10")),
-            "backup_count": int(os.getenv("LOG_BACKUP_COUNT", "5")),
-            "console_logging": os.getenv("CONSOLE_LOGGING", "True").lower() == "true",
-            "debug_mode": os.getenv("DEBUG_MODE", "False").lower() == "true",
-            "log_format": os.getenv("LOG_FORMAT",
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"),
-            "date_format": os.getenv("DATE_FORMAT", "%Y-%m-%d %H:%M:%S"),
-        }
-
-    def _validate_config(self) -> None:
-        """Validate configuration values."""
-        # Validate device settings
-        if self._device_settings["connection_timeout"] <= 0:
-            raise ConfigurationError("Connection timeout must be positive")
+        _load_dotenv_once(Path(env_file))
 
-        if self._device_settings["reconnect_attempts"] < 0:
-            raise ConfigurationError("Reconnect attempts must be non-negative")
+        # Sections are loaded (and validated) on first access, see _device_settings
+        # etc.; validate() loads and checks them all up front
+        self._validate = validate
 
-        if self._device_settings["scan_timeout"] <= 0:
-            raise ConfigurationError("Scan timeout must be positive")
+        # Memoized dotted-path lookups (see get()) and JSON export (see to_json())
+        self._dotted_cache: Dict[str, Any] = {}
+        self._json_cache: Optional[bytes] = None
+        self._formatter: Optional[logging.Formatter] = None
 
-        if self._device_settings["reconnect_delay"] <= 0:
-            raise ConfigurationError("Reconnect delay must be positive")
+    @cached_property
+    def _device_settings(self) -> DeviceSettings:
+        return self._checked("device", self._load_device_settings())
 
-        if self._device_settings["max_reconnect_delay"] <= 0:
-            raise ConfigurationError("Max reconnect delay must be positive")
+    @cached_property
+    def _storage_settings(self) -> StorageSettings:
+        return self._checked("storage", self._load_storage_settings())
 
-        # Validate storage settings
-        if self._storage_settings["buffer_size_minutes"] <= 0:
-            raise ConfigurationError("Buffer size must be positive")
+    @cached_property
+    def _display_settings(self) -> DisplaySettings:
+        return self._checked("display", self._load_display_settings())
 
-        if self._storage_settings["auto_save_interval"] <= 0:
-            raise ConfigurationError("Auto-save interval must be positive")
+    @cached_property
+    def _logging_settings(self) -> LoggingSettings:
+        return self._checked("logging", self._load_logging_settings())
 
-        if self._storage_settings["file_rotation_hours"] <= 0:
-            raise ConfigurationError("File rotation hours must be positive")
+    def _checked(self, section: str, settings: _Section) -> _Section:
+        """Validate a freshly loaded section if validation is enabled."""
+        if self._validate:
+            self._validate_section(section, settings)
+        return settings
 
-        if not 0 <= self._storage_settings["compression_level"] <= 9:
-            raise ConfigurationError("Compression level must be between 0 and 9")
+    def _section(self, section: str) -> _Section:
+        """Get a settings section by name, loading it if needed."""
+        return getattr(self, f"_{section}_settings")
 
-        if self._storage_settings["chunk_size"] <= 0:
-            raise ConfigurationError("HDF5 chunk size must be positive")
+    def _load_device_settings(self) -> DeviceSettings:
+        """Load device-related configuration settings."""
+        return DeviceSettings(**_load_schema(os.environ, _DEVICE_SCHEMA))
 
-        if self._storage_settings["max_file_size_gb"] <= 0:
-            raise ConfigurationError("Max file size must be positive")
+    def _load_storage_settings(self) -> StorageSettings:
+        """Load storage-related configuration settings."""
+        env = os.environ
+        settings = _load_schema(env, _STORAGE_SCHEMA)
+        deferred_data_dir = _Deferred(partial(Path, settings.pop("data_dir")))
+        backup_dir = env.get("BACKUP_DIR")
+        # Without BACKUP_DIR, backups go under the data directory, built on first use
+        return StorageSettings(
+            **settings,
+            _data_dir=deferred_data_dir,
+            _backup_dir=_Deferred(lambda: Path(backup_dir) if backup_dir else _resolve(deferred_data_dir) / "backups"),
+        )
 
-        # Validate display settings
-        if self._display_settings["default_display_window"] <= 0:
-            raise ConfigurationError("Display window must be positive")
+    def _load_display_settings(self) -> DisplaySettings:
+        """Load display-related configuration settings."""
+        env = os.environ
+        return DisplaySettings(
+            **_load_schema(env, _DISPLAY_SCHEMA),
+            update_intervals=MappingProxyType(_load_schema(env, _UPDATE_INTERVALS_SCHEMA)),
+            plot_settings=MappingProxyType(_load_schema(env, _PLOT_SETTINGS_SCHEMA)),
+            color_schemes=MappingProxyType(_load_schema(env, _COLOR_SCHEMES_SCHEMA)),
+        )
 
-        if self._display_settings["max_display_points"] <= 0:
-            raise ConfigurationError("Max display points must be positive")
+    def _load_logging_settings(self) -> LoggingSettings:
+        """Load logging-related configuration settings."""
+        settings = _load_schema(os.environ, _LOGGING_SCHEMA)
+        log_dir = _Deferred(partial(Path, settings.pop("log_dir")))
+        return LoggingSettings(**settings, _log_dir=log_dir)
 
-        if self._display_settings["downsample_threshold"] <= 0:
-            raise ConfigurationError("Downsample threshold must be positive")
+    def validate(self) -> None:
+        """
+        Load and validate all configuration sections.
 
-        if self._display_settings["memory_limit_mb"] <= 0:
-            raise ConfigurationError("Memory limit must be positive")
+        Raises:
+            ConfigurationError: If any value is invalid
+        """
+        for section in self._SECTIONS:
+            self._validate_section(section, self._section(section))
 
-        # Validate update intervals
-        for metric, interval in self._display_settings["update_intervals"].items():
-            if interval <= 0:
-                raise ConfigurationError(f"Update interval for {metric} must be positive")
+    def _validate_section(self, section: str, settings: _Section) -> None:
+        """
+        Validate the values of one configuration section.
 
-        # Validate plot settings
-        if self._display_settings["plot_settings"]["height"] <= 0:
-            raise ConfigurationError("Plot height must be positive")
+        Args:
+            section: Configuration section name
+            settings: Section to validate
+        """
+        for (rule_section, key), (is_valid, message) in self._VALIDATORS.items():
+            if rule_section == section and not is_valid(getattr(settings, key)):
+                raise ConfigurationError(message)
 
-        # Validate logging settings
-        if self._logging_settings["max_log_size_mb"] <= 0:
-            raise ConfigurationError("Max log size must be positive")
+        if section == "display":
+            # Validate update intervals
+            for metric, interval in settings.update_intervals.items():
+                if interval <= 0:
+                    raise ConfigurationError(f"Update interval for {metric} must be positive")
 
-        if self._logging_settings["backup_count"] < 0:
-            raise ConfigurationError("Backup count must be non-negative")
+            # Validate plot settings
+            if settings.plot_settings["height"] <= 0:
+                raise ConfigurationError("Plot height must be positive")
 
     def create_directories(self) -> None:
         """Create necessary directories if they don't exist."""
         directories = [
-            self._storage_settings["data_dir"],
-            self._storage_settings["backup_dir"],
-            self._logging_settings["log_dir"],
+            self._storage_settings.data_dir,
+            self._storage_settings.backup_dir,
+            self._logging_settings.log_dir,
         ]
 
         for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
+            path = os.fspath(directory)
+            if path in Config._created_dirs:
+                continue
+            if not os.path.isdir(path):
+                os.makedirs(path, exist_ok=True)
+            Config._created_dirs.add(path)
 
     def override(self, section: str, key: str, value: Any, validate: bool = True) -> None:
         """
@@ -216,196 +496,289 @@ class Config:
             section: Configuration section (device, storage, display, logging)
             key: Configuration key
             value: New value
-            validate: Whether to validate after setting the value
+            validate: Whether to validate the value before setting it
         """
-        section_map = {
-            "device": self._device_settings,
-            "storage": self._storage_settings,
-            "display": self._display_settings,
-            "logging": self._logging_settings,
-        }
-
-        if section not in section_map:
+        if section not in self._SECTIONS:
             raise ConfigurationError(f"Unknown configuration section: {section}")
 
-        if key not in section_map[section]:
+        current = self._section(section)
+        if key not in current:
             raise ConfigurationError(f"Unknown configuration key: {key} in section {section}")
 
-        # Store old value in case validation fails
-        old_value = section_map[section][key]
-        section_map[section][key] = value
+        # Sections are immutable, so build the updated copy and validate it
+        # before swapping it in; nested mappings are stored as read-only views
+        if isinstance(value, Mapping):
+            value = MappingProxyType(dict(value))
+        updated = current.replace(key, value)
 
         if validate:
-            try:
-                self._validate_config()
-            except ConfigurationError:
-                # Restore old value and re-raise
-                section_map[section][key] = old_value
-                raise
+            rule = self._VALIDATORS.get((section, key))
+            if rule is None:
+                self._validate_section(section, updated)
+            elif not rule[0](value):
+                raise ConfigurationError(rule[1])
+
+        self._set_section(section, updated)
+
+    def _set_section(self, section: str, settings: _Section) -> None:
+        """Replace a settings section and drop lookups that may refer to it."""
+        setattr(self, f"_{section}_settings", settings)
+        self._dotted_cache.clear()
+        self._json_cache = None
+        if section == "logging":
+            self._formatter = None
+
+    def log_formatter(self) -> logging.Formatter:
+        """
+        Get the log formatter for the current logging settings.
 
-    def get(self, section: str, key: str, default: Any = None) -> Any:
+        The formatter is built once and shared by all handlers; it is rebuilt
+        only after the logging section is overridden.
+
+        Returns:
+            logging.Formatter instance
+        """
+        if self._formatter is None:
+            self._formatter = logging.Formatter(
+                self._logging_settings.log_format,
+                datefmt=self._logging_settings.date_format
+            )
+        return self._formatter
+
+    def get(self, section: str, key: Optional[str] = None, default: Any = None) -> Any:
         """
         Get a configuration value.
 
+        The value can also be addressed with a single dotted path, e.g.
+        ``get("display.update_intervals.focus")``.
+
         Args:
-            section: Configuration section
+            section: Configuration section, or a dotted path if key is None
             key: Configuration key
             default: Default value if key not found
 
         Returns:
             Configuration value
         """
-        section_map = {
-            "device": self._device_settings,
-            "storage": self._storage_settings,
-            "display": self._display_settings,
-            "logging": self._logging_settings,
-        }
-
-        if section not in section_map:
+        if key is None:
+            try:
+                return self._resolve_dotted(section)
+            except (KeyError, TypeError, ConfigurationError):
+                return default
+
+        if section not in self._SECTIONS:
             return default
 
-        return section_map[section].get(key, default)
+        return self._section(section).get(key, default)
+
+    def _resolve_dotted(self, path: str) -> Any:
+        """Resolve a dotted configuration path, memoizing successful lookups."""
+        try:
+            return self._dotted_cache[path]
+        except KeyError:
+            pass
 
-    def get_section(self, section: str) -> Dict[str, Any]:
+        section, _, rest = path.partition(".")
+        if not rest:
+            return self.get_section(section)
+
+        if section not in self._SECTIONS:
+            raise KeyError(section)
+
+        value = self._section(section)
+        for part in rest.split("."):
+            value = value[part]
+
+        self._dotted_cache[path] = value
+        return value
+
+    def get_section(self, section: str, mutable: bool = False) -> Mapping:
         """
         Get entire configuration section.
 
         Args:
             section: Configuration section name
+            mutable: Return a dict copy that can be modified instead of the section
 
         Returns:
-            Dictionary containing section configuration
+            Immutable settings section (or dict copy if mutable)
         """
-        section_map = {
-            "device": self._device_settings,
-            "storage": self._storage_settings,
-            "display": self._display_settings,
-            "logging": self._logging_settings,
-        }
-
-        if section not in section_map:
+        if section not in self._SECTIONS:
             raise ConfigurationError(f"Unknown configuration section: {section}")
 
-        return section_map[section].copy()
+        if mutable:
+            return self._section(section).copy()
+        return self._section(section)
 
     def to_dict(self) -> Dict[str, Dict[str, Any]]:
         """
         Export all configuration as a dictionary.
 
+        Each call returns a fresh copy, nested dicts included, so callers may
+        modify it without affecting the configuration.
+
         Returns:
             Dictionary containing all configuration sections
         """
-        return {
-            "device": self._device_settings.copy(),
-            "storage": self._storage_settings.copy(),
-            "display": self._display_settings.copy(),
-            "logging": self._logging_settings.copy(),
-        }
+        return {section: self._section(section).copy() for section in self._SECTIONS}
+
+    def to_json(self) -> bytes:
+        """
+        Export all configuration as UTF-8 encoded JSON.
+
+        Uses orjson when it is installed. Paths are written as strings.
+
+        Returns:
+            JSON document containing all configuration sections
+        """
+        if self._json_cache is None:
+            if orjson is not None:
+                self._json_cache = orjson.dumps(self.to_dict(), default=os.fspath)
+            else:
+                self._json_cache = json.dumps(self.to_dict(), default=os.fspath).encode("utf-8")
+        return self._json_cache
 
     @property
-    def device(self) -> Dict[str, Any]:
+    def device(self) -> DeviceSettings:
         """Device configuration settings."""
-        return self._device_settings.copy()
+        return self._device_settings
 
     @property
-    def storage(self) -> Dict[str, Any]:
+    def storage(self) -> StorageSettings:
         """Storage configuration settings."""
-        return self._storage_settings.copy()
+        return self._storage_settings
 
     @property
-    def display(self) -> Dict[str, Any]:
+    def display(self) -> DisplaySettings:
         """Display configuration settings."""
-        return self._display_settings.copy()
+        return self._display_settings
 
     @property
-    def logging(self) -> Dict[str, Any]:
+    def logging(self) -> LoggingSettings:
         """Logging configuration settings."""
-        return self._logging_settings.copy()
-
+        return self._logging_settings
+
+
+# Convenience constants for backwards compatibility and easy access. These,
+# like the global ``config`` instance itself, are resolved on first attribute
+# access (PEP 562) so that ``import config`` has no side effects.
+_LAZY_CONSTANTS = {
+    # Device Settings
+    "DEFAULT_DEVICE_ID": ("device", "default_device_id"),
+    "DEFAULT_PRODUCT_KEY": ("device", "default_product_key"),
+    "CONNECTION_TIMEOUT": ("device", "connection_timeout"),
+    "RECONNECT_ATTEMPTS": ("device", "reconnect_attempts"),
+    "AUTO_CONNECT_ON_START": ("device", "auto_connect_on_start"),
+
+    # Storage Settings
+    "DATA_DIR": ("storage", "data_dir"),
+    "BUFFER_SIZE_MINUTES": ("storage", "buffer_size_minutes"),
+    "AUTO_SAVE_INTERVAL": ("storage", "auto_save_interval"),
+    "FILE_ROTATION_HOURS": ("storage", "file_rotation_hours"),
+    "COMPRESSION": ("storage", "compression"),
+    "COMPRESSION_LEVEL": ("storage", "compression_level"),
+
+    # Display Settings
+    "DEFAULT_DISPLAY_WINDOW": ("display", "default_display_window"),
+    "MAX_DISPLAY_POINTS": ("display", "max_display_points"),
+    "UPDATE_INTERVALS": ("display", "update_intervals"),
+
+    # Logging Settings
+    "LOG_LEVEL": ("logging", "log_level"),
+    "LOG_FILE": ("logging", "log_file"),
+}
+
+
+def get_config() -> Config:
+    """
+    Get the global configuration instance, creating it on first use.
 
-# Global configuration instance
-config = Config()
+    Returns:
+        The shared Config instance
+    """
+    instance = globals().get("config")
+    if instance is None:
+        instance = Config()
+        instance.validate()
+        instance.create_directories()
+        globals()["config"] = instance
+    return instance
 
-# Convenience constants for backwards compatibility and easy access
-# Device Settings
-DEFAULT_DEVICE_ID = config.device.get("default_device_id")
-DEFAULT_PRODUCT_KEY = config.device.get("default_product_key")
-CONNECTION_TIMEOUT = config.device["connection_timeout"]
-RECONNECT_ATTEMPTS = config.device["reconnect_attempts"]
-AUTO_CONNECT_ON_START = config.device["auto_connect_on_start"]
 
-# Storage Settings
-DATA_DIR = config.storage["data_dir"]
-BUFFER_SIZE_MINUTES = config.storage["buffer_size_minutes"]
-AUTO_SAVE_INTERVAL = config.storage["auto_save_interval"]
-FILE_ROTATION_HOURS = config.storage["file_rotation_hours"]
-COMPRESSION = config.storage["compression"]
-COMPRESSION_LEVEL = config.storage["compression_level"]
+def __getattr__(name: str) -> Any:
+    """Lazily resolve the global ``config`` instance and convenience constants."""
+    if name == "config":
+        return get_config()
+    if name in _LAZY_CONSTANTS:
+        section, key = _LAZY_CONSTANTS[name]
+        return get_config().get(section, key)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Display Settings
-DEFAULT_DISPLAY_WINDOW = config.display["default_display_window"]
-MAX_DISPLAY_POINTS = config.display["max_display_points"]
-UPDATE_INTERVALS = config.display["update_intervals"]
 
-# Logging Settings
-LOG_LEVEL = config.logging["log_level"]
-LOG_FILE = config.logging["log_file"]
+# Logging settings most recently applied by setup_logging()
+_applied_logging_settings: Optional[LoggingSettings] = None
 
 
 def setup_logging() -> None:
     """Setup logging configuration based on config settings."""
-    log_config = config.logging
+    global _applied_logging_settings
+
+    cfg = get_config()
+    log_config = cfg.logging
+
+    # Nothing to do if these exact settings are already in effect
+    if log_config == _applied_logging_settings:
+        return
 
     # Create log directory
-    log_dir = log_config["log_dir"]
+    log_dir = log_config.log_dir
     log_dir.mkdir(parents=True, exist_ok=True)
 
     # Configure logging
-    log_file_path = log_dir / log_config["log_file"]
+    log_file_path = log_config.log_file_path
 
+    formatter = cfg.log_formatter()
     handlers = []
 
     # File handler
-    if log_config["log_rotation"]:
+    if log_config.log_rotation:
         from logging.handlers import RotatingFileHandler
         file_handler = RotatingFileHandler(
             log_file_path,
-            maxBytes=log_config["max_log_size_mb"] * 1024 * 1024,
-            backupCount=log_config["backup_count"]
+            maxBytes=log_config.max_log_size_mb * 1024 * 1024,
+            backupCount=log_config.backup_count
         )
     else:
         file_handler = logging.FileHandler(log_file_path)
 
-    file_handler.setLevel(log_config["log_level"])
-    file_handler.setFormatter(logging.Formatter(
-        log_config["log_format"],
-        datefmt=log_config["date_format"]
-    ))
+    file_handler.setLevel(log_config.log_level)
+    file_handler.setFormatter(formatter)
     handlers.append(file_handler)
 
     # Console handler
-    if log_config["console_logging"]:
+    if log_config.console_logging:
         console_handler = logging.StreamHandler()
-        console_handler.setLevel(log_config["log_level"])
-        console_handler.setFormatter(logging.Formatter(
-            log_config["log_format"],
-            datefmt=log_config["date_format"]
-        ))
+        console_handler.setLevel(log_config.log_level)
+        console_handler.setFormatter(formatter)
         handlers.append(console_handler)
 
     # Configure root logger
     logging.basicConfig(
-        level=log_config["log_level"],
+        level=log_config.log_level,
         handlers=handlers,
         force=True
     )
 
     # Set specific logger levels for debug mode
-    if log_config["debug_mode"]:
+    if log_config.debug_mode:
         logging.getLogger("frenz").setLevel(logging.DEBUG)
         logging.getLogger("h5py").setLevel(logging.INFO)  # Reduce h5py noise
 
+    _applied_logging_settings = log_config
+
+
+_initialized: Optional[tuple] = None
+
 
 def initialize_config(env_file: Optional[Union[str, Path]] = None) -> Config:
     """
@@ -417,12 +790,24 @@ def initialize_config(env_file: Optional[Union[str, Path]] = None) -> Config:
     Returns:
         Configured Config instance
     """
-    global config
+    global config, _initialized
+    env_path = Path(env_file) if env_file is not None else Path.cwd() / ".env"
+    _load_dotenv_once(env_path)
+
+    try:
+        env_path = env_path.resolve()
+        mtime = env_path.stat().st_mtime
+    except OSError:
+        mtime = 0.0
+    key = (os.fspath(env_path), mtime, tuple(os.environ.get(name) for name in _ENV_KEYS))
+
+    # Re-entry with the same .env file and environment returns the existing instance
+    if _initialized is not None and _initialized[0] == key and globals().get("config") is _initialized[1]:
+        return _initialized[1]
+
     config = Config(env_file=env_file)
+    config.validate()
     config.create_directories()
     setup_logging()
+    _initialized = (key, config)
     return config
-
-
-# Initialize on import
-config.create_directories()
\ No newline at end of file
@@ -39,9 +39,14 @@ def _():
     # Import required libraries
     import os
     import time
+    import itertools
+    import queue
+    import numpy as np
     from pathlib import Path
     import plotly.graph_objects as go
     from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+    from concurrent.futures import TimeoutError as FutureTimeoutError
     from datetime import datetime
 
     # Import custom modules
@@ -49,7 +54,23 @@ def _():
     from frenz_collector import FrenzCollector
     from data_storage import DataStorage
     from event_logger import EventLogger
-    return DeviceStatus, FrenzCollector, datetime, deque, go, time
+    from ring_buffer import RingBuffer
+    from config import config
+    return (
+        DeviceStatus,
+        FrenzCollector,
+        FutureTimeoutError,
+        RingBuffer,
+        ThreadPoolExecutor,
+        config,
+        datetime,
+        deque,
+        go,
+        itertools,
+        np,
+        queue,
+        time,
+    )
 
 
 @app.cell
@@ -60,40 +81,259 @@ def _(FrenzCollector):
 
 
 @app.cell
-def _(deque, time):
-    # Initialize data buffers for visualization
-    MAX_BUFFER_SIZE = 500  # Keep last 500 data points for each plot
+def _(RingBuffer, config, deque, np, time):
+    # Initialize data buffers for visualization. Each buffer holds one display
+    # window of its stream, sized from the stream's nominal rate.
+    BUFFER_SECONDS = config.display.default_display_window
+    STREAM_RATES_HZ = {'scores': 1, 'imu': 50, 'ppg': 25, 'hr': 1, 'spo2': 1}
+    POWER_BANDS = ['alpha', 'beta', 'gamma', 'theta', 'delta']
+
+    # Numeric streams are NumPy ring buffers: one time column plus one value
+    # column per channel. Times are int64 nanoseconds since the recording
+    # started, taken from the monotonic clock.
+    def _ring(stream, channels=1, dtype=np.float64):
+        _capacity = BUFFER_SECONDS * STREAM_RATES_HZ[stream]
+        return RingBuffer(_capacity, channels=channels, dtype=dtype, time_dtype=np.int64)
 
     data_buffers = {
-        'focus': deque(maxlen=MAX_BUFFER_SIZE),
-        'poas': deque(maxlen=MAX_BUFFER_SIZE),
-        'posture': deque(maxlen=MAX_BUFFER_SIZE),
-        'power_bands': {
-            'alpha': deque(maxlen=MAX_BUFFER_SIZE),
-            'beta': deque(maxlen=MAX_BUFFER_SIZE),
-            'gamma': deque(maxlen=MAX_BUFFER_SIZE),
-            'theta': deque(maxlen=MAX_BUFFER_SIZE),
-            'delta': deque(maxlen=MAX_BUFFER_SIZE),
-        },
-        'signal_quality': deque(maxlen=MAX_BUFFER_SIZE),
-        'imu': {
-            'x': deque(maxlen=MAX_BUFFER_SIZE),
-            'y': deque(maxlen=MAX_BUFFER_SIZE),
-            'z': deque(maxlen=MAX_BUFFER_SIZE),
-        },
-        'ppg': {
-            'green': deque(maxlen=MAX_BUFFER_SIZE),
-            'red': deque(maxlen=MAX_BUFFER_SIZE),
-            'ir': deque(maxlen=MAX_BUFFER_SIZE),
-        },
-        'hr': deque(maxlen=MAX_BUFFER_SIZE),  # Heart rate
-        'spo2': deque(maxlen=MAX_BUFFER_SIZE),  # Blood oxygen saturation
-        'events': deque(maxlen=50)  # Keep last 50 events
+        'focus': _ring('scores'),
+        'poas': _ring('scores'),
+        'posture': deque(maxlen=BUFFER_SECONDS * STREAM_RATES_HZ['scores']),
+        'power_bands': _ring('scores', len(POWER_BANDS), np.float32),  # Columns follow POWER_BANDS
+        'signal_quality': [None],  # Only the latest per-channel quality is shown
+        'imu': _ring('imu', 3),  # x, y, z
+        'ppg': _ring('ppg', 3),  # green, red, IR
+        'hr': _ring('hr', dtype=np.int16),  # Heart rate
+        'spo2': _ring('spo2', dtype=np.int16),  # Blood oxygen saturation
+        'events_formatted': deque(maxlen=10)  # Recent events table rows, formatted when logged
     }
 
-    # Initialize time reference - will be reset when recording starts
-    buffer_start_time = {'time': time.time(), 'recording_started': False}
-    return buffer_start_time, data_buffers
+    # Initialize time reference (monotonic ns) - will be reset when recording starts
+    buffer_start_time = {'ns': time.monotonic_ns(), 'recording_started': False}
+
+    # Device timestamp of the newest raw row already buffered, per stream
+    raw_last_seen = {'imu': -np.inf, 'ppg': -np.inf}
+
+    # A plot shows at most max_display_points across the display window, so
+    # only the first raw row in each slot of that width is buffered. This is
+    # display-only; the collector still records every row.
+    RAW_MIN_SPACING_S = BUFFER_SECONDS / config.display.max_display_points
+
+    def buffer_new_rows(name, rows):
+        """Append the raw rows (device timestamp first, then channels) that are not buffered yet."""
+        _start = np.searchsorted(rows[:, 0], raw_last_seen[name], side='right')
+        _new = rows[max(_start, len(rows) - data_buffers[name].capacity):]
+        if len(_new) == 0:
+            return
+        _last_seen = _new[-1, 0]
+        _slots = np.floor(_new[:, 0] / RAW_MIN_SPACING_S)
+        _new = _new[np.diff(_slots, prepend=np.floor(raw_last_seen[name] / RAW_MIN_SPACING_S)) > 0]
+        # The newest row is stamped now; earlier rows keep their device spacing
+        _now = time.monotonic_ns() - buffer_start_time['ns']
+        _times = _now - ((_new[-1, 0] - _new[:, 0]) * 1e9).astype(np.int64)
+        data_buffers[name].extend(_times, _new[:, 1:])
+        raw_last_seen[name] = _last_seen
+    return POWER_BANDS, buffer_new_rows, buffer_start_time, data_buffers
+
+
+@app.cell
+def _(np):
+    def lttb(x, y, n_out):
+        """Downsample a line to n_out points with Largest-Triangle-Three-Buckets."""
+        n = len(x)
+        if n <= n_out or n_out < 3:
+            return x, y
+
+        # Interior points are split into n_out - 2 buckets; first and last are always kept
+        edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+        keep = np.empty(n_out, dtype=np.intp)
+        keep[0], keep[-1] = 0, n - 1
+
+        a = 0
+        for i in range(n_out - 2):
+            start, end = edges[i], edges[i + 1]
+            next_end = edges[i + 2] if i + 2 < len(edges) else n
+            avg_x = x[end:next_end].mean()
+            avg_y = y[end:next_end].mean()
+            # Pick the point forming the largest triangle with the last pick and the next bucket's mean
+            area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+            a = start + int(np.argmax(area))
+            keep[i + 1] = a
+
+        return x[keep], y[keep]
+    return (lttb,)
+
+
+@app.cell
+def _():
+    # Invariant Plotly styling, built once and passed by reference on every redraw
+    WAITING_NOTE = dict(xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False, font=dict(size=14))
+    HR_LINE = dict(color='red', width=3)
+    HR_MARKER = dict(size=4)
+    HR_LAYOUT = dict(
+        xaxis_title='Time (s)',
+        yaxis_title='BPM',
+        height=300,
+        showlegend=False,
+        yaxis=dict(range=[40, 180])  # Typical HR range
+    )
+    SPO2_LINE = dict(color='blue', width=3)
+    SPO2_LAYOUT = dict(
+        xaxis_title='Time (s)',
+        yaxis_title='SpO2 (%)',
+        height=300,
+        showlegend=False,
+        yaxis=dict(range=[85, 100])  # Typical SpO2 range
+    )
+    return HR_LAYOUT, HR_LINE, HR_MARKER, SPO2_LAYOUT, SPO2_LINE, WAITING_NOTE
+
+
+@app.cell
+def _(
+    HR_LAYOUT,
+    HR_LINE,
+    HR_MARKER,
+    POWER_BANDS,
+    SPO2_LAYOUT,
+    SPO2_LINE,
+    WAITING_NOTE,
+    config,
+    go,
+    lttb,
+    np,
+):
+    # Build the streaming figures once; the plot cells only swap in new trace data.
+    # Line traces use WebGL (Scattergl) so redraws are a buffer upload, not SVG diffing
+    def _line_figure(title, waiting_text, xaxis_title, yaxis_title, traces, **layout):
+        fig = go.Figure()
+        for _name, _color, _mode in traces:
+            fig.add_trace(go.Scattergl(x=[], y=[], mode=_mode, name=_name, line=dict(color=_color, width=2)))
+        fig.add_annotation(text=waiting_text, **WAITING_NOTE)
+        fig.update_layout(title=title, xaxis_title=xaxis_title, yaxis_title=yaxis_title, height=500, **layout)
+        return fig
+
+    figures = {
+        'focus': _line_figure(
+            'Focus Score', "Waiting for focus data...", 'Time (seconds)', 'Score (0-100)',
+            [('Focus Score', 'blue', 'lines')],
+            yaxis=dict(range=[0, 100])  # Focus scores are 0-100, not 0-1
+        ),
+        'poas': _line_figure(
+            'POAS Score', "Waiting for POAS data...", 'Time (seconds)', 'Score',
+            [('POAS Score', 'green', 'lines+markers')]
+        ),
+        'power': _line_figure(
+            'EEG Power Bands', "Waiting for power band data...", 'Time (seconds)', 'Power (dB)',
+            [(_band.capitalize(), _color, 'lines')
+             for _band, _color in zip(POWER_BANDS, ['red', 'blue', 'green', 'purple', 'orange'])],
+            showlegend=True
+        ),
+        'imu': _line_figure(
+            'IMU (Accelerometer)', "Waiting for IMU data...", 'Time (s)', 'Acceleration (g)',
+            [('X-axis', 'red', 'lines'), ('Y-axis', 'green', 'lines'), ('Z-axis', 'blue', 'lines')],
+            showlegend=True
+        ),
+        'ppg': _line_figure(
+            'PPG (Photoplethysmography)', "Waiting for PPG data...", 'Time (s)', 'Intensity',
+            [('GREEN', 'green', 'lines'), ('RED', 'red', 'lines'), ('IR', 'darkred', 'lines')],
+            showlegend=True
+        ),
+        'hr': _line_figure(
+            'Heart Rate', "Waiting for HR data...", 'Time (s)', 'BPM',
+            [('Heart Rate', 'red', 'lines+markers')]
+        ).update_traces(line=HR_LINE, marker=HR_MARKER).update_layout(**HR_LAYOUT),
+        'spo2': _line_figure(
+            'SpO2 (Blood Oxygen Saturation)', "Waiting for SpO2 data...", 'Time (s)', 'SpO2 (%)',
+            [('SpO2', 'blue', 'lines+markers')]
+        ).update_traces(line=SPO2_LINE, marker=HR_MARKER).update_layout(**SPO2_LAYOUT),
+    }
+
+    # Signal quality is a bar per EEG channel; bars are recolored only when a
+    # channel crosses a quality threshold
+    _signal_fig = go.Figure(go.Bar(x=['Left Frontal', 'Left Ear', 'Right Frontal', 'Right Ear'], y=[]))
+    _signal_fig.add_annotation(text="Waiting for signal quality data...", **WAITING_NOTE)
+    _signal_fig.update_layout(
+        title='Signal Quality',
+        xaxis_title='Channel',
+        yaxis_title='Quality (0-1)',
+        yaxis=dict(range=[0, 1.2]),
+        height=500
+    )
+    figures['signal'] = _signal_fig
+
+    # Longer series are downsampled before they are shipped to the browser
+    _max_points = config.display.max_display_points
+
+    def update_figure(fig, times, values, title, waiting_title):
+        """
+        Replace the trace data of a figure in place, showing the waiting note when empty.
+
+        Times are in nanoseconds and plotted in seconds. Values are a single
+        column, or one column per trace sharing the same time base.
+
+        The y-axis range is fixed rather than autoscaled; it is only widened
+        (with 10% padding) when the data leaves the current range.
+        """
+        _has_data = len(times) > 0
+        _seconds = times * 1e-9
+        with fig.batch_update():
+            for _i, _trace in enumerate(fig.data):
+                _trace.x, _trace.y = lttb(_seconds, values if values.ndim == 1 else values[:, _i], _max_points)
+            if _has_data and not np.isnan(values).all():
+                _lo, _hi = np.nanmin(values), np.nanmax(values)
+                _range = fig.layout.yaxis.range
+                if _range is None or _lo < _range[0] or _hi > _range[1]:
+                    _pad = 0.1 * (_hi - _lo) or 1.0
+                    fig.layout.yaxis.update(range=[_lo - _pad, _hi + _pad], autorange=False)
+            fig.layout.annotations[0].visible = not _has_data
+            fig.layout.title.text = title if _has_data else waiting_title
+        return fig
+    return figures, update_figure
+
+
+@app.cell
+def _(FutureTimeoutError, ThreadPoolExecutor, figures, mo, np):
+    # Figure updates (slicing, downsampling, trace replacement) run on a worker
+    # thread and overlap with the next tick's data pull. The mo.ui.plotly
+    # element is built on the main thread once the update is done, since
+    # marimo's runtime context is thread-local. A plot whose update isn't
+    # finished yet keeps showing its previous frame.
+    _render_pool = ThreadPoolExecutor(max_workers=1)
+    _pending = {}  # Newest queued update per plot
+
+    # Until a plot is first drawn it shows its waiting note as plain markdown,
+    # so startup doesn't encode any figures. Plot cells skip all work while
+    # not recording and keep showing the last frame.
+    _rendered = {_name: mo.md(f"_{_fig.layout.annotations[0].text}_") for _name, _fig in figures.items()}
+
+    def submit_render(name, update, *args):
+        """
+        Queue update(*args), which changes figures[name], on the worker.
+
+        The single worker runs updates in order, and the plot is only built
+        once the newest one is done, so no update is running while it is.
+        Arguments must not change after submission (pass copies of buffers).
+        """
+        _pending[name] = _render_pool.submit(update, *args)
+
+    def buffer_snapshot(buffer):
+        """Copy a ring buffer's (timestamps, values) in order, for use by a queued update."""
+        return tuple(np.array(_column) for _column in buffer.ordered())
+
+    def rendered_plot(name):
+        """Get the newest finished plot, waiting briefly for a pending update."""
+        _future = _pending.get(name)
+        if _future is not None:
+            try:
+                _future.result(timeout=0.05)
+            except FutureTimeoutError:
+                return _rendered[name]
+            finally:
+                if _future.done():
+                    del _pending[name]
+            _rendered[name] = mo.ui.plotly(figures[name])
+        return _rendered[name]
+    return buffer_snapshot, rendered_plot, submit_render
 
 
 @app.cell
@@ -292,18 +532,119 @@ def _(collector, start_button, stop_button):
     return
 
 
+@app.cell
+def _(itertools, mo):
+    # One shared refresh tick drives every live cell. Plots that don't need
+    # 1 s updates redraw every PLOT_EVERY[name] ticks instead of running their
+    # own timers, offset by PLOT_PHASE[name] so they don't all land on the
+    # same tick.
+    master_tick = mo.ui.refresh(default_interval="1s")
+    frame_counter = itertools.count()
+    PLOT_EVERY = {'focus': 2, 'poas': 30, 'power': 2, 'signal': 5, 'imu': 1, 'ppg': 1, 'hr': 2, 'spo2': 2}
+    PLOT_PHASE = {'focus': 0, 'poas': 3, 'power': 1, 'signal': 2, 'imu': 0, 'ppg': 0, 'hr': 0, 'spo2': 1}
+
+    # Only the plot on the visible tab redraws. A hidden plot that misses a
+    # redraw is caught up on the first tick after its tab is selected.
+    PLOT_TABS = {
+        'focus': "Focus", 'poas': "POAS", 'power': "Power Bands", 'signal': "Signal Quality",
+        'imu': "IMU", 'ppg': "PPG", 'hr': "Heart Rate", 'spo2': "SpO2"
+    }
+    active_tab = {'label': PLOT_TABS['focus']}  # Updated by the tabs' on_change
+    _stale = set()
+    _drawn_versions = {}  # Buffer version each plot was last drawn from
+
+    def plot_due(name, frame):
+        """Check whether a plot redraws on this frame."""
+        _due = (frame + PLOT_PHASE[name]) % PLOT_EVERY[name] == 0
+        if PLOT_TABS[name] != active_tab['label']:
+            if _due:
+                _stale.add(name)
+            return False
+        if name in _stale:
+            _stale.discard(name)
+            return True
+        return _due
+
+    def buffer_changed(name, buffer):
+        """Check whether a plot's ring buffer changed since it was last drawn, and mark it drawn."""
+        if _drawn_versions.get(name) == buffer.version:
+            return False
+        _drawn_versions[name] = buffer.version
+        return True
+    return active_tab, buffer_changed, frame_counter, master_tick, plot_due
+
+
+@app.cell
+def _(buffer_start_time, collector, data_buffers, drain_scores, frame_counter, master_tick, time):
+    # Advance the shared frame counter once per tick
+    master_tick
+    frame = next(frame_counter)
+
+    # Reset the time base and clear the plot buffers when recording starts
+    _is_rec_tick = collector.is_recording
+    if _is_rec_tick and not buffer_start_time['recording_started']:
+        buffer_start_time['ns'] = time.monotonic_ns()
+        buffer_start_time['recording_started'] = True
+        for _name in ['focus', 'poas', 'power_bands', 'imu', 'ppg', 'hr', 'spo2']:
+            data_buffers[_name].clear()
+        data_buffers['signal_quality'][0] = None
+    elif not _is_rec_tick and buffer_start_time['recording_started']:
+        buffer_start_time['recording_started'] = False
+    drain_scores()
+    return (frame,)
+
+
+@app.cell
+def _(collector, frame):
+    # Fetch the streamer once per tick and share shallow copies of its scores
+    # and raw data with the cells below
+    frame
+    streamer = None
+    if collector.is_recording and collector.device_manager.is_connected():
+        streamer = collector.device_manager.get_streamer()
+    scores = dict(getattr(streamer, 'SCORES', None) or {})
+    raw_data = dict((getattr(streamer, 'DATA', None) or {}).get("RAW", {}))
+    return raw_data, scores, streamer
+
+
 @app.cell
 def _(mo):
-    # Create refresh control for recording status
-    refresh_recording_status = mo.ui.refresh(default_interval="1s")
-    return (refresh_recording_status,)
+    # Markup for the status readouts is built once; each tick only fills in values
+    RECORDING_TMPL = (
+        "<div><b>Recording Status:</b> 🔴 Recording<br>"
+        "<b>Duration:</b> {duration}<br>"
+        "<b>Samples (collected):</b> {collected:,}<br>"
+        "<b>Samples (stored):</b> {stored:,}<br>"
+        "<b>Est. Data Size:</b> {size_mb:.2f} MB</div>"
+    )
+    NOT_RECORDING_HTML = mo.Html("<div><b>Recording Status:</b> ⚪ Not Recording</div>")
+
+    STATUS_TMPL = """
+    <div style="border: 1px solid #ddd; border-radius: 4px; padding: 12px; margin: 10px 0; background: #fafafa;">
+        <div style="display: flex; justify-content: space-around; align-items: center;">
+            <div style="text-align: center;">
+                <div style="font-weight: 600; font-size: 11px; color: #7f8c8d; text-transform: uppercase; letter-spacing: 0.5px;">Posture</div>
+                <div style="font-size: 18px; margin-top: 6px; color: #2c3e50;">{posture}</div>
+            </div>
+            <div style="text-align: center;">
+                <div style="font-weight: 600; font-size: 11px; color: #7f8c8d; text-transform: uppercase; letter-spacing: 0.5px;">Heart Rate</div>
+                <div style="font-size: 18px; margin-top: 6px; color: {hr_color}; font-weight: 500;">{hr}</div>
+            </div>
+            <div style="text-align: center;">
+                <div style="font-weight: 600; font-size: 11px; color: #7f8c8d; text-transform: uppercase; letter-spacing: 0.5px;">Blood Oxygen</div>
+                <div style="font-size: 18px; margin-top: 6px; color: {spo2_color}; font-weight: 500;">{spo2}</div>
+            </div>
+        </div>
+    </div>
+    """
+    return NOT_RECORDING_HTML, RECORDING_TMPL, STATUS_TMPL
 
 
 @app.cell
-def _(collector, mo, refresh_recording_status, start_button, stop_button, time):
-    # Display recording status - driven by refresh control
+def _(NOT_RECORDING_HTML, RECORDING_TMPL, collector, master_tick, mo, start_button, stop_button, time):
+    # Display recording status - driven by the shared refresh tick
     # The refresh control must be referenced for it to trigger
-    refresh_recording_status
+    master_tick
 
     _is_recording = collector.is_recording
     if _is_recording:
@@ -320,23 +661,18 @@ def _(collector, mo, refresh_recording_status, start_button, stop_button, time):
             storage_stats = _stats.get('storage_stats', {})
             total_samples = storage_stats.get('total_samples', 0)
 
-            # Estimate data size (rough estimate: ~4 bytes per sample per channel)
-            # Assuming multiple channels and data types
-            data_size_mb = (total_samples * 4 * 10) / (1024 * 1024)  # Rough estimate
+            # Size of the HDF5 file on disk
+            data_size_mb = _stats.get('bytes_written', 0) / (1 << 20)
         except Exception as e:
             samples_collected = 0
             total_samples = 0
             data_size_mb = 0
 
-        status_display = mo.md(f"""
-        **Recording Status:** 🔴 Recording
-        **Duration:** {duration_str}
-        **Samples (collected):** {samples_collected:,}
-        **Samples (stored):** {total_samples:,}
-        **Est. Data Size:** {data_size_mb:.2f} MB
-        """)
+        status_display = mo.Html(RECORDING_TMPL.format(
+            duration=duration_str, collected=samples_collected, stored=total_samples, size_mb=data_size_mb
+        ))
     else:
-        status_display = mo.md("**Recording Status:** ⚪ Not Recording")
+        status_display = NOT_RECORDING_HTML
         data_size_mb = 0
         duration_str = "00:00:00"
         samples_collected = 0
@@ -348,7 +684,7 @@ def _(collector, mo, refresh_recording_status, start_button, stop_button, time):
     mo.vstack([
         recording_controls,
         status_display,
-        mo.Html(f"<div style='display:none'>{refresh_recording_status}</div>")  # Hidden refresh timer
+        mo.Html(f"<div style='display:none'>{master_tick}</div>")  # Hidden refresh timer
     ])
     return
 
@@ -360,54 +696,32 @@ def _(mo):
 
 
 @app.cell
-def _(collector, mo, refresh_recording_status):
+def _(STATUS_TMPL, mo, scores):
     # Posture and real-time status display
-    refresh_recording_status
-
     posture_text = "Unknown"
     hr_text = "--"
     spo2_text = "--"
 
-    if collector.is_recording and collector.device_manager.is_connected():
-        _streamer_status = collector.device_manager.get_streamer()
-        if _streamer_status and hasattr(_streamer_status, 'SCORES'):
-            try:
-                _posture_val = _streamer_status.SCORES.get('posture')
-                if _posture_val:
-                    posture_text = _posture_val.capitalize()
+    _posture_val = scores.get('posture')
+    if _posture_val:
+        posture_text = _posture_val.capitalize()
 
-                _hr_val = _streamer_status.SCORES.get('hr')
-                if _hr_val is not None:
-                    hr_text = f"{int(_hr_val)} BPM"
+    _hr_val = scores.get('hr')
+    if _hr_val is not None:
+        hr_text = f"{int(_hr_val)} BPM"
 
-                _spo2_val = _streamer_status.SCORES.get('spo2')
-                if _spo2_val is not None:
-                    spo2_text = f"{int(_spo2_val)}%"
-            except Exception:
-                pass
+    _spo2_val = scores.get('spo2')
+    _spo2_int = int(_spo2_val) if _spo2_val is not None else None
+    if _spo2_int is not None:
+        spo2_text = f"{_spo2_int}%"
 
     # Color code based on values
     hr_color = "#2ecc71" if hr_text != "--" else "#95a5a6"
-    spo2_color = "#2ecc71" if "%" in spo2_text and int(spo2_text.replace("%","")) > 95 else "#e67e22" if "%" in spo2_text else "#95a5a6"
+    spo2_color = "#95a5a6" if _spo2_int is None else "#2ecc71" if _spo2_int > 95 else "#e67e22"
 
-    status_card = mo.Html(f"""
-    <div style="border: 1px solid #ddd; border-radius: 4px; padding: 12px; margin: 10px 0; background: #fafafa;">
-        <div style="display: flex; justify-content: space-around; align-items: center;">
-            <div style="text-align: center;">
-                <div style="font-weight: 600; font-size: 11px; color: #7f8c8d; text-transform: uppercase; letter-spacing: 0.5px;">Posture</div>
-                <div style="font-size: 18px; margin-top: 6px; color: #2c3e50;">{posture_text}</div>
-            </div>
-            <div style="text-align: center;">
-                <div style="font-weight: 600; font-size: 11px; color: #7f8c8d; text-transform: uppercase; letter-spacing: 0.5px;">Heart Rate</div>
-                <div style="font-size: 18px; margin-top: 6px; color: {hr_color}; font-weight: 500;">{hr_text}</div>
-            </div>
-            <div style="text-align: center;">
-                <div style="font-weight: 600; font-size: 11px; color: #7f8c8d; text-transform: uppercase; letter-spacing: 0.5px;">Blood Oxygen</div>
-                <div style="font-size: 18px; margin-top: 6px; color: {spo2_color}; font-weight: 500;">{spo2_text}</div>
-            </div>
-        </div>
-    </div>
-    """)
+    status_card = mo.Html(STATUS_TMPL.format(
+        posture=posture_text, hr=hr_text, hr_color=hr_color, spo2=spo2_text, spo2_color=spo2_color
+    ))
 
     status_card
     return
@@ -426,538 +740,216 @@ def _():
 
 
 @app.cell
-def _(mo):
-    # Create refresh controls
-    refresh_focus = mo.ui.refresh(default_interval="2s")
-    refresh_poas = mo.ui.refresh(default_interval="30s")
-    refresh_power = mo.ui.refresh(default_interval="2s")
-    refresh_signal = mo.ui.refresh(default_interval="5s")
-    refresh_imu = mo.ui.refresh(default_interval="1s")
-    refresh_ppg = mo.ui.refresh(default_interval="1s")
-    return refresh_focus, refresh_poas, refresh_power, refresh_signal, refresh_imu, refresh_ppg
+def _(POWER_BANDS, buffer_start_time, collector, data_buffers, np, queue, time):
+    # Queue new scores as the collector thread reads them, so the score plots
+    # never miss samples between redraws. The ring buffers aren't thread-safe,
+    # so they are only filled here on the main thread, by drain_scores() on
+    # each refresh tick.
+    _latest_power = np.full(len(POWER_BANDS), np.nan, dtype=np.float32)  # Last average power per band
+    _score_queue = queue.SimpleQueue()
+
+    def _queue_scores(timestamp, scores):
+        if buffer_start_time['recording_started']:
+            # Arrays are copied, the streamer may update them in place
+            _score_queue.put((time.monotonic_ns(), {
+                _key: np.array(_value) if isinstance(_value, np.ndarray) else _value
+                for _key, _value in scores.items()
+            }))
+
+    def drain_scores():
+        """Buffer the scores queued since the previous tick, dropping any from before recording started."""
+        while True:
+            try:
+                _received_ns, _scores = _score_queue.get_nowait()
+            except queue.Empty:
+                return
+            if _received_ns >= buffer_start_time['ns']:
+                _buffer_scores(_received_ns - buffer_start_time['ns'], _scores)
+
+    def _buffer_scores(_t, scores):
+        if 'focus_score' in scores:
+            data_buffers['focus'].append(_t, scores['focus_score'])
+        if 'poas' in scores:  # Key is "poas" not "poas_score"
+            data_buffers['poas'].append(_t, scores['poas'])
+        if scores.get('hr') is not None:
+            data_buffers['hr'].append(_t, int(scores['hr']))
+        if scores.get('spo2') is not None:
+            data_buffers['spo2'].append(_t, int(scores['spo2']))
+
+        # Power bands are individual keys, each an array [LF, OTEL, RF, OTER, AVG].
+        # The averages (last value) of all bands are written as one buffer row;
+        # a band without a new value keeps its previous one.
+        _updated = False
+        for _i, _band in enumerate(POWER_BANDS):
+            _row = scores.get(_band)
+            if _row is not None:
+                _latest_power[_i] = _row[-1]
+                _updated = True
+        if _updated:
+            data_buffers['power_bands'].append(_t, _latest_power)
+
+    collector.on_score(_queue_scores)
+    return (drain_scores,)
 
 
 @app.cell
-def _(buffer_start_time, collector, data_buffers, go, mo, refresh_focus, refresh_recording_status, time):
-    # Update and plot focus data
-    refresh_focus
-    # Force dependency on recording status to ensure cell re-runs when recording starts/stops
-    refresh_recording_status
-
-    _is_rec = collector.is_recording
-
-    # Reset buffer start time when recording starts
-    if _is_rec and not buffer_start_time['recording_started']:
-        buffer_start_time['time'] = time.time()
-        buffer_start_time['recording_started'] = True
-        # Clear all buffers
-        data_buffers['focus'].clear()
-    elif not _is_rec and buffer_start_time['recording_started']:
-        buffer_start_time['recording_started'] = False
-
-    if _is_rec:
-        _streamer = collector.device_manager.get_streamer()
-        if _streamer:
-            try:
-                # Check if SCORES attribute exists
-                if hasattr(_streamer, 'SCORES'):
-                    focus_score = _streamer.SCORES.get("focus_score")
-                    if focus_score is not None:
-                        _current_time_focus = time.time() - buffer_start_time['time']
-                        data_buffers['focus'].append((_current_time_focus, focus_score))
-            except Exception as e:
-                pass
-
-    # Create focus plot
-    if len(data_buffers['focus']) > 0:
-        _times_focus, _values_focus = zip(*data_buffers['focus'])
-        focus_fig = go.Figure()
-        focus_fig.add_trace(go.Scatter(
-            x=list(_times_focus),
-            y=list(_values_focus),
-            mode='lines',
-            name='Focus Score',
-            line=dict(color='blue', width=2)
-        ))
-        focus_fig.update_layout(
-            title=f'Focus Score (n={len(data_buffers["focus"])})',
-            xaxis_title='Time (seconds)',
-            yaxis_title='Score (0-100)',
-            yaxis=dict(range=[0, 100]),  # Focus scores are 0-100, not 0-1
-            height=500
+def _(buffer_changed, buffer_snapshot, collector, data_buffers, figures, frame, plot_due, rendered_plot, submit_render, update_figure):
+    # Plot focus data
+    if collector.is_recording and plot_due('focus', frame) and buffer_changed('focus', data_buffers['focus']):
+        # Update focus plot
+        submit_render(
+            'focus', update_figure, figures['focus'], *buffer_snapshot(data_buffers['focus']),
+            f'Focus Score (n={len(data_buffers["focus"])})', 'Focus Score'
         )
-    else:
-        focus_fig = go.Figure()
-        focus_fig.add_annotation(
-            text="Waiting for focus data...",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False,
-            font=dict(size=14)
-        )
-        focus_fig.update_layout(title='Focus Score', height=500)
-
-    focus_plot = mo.ui.plotly(focus_fig)
+    focus_plot = rendered_plot('focus')
     return (focus_plot,)
 
 
 @app.cell
-def _(buffer_start_time, collector, data_buffers, go, mo, refresh_poas, refresh_recording_status, time):
-    # Update and plot POAS data
-    refresh_poas
-    # Force dependency on recording status
-    refresh_recording_status
-
-    _is_rec_poas = collector.is_recording
-
-    # Reset buffer when recording starts
-    if _is_rec_poas and not buffer_start_time['recording_started']:
-        data_buffers['poas'].clear()
-
-    if _is_rec_poas:
-        _streamer_poas = collector.device_manager.get_streamer()
-        if _streamer_poas:
-            try:
-                if hasattr(_streamer_poas, 'SCORES'):
-                    poas_score = _streamer_poas.SCORES.get("poas")  # Key is "poas" not "poas_score"
-                    if poas_score is not None:
-                        _current_time_poas = time.time() - buffer_start_time['time']
-                        data_buffers['poas'].append((_current_time_poas, poas_score))
-            except Exception as e:
-                pass
-
-    # Create POAS plot
-    if data_buffers['poas']:
-        _times_poas, _values_poas = zip(*data_buffers['poas'])
-        poas_fig = go.Figure()
-        poas_fig.add_trace(go.Scatter(
-            x=list(_times_poas),
-            y=list(_values_poas),
-            mode='lines+markers',
-            name='POAS Score',
-            line=dict(color='green', width=2)
-        ))
-        poas_fig.update_layout(
-            title=f'POAS (Presence of Attention Score) (n={len(data_buffers["poas"])})',
-            xaxis_title='Time (seconds)',
-            yaxis_title='Score',
-            height=500
+def _(buffer_changed, buffer_snapshot, collector, data_buffers, figures, frame, plot_due, rendered_plot, submit_render, update_figure):
+    # Plot POAS data
+    if collector.is_recording and plot_due('poas', frame) and buffer_changed('poas', data_buffers['poas']):
+        # Update POAS plot
+        submit_render(
+            'poas', update_figure, figures['poas'], *buffer_snapshot(data_buffers['poas']),
+            f'POAS (Presence of Attention Score) (n={len(data_buffers["poas"])})', 'POAS Score'
         )
-    else:
-        poas_fig = go.Figure()
-        poas_fig.add_annotation(
-            text="Waiting for POAS data...",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False,
-            font=dict(size=14)
-        )
-        poas_fig.update_layout(title='POAS Score', height=500)
-
-    poas_plot = mo.ui.plotly(poas_fig)
+    poas_plot = rendered_plot('poas')
     return (poas_plot,)
 
 
 @app.cell
-def _(buffer_start_time, collector, data_buffers, go, mo, refresh_power, refresh_recording_status, time):
-    # Update and plot power bands
-    refresh_power
-    # Force dependency on recording status
-    refresh_recording_status
-
-    _is_rec_power = collector.is_recording
-
-    # Reset buffers when recording starts
-    if _is_rec_power and not buffer_start_time['recording_started']:
-        for band in ['alpha', 'beta', 'gamma', 'theta', 'delta']:
-            data_buffers['power_bands'][band].clear()
-
-    if _is_rec_power:
-        _streamer_power = collector.device_manager.get_streamer()
-        if _streamer_power:
-            try:
-                if hasattr(_streamer_power, 'SCORES'):
-                    # Power bands are individual keys, not a dict
-                    _current_time_power = time.time() - buffer_start_time['time']
-                    _bands_found = 0
-                    for band in ['alpha', 'beta', 'gamma', 'theta', 'delta']:
-                        band_data = _streamer_power.SCORES.get(band)
-                        if band_data is not None:
-                            # band_data is array [LF, OTEL, RF, OTER, AVG], use AVG (last value)
-                            if hasattr(band_data, '__len__') and len(band_data) >= 5:
-                                avg_power = band_data[-1]  # Use average value
-                                data_buffers['power_bands'][band].append((_current_time_power, avg_power))
-                                _bands_found += 1
-                    if _bands_found > 0:
-                        pass
-            except Exception as e:
-                pass
-
-    # Create power bands plot
-    power_fig = go.Figure()
-    _colors_power = {'alpha': 'red', 'beta': 'blue', 'gamma': 'green', 'theta': 'purple', 'delta': 'orange'}
-
-    has_data = False
-    for _band_power, _color_power in _colors_power.items():
-        if data_buffers['power_bands'][_band_power]:
-            has_data = True
-            _times_band, _values_band = zip(*data_buffers['power_bands'][_band_power])
-            power_fig.add_trace(go.Scatter(
-                x=list(_times_band),
-                y=list(_values_band),
-                mode='lines',
-                name=_band_power.capitalize(),
-                line=dict(color=_color_power, width=2)
-            ))
-
-    if has_data:
+def _(POWER_BANDS, buffer_changed, buffer_snapshot, collector, data_buffers, figures, frame, plot_due, rendered_plot, submit_render, update_figure):
+    # Plot power bands
+    if collector.is_recording and plot_due('power', frame) and buffer_changed('power', data_buffers['power_bands']):
+        # Update power bands plot (trace order matches the buffer columns)
         # Count total points across all bands
-        _total_points = sum(len(data_buffers['power_bands'][b]) for b in _colors_power.keys())
-        power_fig.update_layout(
-            title=f'EEG Power Bands (n={_total_points} total)',
-            xaxis_title='Time (seconds)',
-            yaxis_title='Power (dB)',
-            height=500,
-            showlegend=True
-        )
-    else:
-        power_fig.add_annotation(
-            text="Waiting for power band data...",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False,
-            font=dict(size=14)
+        _total_points = len(data_buffers['power_bands']) * len(POWER_BANDS)
+        submit_render(
+            'power', update_figure, figures['power'], *buffer_snapshot(data_buffers['power_bands']),
+            f'EEG Power Bands (n={_total_points} total)', 'EEG Power Bands'
         )
-        power_fig.update_layout(title='EEG Power Bands', height=500)
-
-    power_plot = mo.ui.plotly(power_fig)
+    power_plot = rendered_plot('power')
     return (power_plot,)
 
 
 @app.cell
-def _(buffer_start_time, collector, data_buffers, go, mo, refresh_signal, refresh_recording_status):
+def _(collector, data_buffers, figures, frame, np, plot_due, rendered_plot, scores, submit_render):
     # Update and plot signal quality
-    refresh_signal
-    # Force dependency on recording status
-    refresh_recording_status
-
-    _is_rec_signal = collector.is_recording
-
-    # Reset buffer when recording starts
-    if _is_rec_signal and not buffer_start_time['recording_started']:
-        data_buffers['signal_quality'].clear()
-
-    if _is_rec_signal:
-        _streamer_signal = collector.device_manager.get_streamer()
-        if _streamer_signal:
-            try:
-                if hasattr(_streamer_signal, 'SCORES'):
-                    signal_data = _streamer_signal.SCORES.get("sqc_scores")  # Key is "sqc_scores" not "signal_quality"
-                    if signal_data is not None:
-                        data_buffers['signal_quality'].clear()
-                        data_buffers['signal_quality'].append(signal_data)
-            except Exception as e:
-                pass
-
-    # Create signal quality plot
-    if data_buffers['signal_quality']:
-        latest_quality = list(data_buffers['signal_quality'])[-1]
-
-        # Signal quality is a 4-element array (one per EEG channel)
-        if hasattr(latest_quality, '__len__') and len(latest_quality) == 4:
-            _channels = ['Left Frontal', 'Left Ear', 'Right Frontal', 'Right Ear']
-            _values_signal = list(latest_quality)
-
-            signal_fig = go.Figure()
-            signal_fig.add_trace(go.Bar(
-                x=_channels,
-                y=_values_signal,
-                marker_color=['green' if v > 0.7 else 'orange' if v > 0.4 else 'red' for v in _values_signal]
-            ))
-            signal_fig.update_layout(
-                title='Signal Quality by Channel (Current)',
-                xaxis_title='Channel',
-                yaxis_title='Quality (0-1)',
-                yaxis=dict(range=[0, 1.2]),
-                height=500
-            )
-        else:
-            signal_fig = go.Figure()
-            signal_fig.add_annotation(
-                text=f"Invalid signal quality data format: {type(latest_quality)}, len={len(latest_quality) if hasattr(latest_quality, '__len__') else 'N/A'}",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False,
-                font=dict(size=14)
-            )
-    else:
-        signal_fig = go.Figure()
-        signal_fig.add_annotation(
-            text="Waiting for signal quality data...",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False,
-            font=dict(size=14)
-        )
-        signal_fig.update_layout(title='Signal Quality', height=500)
-
-    signal_plot = mo.ui.plotly(signal_fig)
+    if collector.is_recording and plot_due('signal', frame):
+        signal_data = scores.get("sqc_scores")  # Key is "sqc_scores" not "signal_quality"
+        if signal_data is not None:
+            data_buffers['signal_quality'][0] = signal_data
+
+        # Update signal quality plot
+        latest_quality = data_buffers['signal_quality'][0]
+
+        def _update_signal(_signal_fig, _quality):
+            _bar_signal = _signal_fig.data[0]
+            _note_signal = _signal_fig.layout.annotations[0]
+            with _signal_fig.batch_update():
+                if _quality is not None:
+
+                    # Signal quality is a 4-element array (one per EEG channel)
+                    if hasattr(_quality, '__len__') and len(_quality) == 4:
+                        _values_signal = np.asarray(_quality, dtype=float)
+                        _colors_signal = tuple(np.select(
+                            [_values_signal > 0.7, _values_signal > 0.4], ['green', 'orange'], default='red'
+                        ).tolist())
+                        _bar_signal.y = _values_signal
+                        if _colors_signal != _bar_signal.marker.color:
+                            _bar_signal.marker.color = _colors_signal
+                        _note_signal.visible = False
+                        _signal_fig.layout.title.text = 'Signal Quality by Channel (Current)'
+                    else:
+                        _bar_signal.y = []
+                        _note_signal.text = f"Invalid signal quality data format: {type(_quality)}, len={len(_quality) if hasattr(_quality, '__len__') else 'N/A'}"
+                        _note_signal.visible = True
+                else:
+                    _bar_signal.y = []
+                    _note_signal.text = "Waiting for signal quality data..."
+                    _note_signal.visible = True
+                    _signal_fig.layout.title.text = 'Signal Quality'
+
+        submit_render('signal', _update_signal, figures['signal'], latest_quality)
+    signal_plot = rendered_plot('signal')
     return (signal_plot,)
 
 
 @app.cell
-def _(buffer_start_time, collector, data_buffers, go, mo, refresh_imu, refresh_recording_status, time):
+def _(buffer_changed, buffer_new_rows, buffer_snapshot, collector, data_buffers, figures, frame, plot_due, raw_data, rendered_plot, submit_render, update_figure):
     # Update and plot IMU data
-    refresh_imu
-    # Force dependency on recording status
-    refresh_recording_status
-
-    _is_rec_imu = collector.is_recording
-
-    # Reset buffer when recording starts
-    if _is_rec_imu and not buffer_start_time['recording_started']:
-        data_buffers['imu']['x'].clear()
-        data_buffers['imu']['y'].clear()
-        data_buffers['imu']['z'].clear()
-
-    if _is_rec_imu:
-        _streamer_imu = collector.device_manager.get_streamer()
-        if _streamer_imu:
-            try:
-                imu_data = _streamer_imu.DATA.get("RAW", {}).get("IMU")
-                if imu_data is not None and hasattr(imu_data, 'shape') and imu_data.shape[0] > 0:
-                    # IMU data shape is [N, 4]: timestamp, x, y, z
-                    latest_imu = imu_data[-1, 1:]  # Skip timestamp, get x, y, z
-                    _current_time_imu = time.time() - buffer_start_time['time']
-                    data_buffers['imu']['x'].append((_current_time_imu, latest_imu[0]))
-                    data_buffers['imu']['y'].append((_current_time_imu, latest_imu[1]))
-                    data_buffers['imu']['z'].append((_current_time_imu, latest_imu[2]))
-            except Exception as e:
-                pass
-
-    # Create IMU plot
-    if any(len(data_buffers['imu'][axis]) > 0 for axis in ['x', 'y', 'z']):
-        imu_fig = go.Figure()
-
-        for _axis_imu, _color_imu in [('x', 'red'), ('y', 'green'), ('z', 'blue')]:
-            if data_buffers['imu'][_axis_imu]:
-                _times_imu, _values_imu = zip(*data_buffers['imu'][_axis_imu])
-                imu_fig.add_trace(go.Scatter(
-                    x=_times_imu, y=_values_imu,
-                    mode='lines',
-                    name=f'{_axis_imu.upper()}-axis',
-                    line=dict(color=_color_imu, width=2)
-                ))
-
-        imu_fig.update_layout(
-            title=f'IMU (Accelerometer) (n={len(data_buffers["imu"]["x"])})',
-            xaxis_title='Time (s)',
-            yaxis_title='Acceleration (g)',
-            height=500,
-            showlegend=True
+    # Buffer every tick, even while the plot is hidden
+    imu_data = raw_data.get("IMU")
+    if imu_data is not None and hasattr(imu_data, 'shape') and imu_data.shape[0] > 0:
+        # IMU data shape is [N, 4]: timestamp, x, y, z; buffer every row since the last tick
+        buffer_new_rows('imu', imu_data)
+
+    if collector.is_recording and plot_due('imu', frame) and buffer_changed('imu', data_buffers['imu']):
+        # Update IMU plot
+        submit_render(
+            'imu', update_figure, figures['imu'], *buffer_snapshot(data_buffers['imu']),
+            f'IMU (Accelerometer) (n={len(data_buffers["imu"])})', 'IMU (Accelerometer)'
         )
-    else:
-        imu_fig = go.Figure()
-        imu_fig.add_annotation(
-            text="Waiting for IMU data...",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False,
-            font=dict(size=14)
-        )
-        imu_fig.update_layout(title='IMU (Accelerometer)', height=500)
-
-    imu_plot = mo.ui.plotly(imu_fig)
+    imu_plot = rendered_plot('imu')
     return (imu_plot,)
 
 
 @app.cell
-def _(buffer_start_time, collector, data_buffers, go, mo, refresh_ppg, refresh_recording_status, time):
+def _(buffer_changed, buffer_new_rows, buffer_snapshot, collector, data_buffers, figures, frame, plot_due, raw_data, rendered_plot, submit_render, update_figure):
     # Update and plot PPG data
-    refresh_ppg
-    # Force dependency on recording status
-    refresh_recording_status
-
-    _is_rec_ppg = collector.is_recording
-
-    # Reset buffer when recording starts
-    if _is_rec_ppg and not buffer_start_time['recording_started']:
-        data_buffers['ppg']['green'].clear()
-        data_buffers['ppg']['red'].clear()
-        data_buffers['ppg']['ir'].clear()
-
-    if _is_rec_ppg:
-        _streamer_ppg = collector.device_manager.get_streamer()
-        if _streamer_ppg:
-            try:
-                ppg_data = _streamer_ppg.DATA.get("RAW", {}).get("PPG")
-                if ppg_data is not None and hasattr(ppg_data, 'shape') and ppg_data.shape[0] > 0:
-                    # PPG data shape is [N, 4]: timestamp, green, red, IR
-                    latest_ppg = ppg_data[-1, 1:]  # Skip timestamp, get G, R, IR
-                    _current_time_ppg = time.time() - buffer_start_time['time']
-                    data_buffers['ppg']['green'].append((_current_time_ppg, latest_ppg[0]))
-                    data_buffers['ppg']['red'].append((_current_time_ppg, latest_ppg[1]))
-                    data_buffers['ppg']['ir'].append((_current_time_ppg, latest_ppg[2]))
-            except Exception as e:
-                pass
-
-    # Create PPG plot
-    if any(len(data_buffers['ppg'][ch]) > 0 for ch in ['green', 'red', 'ir']):
-        ppg_fig = go.Figure()
-
-        for _channel_ppg, _color_ppg in [('green', 'green'), ('red', 'red'), ('ir', 'darkred')]:
-            if data_buffers['ppg'][_channel_ppg]:
-                _times_ppg, _values_ppg = zip(*data_buffers['ppg'][_channel_ppg])
-                ppg_fig.add_trace(go.Scatter(
-                    x=_times_ppg, y=_values_ppg,
-                    mode='lines',
-                    name=f'{_channel_ppg.upper()}',
-                    line=dict(color=_color_ppg, width=2)
-                ))
-
-        ppg_fig.update_layout(
-            title=f'PPG (Photoplethysmography) (n={len(data_buffers["ppg"]["green"])})',
-            xaxis_title='Time (s)',
-            yaxis_title='Intensity',
-            height=500,
-            showlegend=True
-        )
-    else:
-        ppg_fig = go.Figure()
-        ppg_fig.add_annotation(
-            text="Waiting for PPG data...",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False,
-            font=dict(size=14)
+    # Buffer every tick, even while the plot is hidden
+    ppg_data = raw_data.get("PPG")
+    if ppg_data is not None and hasattr(ppg_data, 'shape') and ppg_data.shape[0] > 0:
+        # PPG data shape is [N, 4]: timestamp, green, red, IR; buffer every row since the last tick
+        buffer_new_rows('ppg', ppg_data)
+
+    if collector.is_recording and plot_due('ppg', frame) and buffer_changed('ppg', data_buffers['ppg']):
+        # Update PPG plot
+        submit_render(
+            'ppg', update_figure, figures['ppg'], *buffer_snapshot(data_buffers['ppg']),
+            f'PPG (Photoplethysmography) (n={len(data_buffers["ppg"])})', 'PPG (Photoplethysmography)'
         )
-        ppg_fig.update_layout(title='PPG (Photoplethysmography)', height=500)
-
-    ppg_plot = mo.ui.plotly(ppg_fig)
+    ppg_plot = rendered_plot('ppg')
     return (ppg_plot,)
 
 
 @app.cell
-def _(mo):
-    # Heart Rate refresh control
-    refresh_hr = mo.ui.refresh(options=["1s", "2s", "5s"], default_interval="2s")
-    return (refresh_hr,)
-
-
-@app.cell
-def _(buffer_start_time, collector, data_buffers, go, mo, refresh_hr, refresh_recording_status, time):
+def _(buffer_changed, buffer_snapshot, collector, data_buffers, figures, frame, mo, plot_due, rendered_plot, submit_render, update_figure):
     # Heart Rate visualization
-    refresh_hr
-    refresh_recording_status
-
-    hr_fig = go.Figure()
-
-    if collector.is_recording and collector.device_manager.is_connected():
-        _streamer_hr = collector.device_manager.get_streamer()
-        if _streamer_hr and hasattr(_streamer_hr, 'SCORES'):
-            try:
-                hr_value = _streamer_hr.SCORES.get('hr')
-                if hr_value is not None:
-                    _current_time_hr = time.time() - buffer_start_time['time']
-                    data_buffers['hr'].append((_current_time_hr, int(hr_value)))
-            except Exception as e:
-                pass
-
-    # Create HR plot
-    if len(data_buffers['hr']) > 0:
-        hr_fig = go.Figure()
-
-        _times_hr, _values_hr = zip(*data_buffers['hr'])
-        hr_fig.add_trace(go.Scatter(
-            x=_times_hr, y=_values_hr,
-            mode='lines+markers',
-            name='Heart Rate',
-            line=dict(color='red', width=3),
-            marker=dict(size=4)
-        ))
-
-        hr_fig.update_layout(
-            title=f'Heart Rate (n={len(data_buffers["hr"])})',
-            xaxis_title='Time (s)',
-            yaxis_title='BPM',
-            height=300,
-            showlegend=False,
-            yaxis=dict(range=[40, 180])  # Typical HR range
-        )
-    else:
-        hr_fig = go.Figure()
-        hr_fig.add_annotation(
-            text="Waiting for HR data...",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False,
-            font=dict(size=14)
-        )
-        hr_fig.update_layout(title='Heart Rate', height=300)
-
-    hr_plot = mo.ui.plotly(hr_fig)
+    if collector.is_recording and plot_due('hr', frame) and buffer_changed('hr', data_buffers['hr']):
+        # Update HR plot
+        submit_render(
+            'hr', update_figure, figures['hr'], *buffer_snapshot(data_buffers['hr']), 'Heart Rate', 'Heart Rate')
+    # The sample count sits outside the figure so it doesn't change the layout
+    hr_plot = mo.vstack([mo.md(f"**HR samples:** {len(data_buffers['hr'])}"), rendered_plot('hr')])
     return (hr_plot,)
 
 
 @app.cell
-def _(mo):
-    # SpO2 refresh control
-    refresh_spo2 = mo.ui.refresh(options=["1s", "2s", "5s"], default_interval="2s")
-    return (refresh_spo2,)
-
-
-@app.cell
-def _(buffer_start_time, collector, data_buffers, go, mo, refresh_recording_status, refresh_spo2, time):
+def _(buffer_changed, buffer_snapshot, collector, data_buffers, figures, frame, mo, np, plot_due, rendered_plot, submit_render, update_figure):
     # SpO2 visualization
-    refresh_spo2
-    refresh_recording_status
-
-    spo2_fig = go.Figure()
-
-    if collector.is_recording and collector.device_manager.is_connected():
-        _streamer_spo2 = collector.device_manager.get_streamer()
-        if _streamer_spo2 and hasattr(_streamer_spo2, 'SCORES'):
-            try:
-                spo2_value = _streamer_spo2.SCORES.get('spo2')
-                if spo2_value is not None:
-                    _current_time_spo2 = time.time() - buffer_start_time['time']
-                    data_buffers['spo2'].append((_current_time_spo2, int(spo2_value)))
-            except Exception as e:
-                pass
-
-    # Create SpO2 plot
-    if len(data_buffers['spo2']) > 0:
-        spo2_fig = go.Figure()
-
-        _times_spo2, _values_spo2 = zip(*data_buffers['spo2'])
+    if collector.is_recording and plot_due('spo2', frame) and buffer_changed('spo2', data_buffers['spo2']):
+        # Update SpO2 plot
+        def _update_spo2(_spo2_fig, _times, _values):
+            with _spo2_fig.batch_update():
+                update_figure(
+                    _spo2_fig, _times, _values,
+                    'SpO2 (Blood Oxygen Saturation)', 'SpO2 (Blood Oxygen Saturation)'
+                )
 
-        # Color code based on SpO2 level (green: >95, yellow: 90-95, red: <90)
-        _colors_spo2 = ['green' if v > 95 else 'orange' if v > 90 else 'red' for v in _values_spo2]
+                # Color code the plotted points by SpO2 level (green: >95, yellow: 90-95, red: <90)
+                _plotted_spo2 = np.asarray(_spo2_fig.data[0].y)
+                _spo2_fig.data[0].marker.color = np.select([_plotted_spo2 > 95, _plotted_spo2 > 90], ['green', 'orange'], default='red')
 
-        spo2_fig.add_trace(go.Scatter(
-            x=_times_spo2, y=_values_spo2,
-            mode='lines+markers',
-            name='SpO2',
-            line=dict(color='blue', width=3),
-            marker=dict(size=4, color=_colors_spo2)
-        ))
-
-        spo2_fig.update_layout(
-            title=f'SpO2 (Blood Oxygen Saturation) (n={len(data_buffers["spo2"])})',
-            xaxis_title='Time (s)',
-            yaxis_title='SpO2 (%)',
-            height=300,
-            showlegend=False,
-            yaxis=dict(range=[85, 100])  # Typical SpO2 range
-        )
-    else:
-        spo2_fig = go.Figure()
-        spo2_fig.add_annotation(
-            text="Waiting for SpO2 data...",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False,
-            font=dict(size=14)
-        )
-        spo2_fig.update_layout(title='SpO2 (Blood Oxygen Saturation)', height=300)
-
-    spo2_plot = mo.ui.plotly(spo2_fig)
+        submit_render('spo2', _update_spo2, figures['spo2'], *buffer_snapshot(data_buffers['spo2']))
+    spo2_plot = mo.vstack([mo.md(f"**SpO2 samples:** {len(data_buffers['spo2'])}"), rendered_plot('spo2')])
     return (spo2_plot,)
 
 
 @app.cell
 def _(
+    active_tab,
     focus_plot,
     hr_plot,
     imu_plot,
@@ -965,18 +957,10 @@ def _(
     poas_plot,
     power_plot,
     ppg_plot,
-    refresh_focus,
-    refresh_hr,
-    refresh_imu,
-    refresh_poas,
-    refresh_power,
-    refresh_ppg,
-    refresh_signal,
-    refresh_spo2,
     signal_plot,
     spo2_plot,
 ):
-    # Display visualization tabs with hidden refresh controls
+    # Display visualization tabs
     tabs = mo.ui.tabs({
         "Focus": focus_plot,
         "POAS": poas_plot,
@@ -986,24 +970,9 @@ def _(
         "PPG": ppg_plot,
         "Heart Rate": hr_plot,
         "SpO2": spo2_plot
-    })
+    }, value=active_tab['label'], on_change=lambda _label: active_tab.update(label=_label))
 
-    # Display tabs and hidden refresh timers
-    mo.vstack([
-        tabs,
-        mo.Html(f"""
-        <div style='display:none'>
-            {refresh_focus}
-            {refresh_poas}
-            {refresh_power}
-            {refresh_signal}
-            {refresh_imu}
-            {refresh_ppg}
-            {refresh_hr}
-            {refresh_spo2}
-        </div>
-        """)
-    ])
+    tabs
     return
 
 
@@ -1026,7 +995,7 @@ def _(mo):
 
 
 @app.cell
-def _(add_event_button, collector, data_buffers, event_input):
+def _(add_event_button, collector, data_buffers, datetime, event_input):
     # Handle event logging first
     if add_event_button.value and event_input.value and collector.event_logger:
         try:
@@ -1035,18 +1004,21 @@ def _(add_event_button, collector, data_buffers, event_input):
                 category="other"  # Default category
             )
             # Add to buffer for display
-            data_buffers['events'].append(_event)
+            data_buffers['events_formatted'].append({
+                "Time": datetime.fromtimestamp(_event['timestamp']).strftime("%H:%M:%S"),
+                "Description": _event['description']
+            })
         except Exception as e:
             print(f"Error logging event: {e}")
     return
 
 
 @app.cell
-def _(add_event_button, collector, event_input, mo, refresh_recording_status):
+def _(add_event_button, collector, event_input, master_tick, mo):
     # Display event controls and count
-    # Use refresh_recording_status to update count without re-creating UI
-    refresh_recording_status
-    event_count = len(collector.event_logger._events) if collector.event_logger else 0
+    # Use the shared refresh tick to update count without re-creating UI
+    master_tick
+    event_count = collector.event_logger.get_event_count() if collector.event_logger else 0
 
     mo.vstack([
         event_input,
@@ -1059,15 +1031,10 @@ def _(add_event_button, collector, event_input, mo, refresh_recording_status):
 
 
 @app.cell
-def _(collector, data_buffers, datetime, mo):
+def _(collector, data_buffers, mo):
     # Display recent events
-    if collector.event_logger and data_buffers['events']:
-        event_table_data = []
-        for evt in list(data_buffers['events'])[-10:]:  # Show last 10 events
-            event_table_data.append({
-                "Time": datetime.fromtimestamp(evt['timestamp']).strftime("%H:%M:%S"),
-                "Description": evt['description']
-            })
+    if collector.event_logger and data_buffers['events_formatted']:
+        event_table_data = list(data_buffers['events_formatted'])  # Last 10 events
 
         events_table = mo.ui.table(event_table_data, selection=None)
         mo.vstack([
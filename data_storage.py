@@ -9,10 +9,11 @@ HDF5 dataset structure, background saving, and session metadata management.
 import os
 import time
 import json
+import queue
 import logging
 import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, Optional, Tuple, Union, Any
 from datetime import datetime
 import numpy as np
 
@@ -23,21 +24,83 @@ except ImportError:
         "h5py is required for data storage. Install with: pip install h5py>=3.0.0"
     )
 
+# Blosc2 compression is opt-in (readers then need hdf5plugin too), so
+# hdf5plugin is only imported once a DataStorage selects it
+hdf5plugin = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _load_hdf5plugin():
+    """
+    Import hdf5plugin for Blosc2 compression.
+
+    Its bundled Blosc2 filter reads its thread count from BLOSC_NTHREADS when
+    the plugin loads, so the variable defaults to every core, but only here.
+
+    Returns:
+        The hdf5plugin module, or None if it isn't installed
+    """
+    global hdf5plugin
+    if hdf5plugin is None:
+        set_threads = "BLOSC_NTHREADS" not in os.environ
+        if set_threads:
+            os.environ["BLOSC_NTHREADS"] = str(os.cpu_count() or 1)
+        try:
+            import hdf5plugin as plugin
+        except ImportError:
+            if set_threads:
+                del os.environ["BLOSC_NTHREADS"]
+            return None
+        hdf5plugin = plugin
+    return hdf5plugin
+
+
+# Scalar scores share one compound dataset, "scores/all", with one record per
+# collector pass. Scores missing from a record are NaN (float fields) or -1.
+SCORE_DTYPE = np.dtype([
+    ("poas", np.float32),
+    ("focus", np.float32),
+    ("posture", np.int8),
+    ("sleep_stage", np.int8),
+    ("hr", np.int16),    # Heart rate (BPM)
+    ("spo2", np.int16),  # Blood oxygen (%)
+])
+MISSING_SCORES = np.array((np.nan, np.nan, -1, -1, -1, -1), dtype=SCORE_DTYPE)
+
 
 class DataStorage:
     """
     Manages HDF5 file storage with buffering and auto-save for FRENZ data collection.
 
     This class provides efficient data storage for continuous recording sessions with:
-    - HDF5 file management with single growing file strategy
+    - HDF5 file management with single growing file strategy, readable
+      live by other processes (SWMR)
+    - Datasets preallocated in hour-long steps; while a session is open only
+      the first ``n_valid`` rows (a dataset attribute) hold data
     - Efficient buffering system with configurable buffer size
-    - Automatic periodic saves with background threading
+    - Automatic periodic saves on a background I/O thread, with double
+      buffering so appends never wait for a write
     - Proper HDF5 dataset structure with optimal chunking
     - Thread-safe operations for concurrent access
     - Session metadata management and summary generation
     - Comprehensive error handling and logging
     """
 
+    # Uncompressed size each dataset's chunks are sized to
+    CHUNK_TARGET_BYTES = 1 << 20
+    # HDF5 chunk cache per file, large enough that appends never evict a
+    # partially written chunk
+    CHUNK_CACHE_BYTES = 64 << 20
+    CHUNK_CACHE_SLOTS = 1_000_003  # Prime, as recommended for the cache hash table
+    # Datasets are extended this many seconds of samples at a time
+    PREALLOCATE_SECONDS = 3600
+    # Rough compression ratio, used to size the disk space reserved up front
+    EXPECTED_COMPRESSION_RATIO = 3
+
     def __init__(self,
                  data_dir: Union[str, Path] = "./data",
                  buffer_size_minutes: int = 5,
@@ -51,7 +114,10 @@ class DataStorage:
             data_dir: Directory for storing data files
             buffer_size_minutes: Size of in-memory buffer in minutes (default: 5)
             auto_save_interval: Automatic save interval in seconds (default: 300)
-            compression: HDF5 compression method (default: "gzip")
+            compression: HDF5 compression method, any filter h5py supports
+                (default: "gzip"), or "blosc2" (zstd + bitshuffle). Blosc2 is
+                faster but needs hdf5plugin, both here (falls back to "gzip"
+                without it) and in every program that reads the files
             compression_level: Compression level 0-9 (default: 4)
         """
         self.data_dir = Path(data_dir)
@@ -79,52 +145,129 @@ class DataStorage:
         self.is_recording = False
 
         # Threading and buffer management
-        self._buffer_lock = threading.RLock()
-        self._auto_save_thread: Optional[threading.Thread] = None
-        self._stop_auto_save = False
-        self._data_buffers: Dict[str, List] = {}
-        self._timestamp_buffers: Dict[str, List] = {}
+        self._write_lock = threading.Lock()
+        self._io_queue: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=2)
+        self._io_thread: Optional[threading.Thread] = None
+        self._flush_requested = False
+        self._flush_thresholds: Dict[str, int] = {}
+        self._data_buffers: Dict[str, np.ndarray] = {}
+        self._spare_buffers: Dict[str, np.ndarray] = {}
+        self._buffer_index: Dict[str, int] = {}
+        self._valid_rows: Dict[str, int] = {}
+        # Values clipped to the integer range of scaled datasets, per session
+        self._clipped_values: Dict[str, int] = {}
+        # NaN values stored as the missing-value sentinel, per session
+        self._nan_values: Dict[str, int] = {}
+        self._datasets: Dict[str, h5py.Dataset] = {}
+        # File size after the previous flush, see _drop_written_pages()
+        self._flushed_file_size = 0
+        # Reused by flush_buffer() (under the write lock) for timestamps in seconds
+        self._seconds_staging = np.empty(0, dtype=np.float64)
         self._last_save_time = 0
 
-        # Dataset configuration
+        # Buffered timestamps are Unix nanoseconds taken from the monotonic
+        # clock plus this offset, which is set at session start
+        self._clock_offset_ns = time.time_ns() - time.monotonic_ns()
+
+        # Dataset configuration, plus (dtype, sample shape, scale) per data
+        # stream (not timestamp datasets) so append_data() needs a single lookup
         self._dataset_configs = self._get_dataset_configs()
+        self._sample_formats: Dict[str, Tuple[np.dtype, Tuple[int, ...], Optional[float]]] = {
+            dataset_name: (np.dtype(config["dtype"]), tuple(config["shape"][1:]), config.get("scale"))
+            for dataset_name, config in self._dataset_configs.items()
+            if "timestamps_of" not in config
+        }
+
+        # One lock per stream, covering its data and timestamp buffers, so
+        # streams don't contend with each other
+        self._buffer_locks: Dict[str, threading.Lock] = {
+            dataset_name: threading.Lock() for dataset_name in self._sample_formats
+        }
 
         # Create data directory
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
+        if self.compression == "blosc2" and _load_hdf5plugin() is None:
+            self.logger.warning("hdf5plugin not installed, using gzip compression instead of blosc2")
+            self.compression = "gzip"
+
         self.logger.info("DataStorage initialized")
 
-    def _get_dataset_configs(self) -> Dict[str, Dict]:
-        """Get HDF5 dataset configurations with shapes, dtypes, and chunk sizes."""
+    def _compression_options(self) -> Dict[str, Any]:
+        """Get the create_dataset() keyword arguments for the configured compression."""
+        if self.compression == "blosc2":
+            return dict(hdf5plugin.Blosc2(
+                cname="zstd", clevel=self.compression_level, filters=hdf5plugin.Blosc2.BITSHUFFLE
+            ))
         return {
+            "compression": self.compression,
+            "compression_opts": self.compression_level,
+            "shuffle": True,  # Improves compression
+        }
+
+    def _get_dataset_configs(self) -> Dict[str, Dict]:
+        """
+        Get HDF5 dataset configurations with shapes, dtypes, and chunk sizes.
+
+        ``expected_hz`` is the rate samples are appended at. It sizes the
+        in-memory buffers (and so the flush thresholds), the rows datasets are
+        preallocated by and the disk space reserved up front. The collector
+        appends every new raw row as the device delivers it (EEG 125 Hz, IMU
+        50 Hz, PPG 25 Hz), but stores scores only when they change, which the
+        SDK does about once a second; their rates leave some headroom. Chunks
+        are sized to about CHUNK_TARGET_BYTES uncompressed, whatever the
+        sample width.
+
+        ``fletcher32`` checksums are only computed for the low-volume datasets;
+        for raw and filtered signals (and their timestamps) the per-chunk CPU
+        cost isn't worth it.
+
+        Datasets with a ``scale`` are stored as integer counts of that many
+        units (saved as an attribute, e.g. ``scale_uv``); readers get physical
+        values back as ``counts * scale``. Only filtered EEG is scaled: raw EEG
+        can exceed the int16 range (±3276.7 µV at 0.1 µV/count), so it stays
+        float32. Values outside the range are clipped, counted and logged.
+        NaN (e.g. during electrode dropout) is stored as the dtype's minimum,
+        saved as the ``missing_value`` attribute, and counted separately.
+        """
+        configs = {
             # Raw data - actual shapes from FRENZ device
-            "raw/eeg": {"shape": (0, 7), "dtype": np.float32, "chunks": (10000, 7)},  # 7 channels
-            "raw/imu": {"shape": (0, 3), "dtype": np.float32, "chunks": (10000, 3)},  # x,y,z (skip timestamp)
-            "raw/ppg": {"shape": (0, 3), "dtype": np.float32, "chunks": (10000, 3)},  # G,R,IR (skip timestamp)
+            "raw/eeg": {"shape": (0, 7), "dtype": np.float32, "expected_hz": 125},  # 7 channels, µV
+            "raw/imu": {"shape": (0, 3), "dtype": np.float32, "expected_hz": 50},  # x,y,z (skip timestamp)
+            "raw/ppg": {"shape": (0, 3), "dtype": np.float32, "expected_hz": 25},  # G,R,IR (skip timestamp)
 
             # Filtered data (7 channels like raw)
-            "filtered/eeg": {"shape": (0, 7), "dtype": np.float32, "chunks": (10000, 7)},
+            "filtered/eeg": {"shape": (0, 7), "dtype": np.int16, "scale": 0.1, "expected_hz": 125},  # 0.1 µV/count
 
-            # Scores - single values
-            "scores/poas": {"shape": (0,), "dtype": np.float32, "chunks": (10000,)},
-            "scores/focus": {"shape": (0,), "dtype": np.float32, "chunks": (10000,)},
-            "scores/posture": {"shape": (0,), "dtype": np.int8, "chunks": (10000,)},
-            "scores/sleep_stage": {"shape": (0,), "dtype": np.int8, "chunks": (10000,)},
-            "scores/signal_quality": {"shape": (0, 4), "dtype": np.float32, "chunks": (10000, 4)},
-            "scores/hr": {"shape": (0,), "dtype": np.int16, "chunks": (10000,)},  # Heart rate (BPM)
-            "scores/spo2": {"shape": (0,), "dtype": np.int16, "chunks": (10000,)},  # Blood oxygen (%)
+            # Scores - single values in one compound dataset (see SCORE_DTYPE)
+            "scores/all": {"shape": (0,), "dtype": SCORE_DTYPE, "fillvalue": MISSING_SCORES, "expected_hz": 2},
+            "scores/signal_quality": {"shape": (0, 4), "dtype": np.float32, "expected_hz": 2},
 
             # Power bands - 5 channels (LF, OTEL, RF, OTER, AVG)
-            "power_bands/alpha": {"shape": (0, 5), "dtype": np.float32, "chunks": (10000, 5)},
-            "power_bands/beta": {"shape": (0, 5), "dtype": np.float32, "chunks": (10000, 5)},
-            "power_bands/gamma": {"shape": (0, 5), "dtype": np.float32, "chunks": (10000, 5)},
-            "power_bands/theta": {"shape": (0, 5), "dtype": np.float32, "chunks": (10000, 5)},
-            "power_bands/delta": {"shape": (0, 5), "dtype": np.float32, "chunks": (10000, 5)},
-
-            # Timestamps
-            "timestamps": {"shape": (0,), "dtype": np.float64, "chunks": (10000,)}
+            "power_bands/alpha": {"shape": (0, 5), "dtype": np.float32, "expected_hz": 2},
+            "power_bands/beta": {"shape": (0, 5), "dtype": np.float32, "expected_hz": 2},
+            "power_bands/gamma": {"shape": (0, 5), "dtype": np.float32, "expected_hz": 2},
+            "power_bands/theta": {"shape": (0, 5), "dtype": np.float32, "expected_hz": 2},
+            "power_bands/delta": {"shape": (0, 5), "dtype": np.float32, "expected_hz": 2},
         }
 
+        # Timestamps - a sibling "<name>_ts" dataset per stream with one Unix
+        # timestamp per sample, buffered as integer nanoseconds and saved as seconds
+        for dataset_name, config in list(configs.items()):
+            configs[f"{dataset_name}_ts"] = {
+                "shape": (0,), "dtype": np.float64, "buffer_dtype": np.int64,
+                "expected_hz": config["expected_hz"], "timestamps_of": dataset_name
+            }
+
+        for dataset_name, config in configs.items():
+            stream_name = config.get("timestamps_of", dataset_name)
+            config["fletcher32"] = not stream_name.startswith(("raw/", "filtered/"))
+
+            row_bytes = np.dtype(config["dtype"]).itemsize * int(np.prod(config["shape"][1:]))
+            chunk_rows = max(1024, self.CHUNK_TARGET_BYTES // row_bytes)
+            config["chunks"] = (chunk_rows,) + config["shape"][1:]
+        return configs
+
     def initialize_session(self, session_id: Optional[str] = None) -> bool:
         """
         Create session directory and HDF5 file.
@@ -142,14 +285,20 @@ class DataStorage:
 
             self.session_id = session_id
             self.session_start_time = time.time()
+            self._last_save_time = self.session_start_time
+            self._clock_offset_ns = time.time_ns() - time.monotonic_ns()
+            self._flushed_file_size = 0
 
             # Create session directory
             self.session_path = self.data_dir / session_id
             self.session_path.mkdir(parents=True, exist_ok=True)
 
-            # Initialize HDF5 file
+            # Initialize HDF5 file (SWMR needs the latest file format)
             h5_path = self.session_path / "session_data.h5"
-            self.h5_file = h5py.File(h5_path, "w")
+            self.h5_file = h5py.File(
+                h5_path, "w", libver="latest",
+                rdcc_nbytes=self.CHUNK_CACHE_BYTES, rdcc_nslots=self.CHUNK_CACHE_SLOTS
+            )
 
             # Create datasets
             success = self.create_datasets()
@@ -157,11 +306,18 @@ class DataStorage:
                 self.logger.error("Failed to create datasets")
                 return False
 
+            # Let other processes read the file while it is being written.
+            # No datasets, groups or attributes can be added from here on.
+            self.h5_file.swmr_mode = True
+
+            # Reserve space only now, switching to SWMR cuts the file to its data
+            self._reserve_disk_space()
+
             # Initialize buffers
             self._initialize_buffers()
 
-            # Start auto-save worker
-            self._start_auto_save_worker()
+            # Start the I/O worker
+            self._start_io_worker()
 
             self.is_recording = True
             self.logger.info(f"Session initialized: {session_id}")
@@ -171,6 +327,28 @@ class DataStorage:
             self.logger.error(f"Failed to initialize session: {e}")
             return False
 
+    def _reserve_disk_space(self) -> None:
+        """
+        Reserve disk space for the first PREALLOCATE_SECONDS of data.
+
+        The file is extended in one allocation so the filesystem doesn't have
+        to grow it piecemeal during long recordings. HDF5 keeps writing at its
+        own end-of-allocation; finalize_session() cuts the file back to it.
+        """
+        if not hasattr(os, "posix_fallocate"):
+            return  # Not available on this platform
+
+        bytes_per_second = sum(
+            config["expected_hz"] * np.dtype(config["dtype"]).itemsize * int(np.prod(config["shape"][1:]))
+            for config in self._dataset_configs.values()
+        )
+        expected_bytes = int(bytes_per_second * self.PREALLOCATE_SECONDS / self.EXPECTED_COMPRESSION_RATIO)
+
+        try:
+            os.posix_fallocate(self.h5_file.id.get_vfd_handle(), 0, expected_bytes)
+        except OSError as e:
+            self.logger.debug(f"Could not reserve disk space: {e}")
+
     def create_datasets(self) -> bool:
         """
         Initialize all HDF5 datasets with appropriate chunking and compression.
@@ -183,10 +361,19 @@ class DataStorage:
                 self.logger.error("HDF5 file not initialized")
                 return False
 
+            compression_options = self._compression_options()
+            self._valid_rows.clear()
+            self._clipped_values.clear()
+            self._nan_values.clear()
+            self._datasets.clear()
+
             for dataset_name, config in self._dataset_configs.items():
                 try:
                     # Skip if dataset already exists
                     if dataset_name in self.h5_file:
+                        dataset = self.h5_file[dataset_name]
+                        self._valid_rows[dataset_name] = int(dataset.attrs.get("n_valid", dataset.shape[0]))
+                        self._datasets[dataset_name] = dataset
                         self.logger.debug(f"Dataset {dataset_name} already exists, skipping")
                         continue
 
@@ -197,18 +384,26 @@ class DataStorage:
                             self.h5_file.create_group(group_name)
                             self.logger.debug(f"Created group: {group_name}")
 
-                    # Create dataset with proper configuration
-                    self.h5_file.create_dataset(
+                    # Create dataset with proper configuration, preallocated
+                    # so most flushes don't have to resize it
+                    is_float = np.issubdtype(config["dtype"], np.floating)
+                    fillvalue = config.get("fillvalue", np.nan if is_float else None)
+                    dataset = self.h5_file.create_dataset(
                         dataset_name,
-                        shape=config["shape"],
+                        shape=(self._preallocated_rows(config),) + config["shape"][1:],
                         maxshape=(None,) + config["shape"][1:] if len(config["shape"]) > 1 else (None,),
                         dtype=config["dtype"],
                         chunks=config["chunks"],
-                        compression=self.compression,
-                        compression_opts=self.compression_level,
-                        shuffle=True,  # Improves compression
-                        fletcher32=True  # Error detection
+                        fillvalue=fillvalue,
+                        fletcher32=config["fletcher32"],  # Error detection
+                        **compression_options
                     )
+                    dataset.attrs["n_valid"] = np.int64(0)
+                    if "scale" in config:
+                        dataset.attrs["scale_uv"] = config["scale"]
+                        dataset.attrs["missing_value"] = np.iinfo(config["dtype"]).min
+                    self._valid_rows[dataset_name] = 0
+                    self._datasets[dataset_name] = dataset
                     self.logger.debug(f"Created dataset: {dataset_name}")
 
                 except Exception as e:
@@ -222,16 +417,85 @@ class DataStorage:
             self.logger.error(f"Failed to create datasets: {e}")
             return False
 
+    def _preallocated_rows(self, config: Dict) -> int:
+        """Get the number of rows a dataset is extended by at a time."""
+        return max(config["chunks"][0], int(config["expected_hz"] * self.PREALLOCATE_SECONDS))
+
     def _initialize_buffers(self) -> None:
-        """Initialize data buffers for all datasets."""
-        with self._buffer_lock:
-            self._data_buffers.clear()
-            self._timestamp_buffers.clear()
+        """
+        Initialize data buffers for all datasets.
 
-            for dataset_name in self._dataset_configs.keys():
-                self._data_buffers[dataset_name] = []
-                if dataset_name != "timestamps":
-                    self._timestamp_buffers[dataset_name] = []
+        Each dataset gets two preallocated arrays holding one buffer period at
+        its expected rate: the active one is filled up to ``_buffer_index[name]``
+        while the spare one is being written out. Arrays are kept across
+        flushes; only the write index is reset.
+        """
+        for dataset_name, config in self._dataset_configs.items():
+            capacity = max(1, int(config["expected_hz"] * 60 * self.buffer_size_minutes))
+            shape = (capacity,) + config["shape"][1:]
+            dtype = config.get("buffer_dtype", config["dtype"])
+            with self._buffer_locks[config.get("timestamps_of", dataset_name)]:
+                self._data_buffers[dataset_name] = np.empty(shape, dtype=dtype)
+                self._spare_buffers[dataset_name] = np.empty(shape, dtype=dtype)
+                self._buffer_index[dataset_name] = 0
+
+        # Once any stream holds a buffer period of samples, it's time to flush
+        self._flush_thresholds = {
+            dataset_name: self._data_buffers[dataset_name].shape[0] for dataset_name in self._sample_formats
+        }
+
+    def _swap_buffers(self) -> Dict[str, np.ndarray]:
+        """
+        Swap the active buffers for the spare ones.
+
+        Each stream's lock is only held while its own buffers are swapped,
+        and its samples and timestamps are always swapped together.
+
+        Returns:
+            Dict mapping dataset names to the filled part of their old buffer,
+            for datasets that had samples
+        """
+        filled = {}
+        for stream_name, lock in self._buffer_locks.items():
+            with lock:
+                for dataset_name in (stream_name, f"{stream_name}_ts"):
+                    count = self._buffer_index[dataset_name]
+                    if count == 0:
+                        continue
+                    buffer = self._data_buffers[dataset_name]
+                    self._data_buffers[dataset_name] = self._spare_buffers[dataset_name]
+                    self._spare_buffers[dataset_name] = buffer
+                    self._buffer_index[dataset_name] = 0
+                    filled[dataset_name] = buffer[:count]
+
+        self._flush_requested = False
+        return filled
+
+    def _buffer_append(self, dataset_name: str, value) -> None:
+        """Write one sample into a dataset's buffer, doubling it if full (caller holds its lock)."""
+        index = self._buffer_index[dataset_name]
+        buffer = self._data_buffers[dataset_name]
+        if index == buffer.shape[0]:
+            buffer = np.concatenate((buffer, np.empty_like(buffer)))
+            self._data_buffers[dataset_name] = buffer
+        buffer[index] = value
+        self._buffer_index[dataset_name] = index + 1
+
+    def _buffer_extend(self, dataset_name: str, values: np.ndarray) -> None:
+        """Write several samples into a dataset's buffer, growing it to fit (caller holds its lock)."""
+        index = self._buffer_index[dataset_name]
+        end = index + len(values)
+        buffer = self._data_buffers[dataset_name]
+        if end > buffer.shape[0]:
+            capacity = buffer.shape[0]
+            while capacity < end:
+                capacity *= 2
+            grown = np.empty((capacity,) + buffer.shape[1:], dtype=buffer.dtype)
+            grown[:index] = buffer[:index]
+            buffer = grown
+            self._data_buffers[dataset_name] = buffer
+        buffer[index:end] = values
+        self._buffer_index[dataset_name] = end
 
     def append_data(self, data_type: str, data: Union[np.ndarray, float, int],
                    timestamp: Optional[float] = None) -> bool:
@@ -239,7 +503,8 @@ class DataStorage:
         Add data to buffer with timestamp.
 
         Args:
-            data_type: Type of data (e.g., "raw/eeg", "scores/focus")
+            data_type: Type of data (e.g., "raw/eeg", "power_bands/alpha"); use
+                append_scores() for the single value scores
             data: Data array or single value
             timestamp: Unix timestamp. If None, uses current time
 
@@ -252,37 +517,35 @@ class DataStorage:
                 return False
 
             if timestamp is None:
-                timestamp = time.time()
+                timestamp_ns = time.monotonic_ns() + self._clock_offset_ns
+            else:
+                timestamp_ns = int(timestamp * 1e9)
 
             # Validate data type
-            if data_type not in self._dataset_configs:
+            sample_format = self._sample_formats.get(data_type)
+            if sample_format is None:
                 self.logger.error(f"Unknown data type: {data_type}")
                 return False
+            dtype, expected_shape, scale = sample_format
 
-            # Convert data to numpy array if needed
-            if not isinstance(data, np.ndarray):
-                data = np.array(data, dtype=self._dataset_configs[data_type]["dtype"])
+            # Convert data to a numpy array of the dataset's dtype (no copy if it already is one)
+            if scale is not None:
+                data = self._quantize(data_type, data, dtype, scale)
             else:
-                data = data.astype(self._dataset_configs[data_type]["dtype"])
+                data = np.asarray(data, dtype=dtype)
 
             # Validate data shape
-            expected_shape = self._dataset_configs[data_type]["shape"][1:]
-            if len(expected_shape) > 0 and data.shape != expected_shape:
+            if expected_shape and data.shape != expected_shape:
                 self.logger.error(f"Data shape mismatch for {data_type}: {data.shape} != {expected_shape}")
                 return False
 
-            # Add to buffer
-            with self._buffer_lock:
-                self._data_buffers[data_type].append(data)
-                if data_type != "timestamps":
-                    self._timestamp_buffers[data_type].append(timestamp)
-
-                # Also add timestamp to timestamp buffer
-                if data_type != "timestamps":
-                    self._data_buffers["timestamps"].append(timestamp)
+            # Add sample and timestamp to the stream's buffers
+            with self._buffer_locks[data_type]:
+                self._buffer_append(data_type, data)
+                self._buffer_append(f"{data_type}_ts", timestamp_ns)
 
             # Check if buffer needs flushing
-            self._check_buffer_size()
+            self._check_buffer_size(data_type)
 
             return True
 
@@ -290,28 +553,166 @@ class DataStorage:
             self.logger.error(f"Failed to append data: {e}")
             return False
 
-    def _check_buffer_size(self) -> None:
-        """Check if buffer size exceeds limit and flush if needed."""
+    def append_scores(self, scores: Dict[str, float], timestamp: Optional[float] = None) -> bool:
+        """
+        Add one record of scalar scores to the "scores/all" buffer.
+
+        Args:
+            scores: Score values by SCORE_DTYPE field name, e.g. {"focus": 72.0, "hr": 64};
+                missing scores are stored as NaN or -1
+            timestamp: Unix timestamp. If None, uses current time
+
+        Returns:
+            bool: True if data appended successfully, False otherwise
+        """
+        record = MISSING_SCORES.copy()
         try:
-            with self._buffer_lock:
-                # Calculate buffer duration based on timestamps
-                if len(self._data_buffers.get("timestamps", [])) < 2:
-                    return
+            for name, value in scores.items():
+                record[name] = value
+        except (ValueError, TypeError) as e:
+            self.logger.error(f"Invalid scores {scores}: {e}")
+            return False
+
+        return self.append_data("scores/all", record, timestamp)
+
+    def append_batch(self, data_type: str, data: np.ndarray,
+                     timestamps: Optional[np.ndarray] = None) -> bool:
+        """
+        Add several samples to buffer at once.
 
-                timestamps = self._data_buffers["timestamps"]
-                duration_minutes = (timestamps[-1] - timestamps[0]) / 60.0
+        Converts and validates like append_data(), but copies the whole batch
+        into the buffer in one go, e.g. a packet of samples from the device.
 
-                if duration_minutes >= self.buffer_size_minutes:
-                    self.logger.info(f"Buffer full ({duration_minutes:.1f} min), flushing...")
-                    self.flush_buffer()
+        Args:
+            data_type: Type of data (e.g., "raw/eeg", "power_bands/alpha"); use
+                append_scores() for the single value scores
+            data: Samples stacked along the first axis
+            timestamps: Unix timestamp of each sample. If None, all samples get the current time
+
+        Returns:
+            bool: True if data appended successfully, False otherwise
+        """
+        try:
+            if not self.is_recording:
+                self.logger.warning("Not recording, data not saved")
+                return False
+
+            # Validate data type
+            sample_format = self._sample_formats.get(data_type)
+            if sample_format is None:
+                self.logger.error(f"Unknown data type: {data_type}")
+                return False
+            dtype, expected_shape, scale = sample_format
+
+            if scale is not None:
+                data = self._quantize(data_type, data, dtype, scale)
+            else:
+                data = np.asarray(data, dtype=dtype)
+
+            # Validate data shape
+            if data.shape[1:] != expected_shape:
+                self.logger.error(f"Data shape mismatch for {data_type}: {data.shape[1:]} != {expected_shape}")
+                return False
+
+            if timestamps is None:
+                timestamps_ns = np.full(len(data), time.monotonic_ns() + self._clock_offset_ns, dtype=np.int64)
+            else:
+                timestamps_ns = (np.asarray(timestamps, dtype=np.float64) * 1e9).astype(np.int64)
+                if timestamps_ns.shape != (len(data),):
+                    self.logger.error(f"Expected {len(data)} timestamps for {data_type}, got {timestamps_ns.shape}")
+                    return False
+
+            # Add samples and timestamps to the stream's buffers
+            with self._buffer_locks[data_type]:
+                self._buffer_extend(data_type, data)
+                self._buffer_extend(f"{data_type}_ts", timestamps_ns)
+
+            # Check if buffer needs flushing
+            self._check_buffer_size(data_type)
+
+            return True
 
         except Exception as e:
-            self.logger.error(f"Error checking buffer size: {e}")
+            self.logger.error(f"Failed to append data: {e}")
+            return False
+
+    def _quantize(self, data_type: str, data: Union[np.ndarray, float], dtype: np.dtype,
+                  scale: float) -> np.ndarray:
+        """
+        Convert physical values to the integer counts a scaled dataset stores.
+
+        NaN becomes the dtype's minimum, which is reserved as the missing
+        value; values outside the remaining range are clipped. Both are
+        counted per dataset, and the first clip of a session is logged.
+        """
+        limits = np.iinfo(dtype)
+        data = np.asarray(data, dtype=np.float32)
+        counts = np.divide(data, scale, out=np.empty(data.shape, dtype=np.float32))
+        np.rint(counts, out=counts)
+        missing = np.isnan(counts)
+        nan_count = np.count_nonzero(missing)
+        if nan_count:
+            self._nan_values[data_type] = self._nan_values.get(data_type, 0) + int(nan_count)
+
+        # NaN compares false, so only real values count as clipped
+        clipped = np.count_nonzero((counts < limits.min + 1) | (counts > limits.max))
+        if clipped:
+            if data_type not in self._clipped_values:
+                self.logger.warning(f"{data_type} exceeds ±{limits.max * scale:g}, clipping values outside the range")
+            self._clipped_values[data_type] = self._clipped_values.get(data_type, 0) + int(clipped)
+            np.clip(counts, limits.min + 1, limits.max, out=counts)  # NaN stays NaN
+        if nan_count:
+            counts[missing] = limits.min
+        return counts.astype(dtype)
+
+    def append_data_fast(self, data_type: str, data: Union[np.ndarray, float, int],
+                         timestamp_ns: Optional[int] = None) -> None:
+        """
+        Add data to buffer without conversion or validation.
+
+        For producers that already hold data of the dataset's dtype and sample
+        shape, such as the acquisition loop. Anything else should go through
+        append_data(), which converts, validates and logs failures. Scaled
+        datasets such as filtered EEG expect integer counts here, not physical values.
+
+        Args:
+            data_type: Type of data (e.g., "raw/eeg", "power_bands/alpha"); use
+                append_scores() for the single value scores
+            data: Sample of the dataset's dtype and sample shape
+            timestamp_ns: Unix timestamp in nanoseconds. If None, uses current time
+        """
+        if timestamp_ns is None:
+            timestamp_ns = time.monotonic_ns() + self._clock_offset_ns
+
+        with self._buffer_locks[data_type]:
+            self._buffer_append(data_type, data)
+            self._buffer_append(f"{data_type}_ts", timestamp_ns)
+
+        self._check_buffer_size(data_type)
+
+    def _check_buffer_size(self, data_type: str) -> None:
+        """Check if a stream's buffer size exceeds limit and queue a flush if needed."""
+        if self._flush_requested or self._buffer_index[data_type] < self._flush_thresholds[data_type]:
+            return
+
+        self._flush_requested = True
+        self.logger.info(f"Buffer full ({data_type}, {self._buffer_index[data_type]} samples), queueing flush...")
+        self._request_flush()
+
+    def _request_flush(self) -> None:
+        """Ask the I/O worker to flush the buffers without waiting for it."""
+        try:
+            self._io_queue.put_nowait("flush")
+        except queue.Full:
+            pass  # A queued flush will pick up these samples too
 
     def flush_buffer(self) -> bool:
         """
         Write buffer to disk efficiently.
 
+        The buffers are swapped for the spare set first, so appends carry on
+        while the filled ones are written. Normally called on the I/O worker.
+
         Returns:
             bool: True if buffer flushed successfully, False otherwise
         """
@@ -320,39 +721,38 @@ class DataStorage:
                 self.logger.error("HDF5 file not initialized")
                 return False
 
-            with self._buffer_lock:
+            # Only one flush at a time, so the spare buffers are free to swap in
+            with self._write_lock:
+                filled = self._swap_buffers()
+
                 # Check if there's data to write
-                total_samples = 0
-                for dataset_name, buffer in self._data_buffers.items():
-                    if len(buffer) > 0:
-                        total_samples += len(buffer)
+                total_samples = sum(len(data) for data in filled.values())
 
                 if total_samples == 0:
                     return True  # Nothing to flush
 
                 # Write data to HDF5 file
-                for dataset_name, buffer in self._data_buffers.items():
-                    if len(buffer) == 0:
-                        continue
-
-                    dataset = self.h5_file[dataset_name]
-                    old_size = dataset.shape[0]
-                    new_size = old_size + len(buffer)
-
-                    # Resize dataset
-                    dataset.resize((new_size,) + dataset.shape[1:])
-
-                    # Write data
-                    if len(dataset.shape) == 1:
-                        dataset[old_size:new_size] = buffer
-                    else:
-                        dataset[old_size:new_size, :] = np.array(buffer)
-
-                # Clear buffers
-                self._initialize_buffers()
+                for dataset_name, data in filled.items():
+                    config = self._dataset_configs[dataset_name]
+                    if "timestamps_of" in config:
+                        data = self._to_seconds(data)  # Buffered as integer nanoseconds
+                    dataset = self._datasets[dataset_name]
+                    old_size = self._valid_rows[dataset_name]
+                    new_size = old_size + len(data)
+
+                    # Extend the dataset only when the preallocated rows run out
+                    if new_size > dataset.shape[0]:
+                        step = self._preallocated_rows(config)
+                        dataset.resize((max(new_size, dataset.shape[0] + step),) + dataset.shape[1:])
+
+                    # Hand the filled part of the buffer straight to HDF5
+                    dataset.write_direct(data, dest_sel=np.s_[old_size:new_size])
+                    dataset.attrs.modify("n_valid", np.int64(new_size))
+                    self._valid_rows[dataset_name] = new_size
 
                 # Force write to disk
                 self.h5_file.flush()
+                self._drop_written_pages()
                 self._last_save_time = time.time()
 
                 self.logger.info(f"Buffer flushed: {total_samples} samples written")
@@ -362,40 +762,77 @@ class DataStorage:
             self.logger.error(f"Failed to flush buffer: {e}")
             return False
 
-    def _start_auto_save_worker(self) -> None:
-        """Start background thread for periodic saves."""
-        if self._auto_save_thread is not None and self._auto_save_thread.is_alive():
-            self.logger.warning("Auto-save thread already running")
+    def _drop_written_pages(self) -> None:
+        """
+        Let the kernel drop cached pages of the file written before the previous flush.
+
+        Keeps the page cache from filling up with session data on long
+        recordings. Those pages have had a whole flush interval to reach the
+        disk; pages from the latest flush are likely still dirty, so they are
+        left for the next call.
+        """
+        if self._flushed_file_size and hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(
+                    self.h5_file.id.get_vfd_handle(), 0, self._flushed_file_size, os.POSIX_FADV_DONTNEED
+                )
+            except OSError as e:
+                self.logger.debug(f"Could not drop cached pages: {e}")
+        self._flushed_file_size = self.h5_file.id.get_filesize()
+
+    def _to_seconds(self, timestamps_ns: np.ndarray) -> np.ndarray:
+        """Convert nanosecond timestamps to seconds in the reused staging array (caller holds the write lock)."""
+        count = len(timestamps_ns)
+        if count > len(self._seconds_staging):
+            self._seconds_staging = np.empty(count, dtype=np.float64)
+        return np.divide(timestamps_ns, 1e9, out=self._seconds_staging[:count])
+
+    def _start_io_worker(self) -> None:
+        """Start background thread for buffer flushes and periodic saves."""
+        if self._io_thread is not None and self._io_thread.is_alive():
+            self.logger.warning("I/O thread already running")
             return
 
-        self._stop_auto_save = False
-        self._auto_save_thread = threading.Thread(
-            target=self.auto_save_worker,
-            name="DataStorage-AutoSave",
+        self._io_thread = threading.Thread(
+            target=self.io_worker,
+            name="DataStorage-IO",
             daemon=True
         )
-        self._auto_save_thread.start()
-        self.logger.info("Auto-save worker started")
+        self._io_thread.start()
+        self.logger.info("I/O worker started")
 
-    def auto_save_worker(self) -> None:
-        """Background thread for periodic saves."""
-        self.logger.info("Auto-save worker thread started")
+    def io_worker(self) -> None:
+        """
+        Background thread that writes the buffers to disk.
 
-        while not self._stop_auto_save and self.is_recording:
-            try:
-                time.sleep(1)  # Check every second
+        Flushes when one is requested through the queue and every
+        ``auto_save_interval`` seconds; a ``None`` job stops the thread.
+        """
+        self.logger.info("I/O worker thread started")
 
-                current_time = time.time()
-                time_since_save = current_time - self._last_save_time
+        # Also counts flushes that had nothing to write or failed, so those
+        # don't make the next auto-save due immediately
+        last_attempt_time = time.time()
 
-                if time_since_save >= self.auto_save_interval:
+        while True:
+            try:
+                # Sleep until the next auto-save is due unless a job arrives first
+                next_save_time = max(self._last_save_time, last_attempt_time) + self.auto_save_interval
+                try:
+                    job = self._io_queue.get(timeout=max(0.0, next_save_time - time.time()))
+                except queue.Empty:
                     self.logger.info("Auto-save triggered")
-                    self.flush_buffer()
+                    job = "flush"
+
+                if job is None:
+                    break
+                last_attempt_time = time.time()
+                self.flush_buffer()
 
             except Exception as e:
-                self.logger.error(f"Error in auto-save worker: {e}")
+                self.logger.error(f"Error in I/O worker: {e}")
 
-        self.logger.info("Auto-save worker thread stopped")
+        self.logger.info("I/O worker thread stopped")
 
     def stop_recording(self) -> bool:
         """
@@ -407,10 +844,10 @@ class DataStorage:
         try:
             self.is_recording = False
 
-            # Stop auto-save worker
-            self._stop_auto_save = True
-            if self._auto_save_thread and self._auto_save_thread.is_alive():
-                self._auto_save_thread.join(timeout=5)
+            # Stop the I/O worker once it has finished any queued flushes
+            if self._io_thread and self._io_thread.is_alive():
+                self._io_queue.put(None, timeout=5)
+                self._io_thread.join(timeout=5)
 
             # Final buffer flush
             success = self.flush_buffer()
@@ -443,20 +880,31 @@ class DataStorage:
             total_samples = 0
 
             if self.h5_file:
-                for dataset_name in self._dataset_configs.keys():
-                    if dataset_name in self.h5_file:
-                        dataset = self.h5_file[dataset_name]
-                        samples = dataset.shape[0]
-                        data_stats[dataset_name] = samples
-                        if dataset_name != "timestamps":
-                            total_samples += samples
-
-                # Get file size
-                file_size_mb = os.path.getsize(self.h5_file.filename) / (1024 * 1024)
-
-                # Close HDF5 file
+                for dataset_name, samples in self._valid_rows.items():
+                    # Trim the unused preallocated rows
+                    dataset = self._datasets[dataset_name]
+                    dataset.resize((samples,) + dataset.shape[1:])
+                    data_stats[dataset_name] = samples
+                    if dataset_name in self._sample_formats:
+                        total_samples += samples
+
+                for dataset_name, clipped in self._clipped_values.items():
+                    self.logger.warning(f"{dataset_name}: {clipped} values clipped to the dataset's integer range")
+                for dataset_name, nan_count in self._nan_values.items():
+                    self.logger.info(f"{dataset_name}: {nan_count} NaN values stored as missing")
+
+                # Close HDF5 file, then drop any disk space reserved past its end
+                self.h5_file.flush()
+                h5_path = self.h5_file.filename
+                file_size = self.h5_file.id.get_filesize()
+                self._datasets.clear()
                 self.h5_file.close()
                 self.h5_file = None
+                if os.path.getsize(h5_path) > file_size:
+                    os.truncate(h5_path, file_size)
+
+                # Get file size
+                file_size_mb = os.path.getsize(h5_path) / (1024 * 1024)
             else:
                 file_size_mb = 0
 
@@ -469,7 +917,9 @@ class DataStorage:
                 "data_stats": {
                     "total_samples": total_samples,
                     "file_size_mb": file_size_mb,
-                    "datasets": data_stats
+                    "datasets": data_stats,
+                    "clipped_values": dict(self._clipped_values),
+                    "nan_values": dict(self._nan_values)
                 },
                 "files": {
                     "data": "session_data.h5"
@@ -482,11 +932,16 @@ class DataStorage:
                 }
             }
 
-            # Save metadata to JSON file
+            # Save metadata to JSON file (with orjson when it is installed)
             if self.session_path:
                 metadata_path = self.session_path / "session_info.json"
-                with open(metadata_path, 'w') as f:
-                    json.dump(session_metadata, f, indent=2)
+                if orjson is not None:
+                    metadata_path.write_bytes(orjson.dumps(
+                        session_metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                    ))
+                else:
+                    with open(metadata_path, 'w') as f:
+                        json.dump(session_metadata, f, indent=2)
 
                 self.logger.info(f"Session finalized: {self.session_id}")
                 self.logger.info(f"Duration: {duration:.1f}s, Samples: {total_samples}, Size: {file_size_mb:.1f}MB")
@@ -512,17 +967,16 @@ class DataStorage:
             duration = current_time - (self.session_start_time or current_time)
 
             # Count buffered samples
-            buffered_samples = 0
-            with self._buffer_lock:
-                for dataset_name, buffer in self._data_buffers.items():
-                    if dataset_name != "timestamps":
-                        buffered_samples += len(buffer)
+            buffered_samples = sum(
+                count for dataset_name, count in self._buffer_index.items()
+                if dataset_name in self._sample_formats
+            )
 
             # Count saved samples
-            saved_samples = 0
-            for dataset_name in self._dataset_configs.keys():
-                if dataset_name != "timestamps" and dataset_name in self.h5_file:
-                    saved_samples += self.h5_file[dataset_name].shape[0]
+            saved_samples = sum(
+                samples for dataset_name, samples in self._valid_rows.items()
+                if dataset_name in self._sample_formats
+            )
 
             return {
                 "status": "recording",
@@ -531,6 +985,7 @@ class DataStorage:
                 "saved_samples": saved_samples,
                 "buffered_samples": buffered_samples,
                 "total_samples": saved_samples + buffered_samples,
+                "bytes_written": self.h5_file.id.get_filesize(),  # Excludes reserved space
                 "last_save_time": self._last_save_time,
                 "time_since_save": current_time - self._last_save_time
             }
@@ -574,13 +1029,13 @@ if __name__ == "__main__":
 
         # Add some sample data
         for i in range(100):
-            # Simulate EEG data (4 channels)
-            eeg_data = np.random.randn(4).astype(np.float32)
+            # Simulate EEG data (7 channels)
+            eeg_data = np.random.randn(7).astype(np.float32)
             storage.append_data("raw/eeg", eeg_data)
 
             # Simulate focus score
             focus_score = np.random.rand()
-            storage.append_data("scores/focus", focus_score)
+            storage.append_scores({"focus": focus_score})
 
             # Simulate power band data
             alpha_data = np.random.randn(5).astype(np.float32)
@@ -6,22 +6,125 @@ It provides functionality for scanning devices, loading devices from environment
 connection management with proper error handling, status tracking, and auto-reconnect capability.
 """
 
+import copy
+import functools
+import inspect
 import os
+import random
 import time
 import logging
 from enum import Enum
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 from pathlib import Path
 from dotenv import load_dotenv
 import threading
+import weakref
 import asyncio
 
-import nest_asyncio
-nest_asyncio.apply()
-
+import numpy as np
 from frenztoolkit import Scanner, Streamer
 
 
+# Set up logging once for all DeviceManager instances
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    ))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+
+# Common .env locations, first existing one wins; resolved once at import
+_DEFAULT_ENV_PATHS = (
+    Path(".env"),
+    Path.home() / '.config' / 'my_api_keys' / 'keys.env',
+    Path(__file__).parent / ".env"
+)
+_DEFAULT_ENV_PATH = next((p for p in _DEFAULT_ENV_PATHS if p.exists()), None)
+
+# Device credentials, read once after the first DeviceManager has loaded the
+# .env file and shared by later instances
+_ENV_CACHE: Dict[str, Optional[str]] = {}
+
+# Scanned devices with this anywhere in their casefolded name are FRENZ bands
+_FRENZ_NAME = "frenz"
+
+# Bluetooth handshakes in progress at once across all DeviceManagers, so a
+# fleet reconnecting after an outage doesn't flood the radio
+_BLE_CONNECT_SLOTS = threading.Semaphore(2)
+
+_NESTED = False
+
+
+def _cleanup_streamer(streamer) -> None:
+    """Stop a streamer whose DeviceManager was garbage collected or left running at exit."""
+    try:
+        streamer.stop()
+    except Exception:
+        pass
+
+
+def _has_data(streamer) -> bool:
+    """Check whether a Streamer has started filling in its raw data."""
+    data = getattr(streamer, 'DATA', None)
+    return bool(data) and 'RAW' in data
+
+
+def same_score(a: Any, b: Any) -> bool:
+    """
+    Check whether two streamer score values are equal.
+
+    Values are compared by value, not identity: the streamer may publish an
+    equal value as a new object, or update an array in place. Arrays and
+    sequences compare element-wise, and NaN (no score yet) equals NaN.
+    """
+    if a is None or b is None:
+        return a is b
+    if isinstance(a, (np.ndarray, list, tuple)) or isinstance(b, (np.ndarray, list, tuple)):
+        try:
+            return np.array_equal(a, b, equal_nan=True)
+        except TypeError:  # Non-numeric elements
+            return np.array_equal(a, b)
+    try:
+        return bool(a == b) or (a != a and b != b)
+    except (TypeError, ValueError):
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def _accepts(func, name: str) -> bool:
+    """
+    Check whether a frenztoolkit class or method has a parameter of this name.
+
+    Only named parameters count; toolkit versions differ in the options they
+    take, and an option passed on through ``**kwargs`` may not be supported.
+    """
+    try:
+        return name in inspect.signature(func).parameters
+    except (TypeError, ValueError):  # No signature available
+        return False
+
+
+def _takes_known_address() -> bool:
+    """Check whether the toolkit's Streamer can connect to a known address without scanning."""
+    return _accepts(Streamer, "address") and _accepts(Streamer, "prescan")
+
+
+def _ensure_nested_loop() -> None:
+    """
+    Allow frenztoolkit to run its event loop from inside a running one.
+
+    nest_asyncio patches every asyncio loop in the process, so this is only
+    done the first time a Scanner or Streamer is created.
+    """
+    global _NESTED
+    if not _NESTED:
+        import nest_asyncio
+        nest_asyncio.apply()
+        _NESTED = True
+
+
 class DeviceStatus(Enum):
     """Device connection status enumeration."""
     DISCONNECTED = "disconnected"
@@ -44,6 +147,22 @@ class DeviceManager:
     - Comprehensive error handling and logging
     """
 
+    # Streamer's internal data goes here; created by the first connect()
+    STREAMER_TEMP_DIR = Path("./data/frenz_streamer_temp")
+    _streamer_temp_dir_ready = False
+
+    # How often to look at the streamer while waiting for it to deliver data;
+    # the SDK has no callback for new samples or scores
+    DATA_CHECK_INTERVAL = 0.02
+
+    # Copied and filled in by get_status_info()
+    _STATUS_INFO_TEMPLATE = {
+        "status": None,
+        "connected_device": None,
+        "last_error": None,
+        "has_streamer": False
+    }
+
     def __init__(self,
                  connection_timeout: int = 30,
                  reconnect_attempts: int = 3,
@@ -63,25 +182,27 @@ class DeviceManager:
         self.auto_connect_on_start = auto_connect_on_start
         self.light_off = True  # Default to light off
 
-        # Set up logging
-        self.logger = logging.getLogger(__name__)
-        if not self.logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
-            self.logger.setLevel(logging.INFO)
+        self.logger = logger
 
         # Initialize state
         self._status = DeviceStatus.DISCONNECTED
         self._scanner = None
+        self._scanner_lock = threading.Lock()
+        self._scan_active = False
         self._streamer = None
+        self._streamer_finalizer = None
         self._connected_device = None
         self._reconnect_thread = None
-        self._stop_reconnect = False
+        self._stop_event = threading.Event()
         self._last_connection_error = None
+        self._data_ready = threading.Event()
+        self._data_watch_stop = threading.Event()  # Replaced by each connect()
+
+        # EEG buffer as of the last health check, to tell a stalled stream
+        # from one that is still delivering samples
+        self._last_eeg_len = 0
+        self._last_eeg_newest = None
+        self._last_eeg_check_mono = 0.0
 
         # Load environment variables
         self._load_env_variables(env_path)
@@ -89,34 +210,39 @@ class DeviceManager:
         self.logger.info("DeviceManager initialized")
 
     def _load_env_variables(self, env_path: Optional[Path] = None) -> None:
-        """Load environment variables from file."""
+        """Load environment variables from file (once, unless a specific file is given)."""
+        if _ENV_CACHE and env_path is None:
+            return
+
         try:
             if env_path is None:
-                # Try multiple common locations
-                possible_paths = [
-                    Path(".env"),
-                    Path.home() / '.config' / 'my_api_keys' / 'keys.env',
-                    Path(__file__).parent / ".env"
-                ]
-
-                for path in possible_paths:
-                    if path.exists():
-                        env_path = path
-                        break
-
-            if env_path and env_path.exists():
+                env_path = _DEFAULT_ENV_PATH
+            elif not env_path.exists():
+                env_path = None
+
+            if env_path:
                 load_dotenv(env_path)
-                self.logger.info(f"Loaded environment variables from {env_path}")
+                self.logger.info("Loaded environment variables from %s", env_path)
             else:
                 self.logger.warning("No .env file found, using system environment variables")
 
         except Exception as e:
-            self.logger.error(f"Error loading environment variables: {e}")
+            self.logger.error("Error loading environment variables: %s", e)
 
-    def scan_devices(self) -> List[Dict]:
+        _ENV_CACHE["FRENZ_ID"] = os.environ.get("FRENZ_ID")
+        _ENV_CACHE["FRENZ_KEY"] = os.environ.get("FRENZ_KEY")
+
+    def scan_devices(self, timeout: Optional[float] = 2.0) -> List[Dict]:
         """
         Scan for available FRENZ devices.
 
+        Scans are started from the UI, so the scanner runs in low-latency mode
+        where the toolkit supports it.
+
+        Args:
+            timeout: Maximum scan duration in seconds (None, or a toolkit whose
+                scan takes no timeout, uses the toolkit default)
+
         Returns:
             List of discovered devices with format:
             [{"id": "FRENZ-001", "name": "FRENZ Band", "rssi": -45}]
@@ -125,36 +251,56 @@ class DeviceManager:
         self._status = DeviceStatus.SCANNING
 
         try:
-            if self._scanner is None:
-                self._scanner = Scanner()
-
-            # Perform scan
-            devices = self._scanner.scan()
-            self.logger.info(f"Found {len(devices)} devices")
-
-            # Filter for FRENZ devices only (devices containing "FRENZ" in the name)
-            formatted_devices = []
-            for device in devices:
-                device_str = str(device)
-                # Only include devices that contain "FRENZ" in their name
-                if "FRENZ" in device_str.upper():
-                    formatted_devices.append({
-                        "id": device_str,
-                        "name": "FRENZ Band",
-                        "rssi": -50  # Default RSSI since scanner doesn't provide it
-                    })
-
-            self.logger.info(f"Found {len(formatted_devices)} FRENZ devices")
+            # One scan at a time, reusing the same scanner
+            with self._scanner_lock:
+                if self._scanner is None:
+                    _ensure_nested_loop()
+                    if _accepts(Scanner, "scan_mode"):
+                        self._scanner = Scanner(scan_mode="low_latency")
+                    else:
+                        self._scanner = Scanner()
+
+                # Perform scan
+                self._scan_active = True
+                try:
+                    if timeout is not None and _accepts(type(self._scanner).scan, "timeout"):
+                        devices = self._scanner.scan(timeout=timeout)
+                    else:
+                        devices = self._scanner.scan()
+                finally:
+                    self._scan_active = False
+                    self._stop_scan()
+
+            self.logger.info("Found %d devices", len(devices))
+
+            # Filter for FRENZ devices only (devices containing "FRENZ" in the name).
+            # RSSI is a default since the scanner doesn't provide it
+            formatted_devices = [
+                {"id": s, "name": "FRENZ Band", "rssi": -50}
+                for s in map(str, devices) if _FRENZ_NAME in s.casefold()
+            ]
+
+            self.logger.info("Found %d FRENZ devices", len(formatted_devices))
 
             self._status = DeviceStatus.DISCONNECTED
             return formatted_devices
 
         except Exception as e:
-            self.logger.error(f"Error scanning devices: {e}")
+            self.logger.error("Error scanning devices: %s", e)
             self._status = DeviceStatus.ERROR
             self._last_connection_error = str(e)
             return []
 
+    def _stop_scan(self) -> None:
+        """Stop the scanner if it supports it, since a running scan slows down connecting."""
+        stop = getattr(self._scanner, 'stop', None)
+        if stop is None:
+            return
+        try:
+            stop()
+        except Exception as e:
+            self.logger.debug("Error stopping scanner (non-fatal): %s", e)
+
     def load_env_devices(self) -> Dict:
         """
         Load device configuration from environment variables.
@@ -164,45 +310,57 @@ class DeviceManager:
         """
         try:
             device_config = {
-                "device_id": os.getenv("FRENZ_ID"),
-                "product_key": os.getenv("FRENZ_KEY"),
+                "device_id": _ENV_CACHE.get("FRENZ_ID"),
+                "product_key": _ENV_CACHE.get("FRENZ_KEY"),
                 "available": False
             }
 
             # Check if required variables are present
             if device_config["device_id"] and device_config["product_key"]:
                 device_config["available"] = True
-                self.logger.info(f"Loaded device config for {device_config['device_id']}")
+                self.logger.info("Loaded device config for %s", device_config['device_id'])
             else:
                 self.logger.warning("FRENZ_ID or FRENZ_KEY not found in environment")
 
             return device_config
 
         except Exception as e:
-            self.logger.error(f"Error loading environment devices: {e}")
+            self.logger.error("Error loading environment devices: %s", e)
             return {"available": False, "error": str(e)}
 
-    def connect(self, device_id: Optional[str] = None, product_key: Optional[str] = None) -> Optional[Streamer]:
+    def connect(self,
+                device_id: Optional[str] = None,
+                product_key: Optional[str] = None,
+                address: Optional[str] = None,
+                timeout: Optional[float] = None) -> Optional[Streamer]:
         """
         Establish connection to a FRENZ device.
 
         Args:
             device_id: Device identifier (uses env var if None)
             product_key: Product key for authentication (uses env var if None)
+            address: Known BLE address of the device, to connect without scanning for it first
+            timeout: Maximum time in seconds to wait for data (connection_timeout if None)
 
         Returns:
             Streamer instance if successful, None otherwise
         """
-        self.logger.info(f"Attempting to connect to device: {device_id}")
+        if timeout is None:
+            timeout = self.connection_timeout
+        self.logger.info("Attempting to connect to device: %s", device_id)
         self._status = DeviceStatus.CONNECTING
         self._last_connection_error = None
 
+        # Don't compete with a scan for the radio
+        if self._scan_active:
+            self._stop_scan()
+
         try:
             # Use environment variables if not provided
             if device_id is None:
-                device_id = os.getenv("FRENZ_ID")
+                device_id = _ENV_CACHE.get("FRENZ_ID")
             if product_key is None:
-                product_key = os.getenv("FRENZ_KEY")
+                product_key = _ENV_CACHE.get("FRENZ_KEY")
 
             if not device_id or not product_key:
                 raise ValueError("Device ID and product key are required")
@@ -213,45 +371,57 @@ class DeviceManager:
 
             # Create new streamer instance
             # Store Streamer's internal data in data/frenz_streamer_temp to keep it organized
-            from pathlib import Path
-            streamer_temp_dir = Path("./data/frenz_streamer_temp")
-            streamer_temp_dir.mkdir(parents=True, exist_ok=True)
+            if not DeviceManager._streamer_temp_dir_ready:
+                self.STREAMER_TEMP_DIR.mkdir(parents=True, exist_ok=True)
+                DeviceManager._streamer_temp_dir_ready = True
+
+            _ensure_nested_loop()
+            self._streamer = self._create_streamer(device_id, product_key, str(self.STREAMER_TEMP_DIR), address)
 
-            self._streamer = Streamer(
-                device_id=device_id,
-                product_key=product_key,
-                data_folder=str(streamer_temp_dir),
-                turn_off_light=self.light_off
-            )
+            # Safety net in case the manager is dropped without disconnect();
+            # only holds the streamer, not self
+            self._streamer_finalizer = weakref.finalize(self, _cleanup_streamer, self._streamer)
 
             # Start connection with timeout
-            start_time = time.time()
-            self._streamer.start()
-
-            # Wait for connection to establish
-            while time.time() - start_time < self.connection_timeout:
-                # Check if we have data flowing (indicates successful connection)
-                if hasattr(self._streamer, 'DATA') and self._streamer.DATA:
-                    self._status = DeviceStatus.CONNECTED
-                    self._connected_device = {
-                        "id": device_id,
-                        "product_key": product_key,
-                        "connected_at": time.time()
-                    }
-                    self.logger.info(f"Successfully connected to device {device_id}")
-                    return self._streamer
-
-                time.sleep(0.5)
+            start_time = time.monotonic()
+            with _BLE_CONNECT_SLOTS:
+                self._streamer.start()
+
+            # Wait for connection to establish, i.e. data flowing
+            self._data_ready.clear()
+            self._data_watch_stop = threading.Event()
+            threading.Thread(
+                target=self._watch_for_data,
+                args=(self._streamer, start_time, timeout, self._data_watch_stop),
+                name="DeviceManager-DataWatch",
+                daemon=True
+            ).start()
+
+            if self._data_ready.wait(timeout):
+                self._status = DeviceStatus.CONNECTED
+                self._connected_device = {
+                    "id": device_id,
+                    "product_key": product_key,
+                    "address": getattr(self._streamer, 'address', None) or address,
+                    "connected_at": time.time(),
+                    "connected_at_mono": time.monotonic()
+                }
+                self._last_eeg_len = 0
+                self._last_eeg_newest = None
+                self.logger.info("Successfully connected to device %s", device_id)
+                return self._streamer
 
             # Connection timeout
-            raise TimeoutError(f"Connection timeout after {self.connection_timeout} seconds")
+            raise TimeoutError(f"Connection timeout after {timeout:.1f} seconds")
 
         except Exception as e:
-            self.logger.error(f"Connection failed: {e}")
+            self.logger.error("Connection failed: %s", e)
             self._status = DeviceStatus.ERROR
             self._last_connection_error = str(e)
 
             # Clean up failed connection
+            self._data_watch_stop.set()
+            self._detach_finalizer()
             if self._streamer:
                 try:
                     self._streamer.stop()
@@ -261,6 +431,65 @@ class DeviceManager:
 
             return None
 
+    def _create_streamer(self,
+                         device_id: str,
+                         product_key: str,
+                         data_folder: str,
+                         address: Optional[str] = None) -> Streamer:
+        """Create a Streamer, skipping its device scan when the address is already known and supported."""
+        kwargs = {
+            "device_id": device_id,
+            "product_key": product_key,
+            "data_folder": data_folder,
+            "turn_off_light": self.light_off
+        }
+
+        if address and _takes_known_address():
+            return Streamer(**kwargs, address=address, prescan=False)
+        return Streamer(**kwargs)
+
+    def _fast_connect(self, device_id: str, product_key: str, address: Optional[str]) -> Optional[Streamer]:
+        """
+        Reconnect to a known address, falling back to a regular connect() if that fails.
+
+        Both attempts share one connection_timeout: the fast one gets half of
+        it and the regular one whatever is left.
+        """
+        deadline = time.monotonic() + self.connection_timeout
+        if address and _takes_known_address():
+            streamer = self.connect(device_id, product_key, address=address, timeout=self.connection_timeout / 2)
+            if streamer:
+                return streamer
+            self.logger.info("Fast reconnect failed, scanning for the device")
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            self.logger.warning("No time left to scan for the device")
+            return None
+        return self.connect(device_id, product_key, timeout=remaining)
+
+    def _detach_finalizer(self) -> None:
+        """Cancel the cleanup safety net once the streamer is stopped explicitly."""
+        if self._streamer_finalizer is not None:
+            self._streamer_finalizer.detach()
+            self._streamer_finalizer = None
+
+    def _watch_for_data(self, streamer: Streamer, start_time: float, timeout: float,
+                        stop: threading.Event) -> None:
+        """
+        Set the data-ready event as soon as the streamer has data.
+
+        The SDK has no callback for its first samples, so this checks every
+        DATA_CHECK_INTERVAL until the timeout, or until a failed connect() or
+        disconnect() sets stop.
+        """
+        while time.monotonic() - start_time < timeout:
+            if _has_data(streamer):
+                self._data_ready.set()
+                return
+            if stop.wait(self.DATA_CHECK_INTERVAL):
+                return
+
     def disconnect(self) -> bool:
         """
         Cleanly disconnect from the current device.
@@ -272,18 +501,20 @@ class DeviceManager:
             self.logger.info("Starting disconnect process...")
 
             # Stop reconnect thread first
-            self._stop_reconnect = True
+            self._stop_event.set()
             if self._reconnect_thread and self._reconnect_thread.is_alive():
                 self.logger.info("Waiting for reconnect thread to stop...")
                 self._reconnect_thread.join(timeout=2.0)
 
             # Stop the streamer
+            self._data_watch_stop.set()
+            self._detach_finalizer()
             if self._streamer:
                 self.logger.info("Stopping streamer...")
                 try:
                     self._streamer.stop()
                 except Exception as e:
-                    self.logger.warning(f"Error stopping streamer (non-fatal): {e}")
+                    self.logger.warning("Error stopping streamer (non-fatal): %s", e)
                 finally:
                     self._streamer = None
 
@@ -295,7 +526,7 @@ class DeviceManager:
             return True
 
         except Exception as e:
-            self.logger.error(f"Error during disconnection: {e}", exc_info=True)
+            self.logger.error("Error during disconnection: %s", e, exc_info=True)
             # Force cleanup even on error
             self._streamer = None
             self._connected_device = None
@@ -311,22 +542,24 @@ class DeviceManager:
         """
         return self._status
 
-    def get_status_info(self) -> Dict:
+    def get_status_info(self, include_duration: bool = False) -> Dict:
         """
         Get detailed status information.
 
+        Args:
+            include_duration: Whether to add "connection_duration" while connected
+
         Returns:
             Dictionary with detailed status information
         """
-        info = {
-            "status": self._status.value,
-            "connected_device": self._connected_device,
-            "last_error": self._last_connection_error,
-            "has_streamer": self._streamer is not None
-        }
+        info = self._STATUS_INFO_TEMPLATE.copy()
+        info["status"] = self._status.value
+        info["connected_device"] = self._connected_device
+        info["last_error"] = self._last_connection_error
+        info["has_streamer"] = self._streamer is not None
 
-        if self._connected_device:
-            info["connection_duration"] = time.time() - self._connected_device["connected_at"]
+        if include_duration and self._connected_device:
+            info["connection_duration"] = time.monotonic() - self._connected_device["connected_at_mono"]
 
         return info
 
@@ -347,7 +580,7 @@ class DeviceManager:
             self.logger.info("Reconnection already in progress")
             return False
 
-        self._stop_reconnect = False
+        self._stop_event.clear()
         self._reconnect_thread = threading.Thread(target=self._reconnect_worker)
         self._reconnect_thread.daemon = True
         self._reconnect_thread.start()
@@ -358,28 +591,28 @@ class DeviceManager:
         """Background worker for automatic reconnection with exponential backoff."""
         device_id = self._connected_device["id"]
         product_key = self._connected_device["product_key"]
+        address = self._connected_device.get("address")
 
         for attempt in range(self.reconnect_attempts):
-            if self._stop_reconnect:
+            if self._stop_event.is_set():
                 break
 
-            self.logger.info(f"Reconnection attempt {attempt + 1}/{self.reconnect_attempts}")
+            self.logger.info("Reconnection attempt %d/%d", attempt + 1, self.reconnect_attempts)
 
-            # Exponential backoff: 2^attempt seconds
-            wait_time = min(2 ** attempt, 30)  # Cap at 30 seconds
+            # Exponential backoff: 2^attempt seconds, capped at 30 and jittered
+            # by +-50% so several clients don't retry in lockstep
+            wait_time = min(2 ** attempt, 30) * random.uniform(0.5, 1.5)
 
-            if attempt > 0:  # Don't wait on first attempt
-                for _ in range(wait_time):
-                    if self._stop_reconnect:
-                        return
-                    time.sleep(1)
+            # Don't wait on first attempt; stop right away if disconnect() is called
+            if attempt > 0 and self._stop_event.wait(wait_time):
+                return
 
             # Attempt reconnection
-            if self.connect(device_id, product_key):
+            if self._fast_connect(device_id, product_key, address):
                 self.logger.info("Reconnection successful")
                 return
 
-        self.logger.error(f"Failed to reconnect after {self.reconnect_attempts} attempts")
+        self.logger.error("Failed to reconnect after %d attempts", self.reconnect_attempts)
         self._status = DeviceStatus.ERROR
 
     def is_connected(self) -> bool:
@@ -394,10 +627,51 @@ class DeviceManager:
         """Get information about the currently connected device."""
         return self._connected_device.copy() if self._connected_device else None
 
+    def wait_for_scores(self,
+                        previous: Optional[Dict[str, Any]] = None,
+                        timeout: float = 5.0) -> Optional[Dict[str, Any]]:
+        """
+        Wait until the streamer publishes scores that differ from a snapshot.
+
+        An entry counts as new when it is missing from ``previous`` or its
+        value differs (see same_score). Checks every DATA_CHECK_INTERVAL
+        seconds.
+
+        Args:
+            previous: Snapshot returned by the previous call (None waits for any scores)
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            Snapshot of the streamer's SCORES (arrays copied, so later in-place
+            updates are detected), or None on timeout or without a connected
+            streamer
+        """
+        previous = previous or {}
+        deadline = time.monotonic() + timeout
+        while True:
+            streamer = self.get_streamer()
+            scores = getattr(streamer, 'SCORES', None)
+            if scores is None:
+                return None
+
+            # One copy per check, so a key can't vanish between lookups
+            snapshot = dict(scores)
+            for key, value in snapshot.items():
+                if value is not None and not same_score(value, previous.get(key)):
+                    return {key: copy.copy(value) for key, value in snapshot.items()}
+
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(self.DATA_CHECK_INTERVAL)
+
     def check_connection_health(self) -> bool:
         """
         Check if the current connection is healthy.
 
+        The connection counts as healthy while EEG samples keep arriving: the
+        buffer grew or its newest sample changed since the previous check.
+        Checks less than a second apart can't tell and pass.
+
         Returns:
             True if connection is healthy, False otherwise
         """
@@ -406,18 +680,31 @@ class DeviceManager:
 
         try:
             # Try to access data to verify connection is working
-            if hasattr(self._streamer, 'DATA') and self._streamer.DATA:
-                # Check if we're getting recent data
-                eeg_data = self._streamer.DATA.get("RAW", {}).get("EEG")
-                if eeg_data is not None and len(eeg_data) > 0:
-                    return True
+            if _has_data(self._streamer):
+                # Check if we're getting recent data (size rather than len() for NumPy arrays)
+                eeg_data = self._streamer.DATA["RAW"].get("EEG")
+                if eeg_data is not None:
+                    now = time.monotonic()
+                    n_samples = getattr(eeg_data, 'shape', (len(eeg_data),))[0]
+                    newest = np.array(eeg_data[-1]) if n_samples else None
+                    healthy = n_samples > 0 and (
+                        n_samples > self._last_eeg_len
+                        or not np.array_equal(newest, self._last_eeg_newest)
+                        or now - self._last_eeg_check_mono < 1.0
+                    )
+
+                    self._last_eeg_len = n_samples
+                    self._last_eeg_newest = newest
+                    self._last_eeg_check_mono = now
+                    if healthy:
+                        return True
 
             # If we can't verify data flow, consider connection unhealthy
             self.logger.warning("Connection appears unhealthy - no data flow detected")
             return False
 
         except Exception as e:
-            self.logger.error(f"Error checking connection health: {e}")
+            self.logger.error("Error checking connection health: %s", e)
             return False
 
     def toggle_light(self, light_on: bool) -> Dict:
@@ -434,7 +721,7 @@ class DeviceManager:
             Dictionary with status information
         """
         self.light_off = not light_on
-        self.logger.info(f"Light setting changed to: {'ON' if light_on else 'OFF'}")
+        self.logger.info("Light setting changed to: %s", 'ON' if light_on else 'OFF')
 
         result = {
             "light_on": light_on,
@@ -449,16 +736,8 @@ class DeviceManager:
 
         return result
 
-    def __del__(self):
-        """Cleanup on object destruction."""
-        try:
-            if self._streamer:
-                try:
-                    self._streamer.stop()
-                except:
-                    pass
-                self._streamer = None
-            self._connected_device = None
-            self._status = DeviceStatus.DISCONNECTED
-        except:
-            pass
\ No newline at end of file
+    def __enter__(self) -> "DeviceManager":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.disconnect()
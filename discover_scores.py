@@ -8,11 +8,16 @@ import sys
 import os
 import time
 
+import numpy as np
+
 # Suppress TensorFlow warnings
 os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'
 
 from frenz_collector import FrenzCollector
 
+# The main scores we expect the device to compute
+_EXPECTED = frozenset({'focus_score', 'alpha', 'beta', 'poas', 'sqc_scores'})
+
 def main():
     print("\n" + "="*70)
     print("FRENZ SCORES DISCOVERY TOOL")
@@ -43,41 +48,41 @@ def main():
     # Monitor SCORES over time
     seen_keys = set()
     max_wait = 60  # Wait up to 60 seconds
+    interval = 0.25  # Poll quickly at first, backing off to every 2 seconds
     start = time.time()
 
     while time.time() - start < max_wait:
-        current_keys = set(streamer.SCORES.keys())
-        new_keys = current_keys - seen_keys
-
-        if new_keys:
-            for key in sorted(new_keys):
+        # Snapshot the keys once per tick, SCORES is updated while we read it
+        for key in list(streamer.SCORES):
+            if key not in seen_keys:
+                seen_keys.add(key)
                 print(f"   ✓ Found new score: {key}")
-            seen_keys = current_keys
 
         # Check if we have the main scores we expect
-        expected = {'focus_score', 'alpha', 'beta', 'poas', 'sqc_scores'}
-        if expected.issubset(seen_keys):
+        if _EXPECTED <= seen_keys:
             print("\n✅ All expected scores are now available!")
             break
 
-        time.sleep(2)
+        time.sleep(interval)
+        interval = min(interval * 1.5, 2.0)
 
     elapsed = time.time() - start
     print(f"\n⏱️  Monitoring complete ({elapsed:.1f}s elapsed)")
 
     # Display final results
-    all_keys = sorted(streamer.SCORES.keys())
+    snapshot = dict(streamer.SCORES)
+    all_keys = sorted(snapshot.keys())
 
     print("\n" + "="*70)
     print(f"AVAILABLE SCORES METRICS ({len(all_keys)} total)")
     print("="*70)
 
     for key in all_keys:
-        value = streamer.SCORES.get(key)
+        value = snapshot[key]
         type_name = type(value).__name__
         shape_info = ""
 
-        if hasattr(value, 'shape'):
+        if isinstance(value, np.ndarray):
             shape_info = f" shape={value.shape}"
         elif hasattr(value, '__len__') and not isinstance(value, str):
             shape_info = f" len={len(value)}"
@@ -9,12 +9,88 @@ manual event annotation during data collection sessions.
 import os
 import csv
 import json
+import math
 import time
+import queue
+import atexit
 import logging
 import threading
+import weakref
+from array import array
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Any
 from datetime import datetime
+from json.encoder import encode_basestring
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Flushes file data without the metadata where the platform supports it
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+# Decoder for events files (orjson when it is installed)
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Nanoseconds a float timestamp in seconds can be off by around the current
+# epoch; bisecting on nanoseconds widens time ranges by this much before the
+# exact comparison in seconds
+_NS_SLACK = 1_000
+
+# Largest timestamp in seconds whose nanoseconds fit the int64 column
+_MAX_TIMESTAMP = 9.2e9
+
+
+@lru_cache(maxsize=256)
+def _iso_second(seconds: int) -> str:
+    """Format whole seconds since the epoch as local ISO 8601 date and time."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(seconds))
+
+
+def _iso_time(timestamp: float) -> str:
+    """
+    Format a Unix timestamp the way events record it.
+
+    Same result as datetime.fromtimestamp(timestamp).isoformat() + "Z", but
+    the date and time part is only formatted once per second.
+    """
+    fraction, seconds = math.modf(timestamp)
+    microseconds = round(fraction * 1e6)
+    if microseconds >= 1_000_000:
+        seconds += 1
+        microseconds -= 1_000_000
+    elif microseconds < 0:
+        seconds -= 1
+        microseconds += 1_000_000
+
+    if microseconds:
+        return f"{_iso_second(int(seconds))}.{microseconds:06d}Z"
+    return _iso_second(int(seconds)) + "Z"
+
+
+def _encode_line(event: Dict[str, Any]) -> bytes:
+    """Encode an event as one UTF-8 JSON Lines record (with orjson when it is installed)."""
+    if orjson is not None:
+        return orjson.dumps(event) + b"\n"
+    return (json.dumps(event, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+# Loggers that may still have unsaved events when the interpreter exits
+_LIVE_LOGGERS = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_loggers() -> None:
+    """Save pending events and close every live EventLogger at interpreter exit."""
+    for event_logger in list(_LIVE_LOGGERS):
+        event_logger.close()
 
 
 class EventLogger:
@@ -25,34 +101,83 @@ class EventLogger:
     - Event logging with precise timestamps (unix and ISO format)
     - Category support (subjective, stimulus, response, other)
     - Thread-safe operations for concurrent access
-    - Save to JSON file with proper formatting
+    - Append-only JSON Lines event file, one event per line
     - Export capabilities (CSV format)
     - Filtering by time range
     - Session management and metadata tracking
+
+    With auto_save, log_event() does no file I/O: a writer thread saves the
+    events AUTO_SAVE_DELAY seconds after the first unsaved one, or as soon as
+    AUTO_SAVE_BATCH events are pending. flush() writes them immediately.
+
+    Saving only appends the events logged since the previous save to
+    events.jsonl and syncs the file data to disk. The file is only rewritten
+    (to a temporary file, then atomically renamed) by checkpoint() and after
+    clear_events(). Session metadata is written to events_info.json by close().
+
+    Events are stored column-wise (timestamps, category codes, descriptions)
+    and only turned into dictionaries for the events a caller asks for.
+    Timestamps are kept as integer nanoseconds from time.time_ns() and turned
+    into float seconds when events are read or saved.
+
+    With lazy_load, events already in an existing events.jsonl are only
+    counted when the logger is created, and read the first time a method
+    needs them (get_events(), get_session_info(), exports, ...). Logging and
+    appending new events never reads them.
     """
 
+    # Event categories, in the order of their codes
+    CATEGORIES = ("subjective", "stimulus", "response", "other")
+
+    # Coalescing of auto-saves
+    AUTO_SAVE_DELAY = 0.1
+    AUTO_SAVE_BATCH = 32
+
+    # Seconds without events after which the auto-save writer thread exits
+    WRITER_IDLE_TIMEOUT = 5.0
+
     def __init__(self,
                  session_id: Optional[str] = None,
                  data_dir: Union[str, Path] = "./data",
-                 auto_save: bool = True):
+                 auto_save: bool = True,
+                 lazy_load: bool = True):
         """
         Initialize the EventLogger instance.
 
         Args:
             session_id: Unique session identifier. If None, generates one based on current time
             data_dir: Directory to store event files
-            auto_save: Whether to automatically save events to file after each log
+            auto_save: Whether to automatically save events to file after logging
+            lazy_load: Whether to defer reading existing events until they are needed
         """
         self.data_dir = Path(data_dir)
         self.auto_save = auto_save
+        self.lazy_load = lazy_load
         self.session_id = session_id or self._generate_session_id()
 
-        # Thread-safe event storage
-        self._events: List[Dict[str, Any]] = []
-        self._lock = threading.RLock()
+        # Thread-safe event storage. _lock only guards the in-memory state and
+        # is held briefly; file writes are serialized by _write_lock instead
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._clear_rows()
+
+        # Events logged since the last save, and the writer thread that saves
+        # them (started on demand, see _writer_loop())
+        self._pending_count = 0
+        self._writeq: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=8)
+        self._writer: Optional[threading.Thread] = None
+
+        # Open events file, number of events already in it, and whether it
+        # has to be rewritten from scratch (after clear_events() or checkpoint())
+        self._events_fp = None
+        self._flushed_index = 0
+        self._needs_rewrite = False
+
+        # Events at the start of the events file that are not loaded yet (lazy_load)
+        self._unloaded = 0
 
         # Valid event categories
-        self.valid_categories = {"subjective", "stimulus", "response", "other"}
+        self.valid_categories = set(self.CATEGORIES)
 
         # Session metadata
         self.session_start_time = time.time()
@@ -65,7 +190,9 @@ class EventLogger:
         self.session_dir.mkdir(parents=True, exist_ok=True)
 
         # File paths
-        self.events_file = self.session_dir / "events.json"
+        self.events_file = self.session_dir / "events.jsonl"
+        self.legacy_events_file = self.session_dir / "events.json"
+        self.info_file = self.session_dir / "events_info.json"
 
         # Configure logging
         self.logger = logging.getLogger(__name__)
@@ -73,27 +200,192 @@ class EventLogger:
         # Load existing events if file exists
         self._load_existing_events()
 
+        _LIVE_LOGGERS.add(self)
+
     def _generate_session_id(self) -> str:
         """Generate a session ID based on current timestamp."""
         return datetime.now().strftime("%Y%m%d_%H%M%S")
 
     def _load_existing_events(self) -> None:
         """Load existing events from file if it exists."""
+        if self.events_file.exists() and self.lazy_load:
+            try:
+                count = self._count_saved_events()
+            except OSError as e:
+                self.logger.error(f"Error counting existing events: {e}")
+                count = None
+            if count is not None:
+                self._unloaded = count
+                self.logger.info(f"Found {count} existing events")
+                return
+
         if self.events_file.exists():
             try:
+                skipped = 0
                 with open(self.events_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if isinstance(data, dict) and 'events' in data:
-                        self._events = data['events']
-                    elif isinstance(data, list):
-                        self._events = data
-                    else:
-                        self.logger.warning(f"Invalid events file format: {self.events_file}")
-                        self._events = []
-                self.logger.info(f"Loaded {len(self._events)} existing events")
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            event = _json_loads(line)
+                        except json.JSONDecodeError:
+                            event = None
+                        if not self._load_event(event):
+                            skipped += 1
+
+                self._flushed_index = len(self._ts)
+                if skipped:
+                    # E.g. a line cut short by a crash; rewrite the file on the next save
+                    self.logger.warning(f"Skipped {skipped} unreadable events in {self.events_file}")
+                    self._flushed_index = 0
+                    self._needs_rewrite = True
+                self.logger.info(f"Loaded {len(self._ts)} existing events")
+            except (FileNotFoundError, IOError) as e:
+                self.logger.error(f"Error loading existing events: {e}")
+                self._clear_rows()
+
+        elif self.legacy_events_file.exists():
+            # Events saved as a single JSON document are appended to the
+            # JSON Lines file on the next save
+            try:
+                with open(self.legacy_events_file, 'rb') as f:
+                    data = _json_loads(f.read())
+                if isinstance(data, dict) and 'events' in data:
+                    events = data['events']
+                elif isinstance(data, list):
+                    events = data
+                else:
+                    self.logger.warning(f"Invalid events file format: {self.legacy_events_file}")
+                    events = []
+
+                skipped = sum(not self._load_event(event) for event in events)
+                if skipped:
+                    self.logger.warning(f"Skipped {skipped} unreadable events in {self.legacy_events_file}")
+                self.logger.info(f"Loaded {len(self._ts)} existing events")
             except (json.JSONDecodeError, FileNotFoundError, IOError) as e:
                 self.logger.error(f"Error loading existing events: {e}")
-                self._events = []
+                self._clear_rows()
+
+    def _count_saved_events(self) -> Optional[int]:
+        """
+        Count the lines of the events file without parsing them.
+
+        Returns:
+            Number of events, or None if the file does not end with a complete
+            line and has to be loaded (and repaired) right away
+        """
+        with open(self.events_file, 'rb') as f:
+            count = 0
+            last = b"\n"
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                count += chunk.count(b"\n")
+                last = chunk[-1:]
+        return count if last == b"\n" else None
+
+    def _ensure_loaded(self) -> None:
+        """Read the events that lazy_load left in the file, ahead of the ones logged since."""
+        if not self._unloaded:
+            return
+
+        # The write lock keeps save_events() from moving _flushed_index meanwhile
+        with self._write_lock, self._lock:
+            count = self._unloaded
+            if not count:
+                return
+            self._unloaded = 0
+
+            try:
+                with open(self.events_file, 'r', encoding='utf-8') as f:
+                    lines = list(islice(f, count))
+            except (FileNotFoundError, IOError) as e:
+                self.logger.error(f"Error loading existing events: {e}")
+                return
+
+            recent = list(zip(self._ts, (self._category_names[code] for code in self._cat), self._desc))
+            self._clear_rows()
+            skipped = 0
+            for line in lines:
+                try:
+                    event = _json_loads(line)
+                except json.JSONDecodeError:
+                    event = None
+                if not self._load_event(event):
+                    skipped += 1
+            loaded = len(self._ts)
+            for timestamp, category, description in recent:
+                self._append_row(timestamp, category, description)
+
+            if skipped:
+                self.logger.warning(f"Skipped {skipped} unreadable events in {self.events_file}")
+                self._flushed_index = 0
+                self._needs_rewrite = True
+            elif not self._needs_rewrite:
+                self._flushed_index += loaded
+            self.logger.info(f"Loaded {loaded} existing events")
+
+    def _load_event(self, event: Any) -> bool:
+        """Append an event read from file, if it has a numeric timestamp and text fields."""
+        if not isinstance(event, dict):
+            return False
+
+        timestamp = event.get("timestamp")
+        description = event.get("description")
+        category = event.get("category")
+        if (not isinstance(timestamp, (int, float)) or isinstance(timestamp, bool)
+                or not isinstance(description, str) or not isinstance(category, str)):
+            return False
+        if not abs(timestamp) < _MAX_TIMESTAMP:
+            return False  # NaN, infinite, or out of range for nanoseconds
+
+        self._append_row(round(timestamp * 1e9), category, description)
+        return True
+
+    def _clear_rows(self) -> None:
+        """Reset the event columns to empty (lock held)."""
+        self._ts = array('q')
+        self._cat = array('B')
+        self._desc: List[str] = []
+        self._category_names: List[str] = list(self.CATEGORIES)
+        self._category_codes = {name: code for code, name in enumerate(self._category_names)}
+        self._category_counts = [0] * len(self._category_names)
+
+        # Timestamps can be bisected while they are in chronological order
+        self._in_order = True
+
+    def _append_row(self, timestamp_ns: int, category: str, description: str) -> None:
+        """Append one event to the columns (lock held)."""
+        code = self._category_codes.get(category)
+        if code is None:
+            # Unknown categories only come from files; kept so validation can report them
+            code = len(self._category_names)
+            self._category_names.append(category)
+            self._category_codes[category] = code
+            self._category_counts.append(0)
+
+        if self._ts and timestamp_ns < self._ts[-1]:
+            # E.g. a wall-clock jump backwards; fall back to scanning
+            self._in_order = False
+
+        self._ts.append(timestamp_ns)
+        self._cat.append(code)
+        self._desc.append(description)
+        self._category_counts[code] += 1
+
+    def _make_events(self, timestamps_ns, codes, descriptions) -> List[Dict[str, Any]]:
+        """Build event dictionaries from column values."""
+        names = self._category_names
+        session_id = self.session_id
+        return [
+            {
+                "timestamp": timestamp,
+                "iso_time": _iso_time(timestamp),
+                "description": description,
+                "category": names[code],
+                "session_id": session_id
+            }
+            for timestamp, code, description in zip(
+                (timestamp_ns / 1e9 for timestamp_ns in timestamps_ns), codes, descriptions)
+        ]
 
     def log_event(self,
                   description: str,
@@ -122,33 +414,40 @@ class EventLogger:
             raise ValueError(f"Category must be one of: {self.valid_categories}")
 
         # Generate precise timestamp
-        timestamp = time.time()
-        iso_time = datetime.fromtimestamp(timestamp).isoformat() + "Z"
+        timestamp_ns = time.time_ns()
+        timestamp = timestamp_ns / 1e9
+        description = description.strip()
+
+        # Thread-safe addition to the event columns
+        with self._lock:
+            self._append_row(timestamp_ns, category, description)
+            event_count = len(self._ts) + self._unloaded
+
+            # Auto-save if enabled, coalescing events logged in quick succession
+            job = None
+            if self.auto_save:
+                self._pending_count += 1
+                if self._pending_count == 1:
+                    job = "save"
+                elif self._pending_count == self.AUTO_SAVE_BATCH:
+                    job = "now"
+                if job is not None:
+                    if self._writer is None:
+                        self._start_writer()
+                    try:
+                        self._writeq.put_nowait(job)
+                    except queue.Full:
+                        pass  # The writer has jobs queued and will save these events too
 
-        # Create event record
-        event = {
+        self.logger.info(f"Event logged: {description} [{category}] (Total: {event_count})")
+        return {
             "timestamp": timestamp,
-            "iso_time": iso_time,
-            "description": description.strip(),
+            "iso_time": _iso_time(timestamp),
+            "description": description,
             "category": category,
             "session_id": self.session_id
         }
 
-        # Thread-safe addition to events list
-        with self._lock:
-            self._events.append(event)
-            event_count = len(self._events)
-
-        # Auto-save if enabled
-        if self.auto_save:
-            try:
-                self.save_events()
-            except Exception as e:
-                self.logger.error(f"Auto-save failed: {e}")
-
-        self.logger.info(f"Event logged: {description} [{category}] (Total: {event_count})")
-        return event.copy()
-
     def get_events(self,
                    start_time: Optional[float] = None,
                    end_time: Optional[float] = None,
@@ -164,58 +463,226 @@ class EventLogger:
         Returns:
             List of event dictionaries matching the filters
         """
+        if category is not None and category not in self.valid_categories:
+            raise ValueError(f"Category must be one of: {self.valid_categories}")
+
+        self._ensure_loaded()
+        with self._lock:
+            in_order = self._in_order
+            lo, hi = 0, len(self._ts)
+            if in_order:
+                # Slice (a little more than) the time range out of the chronological columns
+                if start_time is not None:
+                    lo = bisect_left(self._ts, math.floor(start_time * 1e9) - _NS_SLACK)
+                if end_time is not None:
+                    hi = bisect_right(self._ts, math.ceil(end_time * 1e9) + _NS_SLACK)
+            timestamps = self._ts[lo:hi]
+            codes = self._cat[lo:hi]
+            descriptions = self._desc[lo:hi]
+
+        # Filter the copied columns with NumPy masks, comparing the same
+        # float seconds the events report
+        mask = None
+        if start_time is not None or end_time is not None:
+            ts = np.frombuffer(timestamps, dtype=np.int64) / 1e9
+            mask = np.ones(len(ts), dtype=bool)
+            if start_time is not None:
+                mask &= ts >= start_time
+            if end_time is not None:
+                mask &= ts <= end_time
+
+        if category is not None:
+            category_mask = np.frombuffer(codes, dtype=np.uint8) == self._category_codes[category]
+            mask = category_mask if mask is None else mask & category_mask
+
+        if mask is not None:
+            rows = np.flatnonzero(mask)
+            timestamps = np.frombuffer(timestamps, dtype=np.int64)[rows].tolist()
+            codes = np.frombuffer(codes, dtype=np.uint8)[rows].tolist()
+            descriptions = [descriptions[row] for row in rows]
+
+        return self._make_events(timestamps, codes, descriptions)
+
+    def _start_writer(self) -> None:
+        """Start the background thread for auto-saves (lock held)."""
+        self._writer = threading.Thread(
+            target=self._writer_loop,
+            args=(self._writeq,),
+            name=f"EventLogger-{self.session_id}",
+            daemon=True
+        )
+        self._writer.start()
+
+    def _writer_loop(self, writeq: "queue.Queue[Optional[str]]") -> None:
+        """
+        Background thread that saves pending events when log_event() asks for it.
+
+        A "save" job waits up to AUTO_SAVE_DELAY for more events before saving,
+        "now" saves right away and None stops the thread. The thread also exits
+        after WRITER_IDLE_TIMEOUT seconds without jobs; log_event() starts a new
+        one when needed.
+        """
+        while True:
+            try:
+                job = writeq.get(timeout=self.WRITER_IDLE_TIMEOUT)
+            except queue.Empty:
+                with self._lock:
+                    # log_event() queues jobs under the lock, so none can be missed
+                    if writeq.empty() and self._writer is threading.current_thread():
+                        self._writer = None
+                        return
+                continue
+
+            if job == "save":
+                # Give events logged in quick succession time to join this save
+                try:
+                    job = writeq.get(timeout=self.AUTO_SAVE_DELAY)
+                except queue.Empty:
+                    pass
+
+            if self._pending_count:
+                self._drain()
+            if job is None:
+                break
+
+    def _stop_writer(self) -> None:
+        """Stop the writer thread once it has saved the events queued so far."""
         with self._lock:
-            events = self._events.copy()
+            writer, self._writer = self._writer, None
+            writeq = self._writeq
+            if writer is not None:
+                # A writer started after this one gets its own queue
+                self._writeq = queue.Queue(maxsize=8)
+        if writer is not None and writer.is_alive():
+            writeq.put(None, timeout=5)
+            writer.join(timeout=5)
+
+    def _drain(self) -> None:
+        """Save the pending events."""
+        with self._lock:
+            self._pending_count = 0
 
-        # Apply time filtering
-        if start_time is not None:
-            events = [e for e in events if e["timestamp"] >= start_time]
+        try:
+            self.save_events()
+        except Exception as e:
+            self.logger.error(f"Auto-save failed: {e}")
 
-        if end_time is not None:
-            events = [e for e in events if e["timestamp"] <= end_time]
+    def flush(self) -> None:
+        """Save events logged since the last auto-save right away."""
+        if self._pending_count:
+            self._drain()
 
-        # Apply category filtering
-        if category is not None:
-            if category not in self.valid_categories:
-                raise ValueError(f"Category must be one of: {self.valid_categories}")
-            events = [e for e in events if e["category"] == category]
+    def close(self) -> None:
+        """Save pending events and the session metadata, and close the events file."""
+        self._stop_writer()
+        self.flush()
 
-        return events
+        with self._write_lock:
+            if self._events_fp is not None:
+                self._events_fp.close()
+                self._events_fp = None
+
+        self._save_session_info()
+
+    def checkpoint(self) -> bool:
+        """
+        Rewrite the events file from the in-memory events and save the session metadata.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        self._ensure_loaded()
+        with self._lock:
+            self._flushed_index = 0
+            self._needs_rewrite = True
+        return self.save_events() and self._save_session_info()
 
     def save_events(self) -> bool:
         """
-        Write events to JSON file.
+        Append events logged since the last save to the JSON Lines file.
 
         Returns:
             True if successful, False otherwise
         """
+        with self._write_lock:
+            # Take the new events, then encode and write them without holding
+            # up log_event()
+            with self._lock:
+                rewrite = self._needs_rewrite
+                self._needs_rewrite = False
+                start = self._flushed_index
+                flushed_index = len(self._ts)
+                new_rows = (self._ts[start:], self._cat[start:], self._desc[start:])
+
+            try:
+                new_events = self._make_events(*new_rows)
+
+                data = b"".join(map(_encode_line, new_events))
+                if rewrite:
+                    self._rewrite_events_file(data)
+                else:
+                    if self._events_fp is None:
+                        self._events_fp = open(self.events_file, 'ab', buffering=1 << 16)
+                    if data:
+                        self._events_fp.write(data)
+                        self._events_fp.flush()
+                        _fdatasync(self._events_fp.fileno())
+
+            except Exception as e:
+                self.logger.error(f"Failed to save events: {e}")
+                with self._lock:
+                    self._needs_rewrite = self._needs_rewrite or rewrite
+                return False
+
+            with self._lock:
+                # Unless clear_events() ran meanwhile and the file starts over
+                if not self._needs_rewrite:
+                    self._flushed_index = flushed_index
+
+        self.logger.debug(f"Events saved to {self.events_file}")
+        return True
+
+    def _rewrite_events_file(self, data: bytes) -> None:
+        """Replace the events file with the given contents (write lock held)."""
+        if self._events_fp is not None:
+            self._events_fp.close()
+            self._events_fp = None
+
+        # Write to temporary file first, then move (atomic operation)
+        temp_file = self.events_file.with_suffix('.tmp')
+        with open(temp_file, 'wb') as f:
+            f.write(data)
+            f.flush()
+            _fdatasync(f.fileno())
+        temp_file.replace(self.events_file)
+
+    def _save_session_info(self) -> bool:
+        """Write session metadata next to the events file."""
         try:
             with self._lock:
-                events_data = {
-                    "session_info": {
-                        "session_id": self.session_id,
-                        "session_start_time": self.session_start_time,
-                        "session_start_iso": datetime.fromtimestamp(self.session_start_time).isoformat() + "Z",
-                        "total_events": len(self._events),
-                        "last_updated": time.time(),
-                        "last_updated_iso": datetime.now().isoformat() + "Z"
-                    },
-                    "events": self._events.copy()
+                session_info = {
+                    "session_id": self.session_id,
+                    "session_start_time": self.session_start_time,
+                    "session_start_iso": datetime.fromtimestamp(self.session_start_time).isoformat() + "Z",
+                    "total_events": len(self._ts) + self._unloaded,
+                    "last_updated": time.time(),
+                    "last_updated_iso": datetime.now().isoformat() + "Z"
                 }
 
             # Write to temporary file first, then move (atomic operation)
-            temp_file = self.events_file.with_suffix('.tmp')
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(events_data, f, indent=2, ensure_ascii=False)
+            temp_file = self.info_file.with_suffix('.tmp')
+            if orjson is not None:
+                temp_file.write_bytes(orjson.dumps(session_info, option=orjson.OPT_INDENT_2))
+            else:
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(session_info, f, indent=2, ensure_ascii=False)
 
             # Atomic move
-            temp_file.replace(self.events_file)
-
-            self.logger.debug(f"Events saved to {self.events_file}")
+            temp_file.replace(self.info_file)
             return True
 
         except Exception as e:
-            self.logger.error(f"Failed to save events: {e}")
+            self.logger.error(f"Failed to save session info: {e}")
             return False
 
     def export_events(self,
@@ -244,6 +711,8 @@ class EventLogger:
         if format not in ["csv", "json"]:
             raise ValueError("Format must be 'csv' or 'json'")
 
+        self.flush()
+
         # Get filtered events
         events = self.get_events(start_time, end_time, category)
 
@@ -270,13 +739,11 @@ class EventLogger:
 
     def _export_csv(self, events: List[Dict[str, Any]], output_path: Path) -> None:
         """Export events to CSV format."""
-        with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['timestamp', 'iso_time', 'description', 'category', 'session_id']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-
-            writer.writeheader()
-            for event in events:
-                writer.writerow(event)
+        fieldnames = ['timestamp', 'iso_time', 'description', 'category', 'session_id']
+        with open(output_path, 'w', newline='', buffering=1 << 20, encoding='utf-8') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            writer.writerows([event[name] for name in fieldnames] for event in events)
 
     def _export_json(self, events: List[Dict[str, Any]], output_path: Path) -> None:
         """Export events to JSON format."""
@@ -290,8 +757,31 @@ class EventLogger:
             "events": events
         }
 
+        if orjson is not None:
+            output_path.write_bytes(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
+            return
+
+        # The event schema is fixed, so rows are filled into a template instead
+        # of going through the generic encoder. Descriptions are the only free
+        # text; categories and session IDs repeat and are encoded once each.
+        encoded = {}
+
+        def enc(value: str) -> str:
+            text = encoded.get(value)
+            if text is None:
+                text = encoded[value] = encode_basestring(value)
+            return text
+
+        rows = ",\n    ".join([
+            f'{{"timestamp": {event["timestamp"]!r}, "iso_time": "{event["iso_time"]}", '
+            f'"description": {encode_basestring(event["description"])}, '
+            f'"category": {enc(event["category"])}, "session_id": {enc(event["session_id"])}}}'
+            for event in events
+        ])
+        header = json.dumps(export_data["export_info"], indent=2, ensure_ascii=False).replace("\n", "\n  ")
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+            f.write(f'{{\n  "export_info": {header},\n  "events": [\n    {rows}\n  ]\n}}\n'
+                    if events else f'{{\n  "export_info": {header},\n  "events": []\n}}\n')
 
     def clear_events(self, confirm: bool = False) -> bool:
         """
@@ -308,12 +798,15 @@ class EventLogger:
             return False
 
         with self._lock:
-            event_count = len(self._events)
-            self._events.clear()
+            event_count = len(self._ts) + self._unloaded
+            self._clear_rows()
+            self._unloaded = 0
+            self._flushed_index = 0
+            self._needs_rewrite = True
 
         # Save empty state if auto-save is enabled
         if self.auto_save:
-            self.save_events()
+            self._drain()
 
         self.logger.info(f"Cleared {event_count} events")
         return True
@@ -321,7 +814,7 @@ class EventLogger:
     def get_event_count(self) -> int:
         """Get the current number of logged events."""
         with self._lock:
-            return len(self._events)
+            return len(self._ts) + self._unloaded
 
     def get_session_info(self) -> Dict[str, Any]:
         """
@@ -330,11 +823,12 @@ class EventLogger:
         Returns:
             Dictionary containing session metadata and statistics
         """
+        self._ensure_loaded()
         with self._lock:
-            event_count = len(self._events)
+            event_count = len(self._ts)
             if event_count > 0:
-                first_event_time = self._events[0]["timestamp"]
-                last_event_time = self._events[-1]["timestamp"]
+                first_event_time = self._ts[0] / 1e9
+                last_event_time = self._ts[-1] / 1e9
                 event_duration = last_event_time - first_event_time
             else:
                 first_event_time = None
@@ -342,9 +836,10 @@ class EventLogger:
                 event_duration = 0
 
             # Count events by category
-            category_counts = {}
-            for category in self.valid_categories:
-                category_counts[category] = sum(1 for e in self._events if e["category"] == category)
+            category_counts = {
+                category: self._category_counts[self._category_codes[category]]
+                for category in self.valid_categories
+            }
 
         return {
             "session_id": self.session_id,
@@ -371,8 +866,13 @@ class EventLogger:
         Returns:
             List of recent event dictionaries
         """
+        if count > len(self._ts):
+            self._ensure_loaded()
         with self._lock:
-            return self._events[-count:] if self._events else []
+            if not self._ts:
+                return []
+            rows = (self._ts[-count:], self._cat[-count:], self._desc[-count:])
+        return self._make_events(*rows)
 
     def validate_event_integrity(self) -> Dict[str, Any]:
         """
@@ -383,35 +883,32 @@ class EventLogger:
         """
         issues = []
 
+        # Every stored event has all fields and a numeric timestamp; events
+        # that don't are skipped when loading
+        # The category counts and the chronological order flag are kept up to
+        # date on every append, so the columns are only copied to locate
+        # events with an invalid category
+        self._ensure_loaded()
         with self._lock:
-            events = self._events.copy()
-
-        # Check for required fields
-        required_fields = {"timestamp", "iso_time", "description", "category", "session_id"}
-        for i, event in enumerate(events):
-            missing_fields = required_fields - set(event.keys())
-            if missing_fields:
-                issues.append(f"Event {i}: Missing fields {missing_fields}")
-
-            # Check timestamp validity
-            if "timestamp" in event:
-                try:
-                    float(event["timestamp"])
-                except (ValueError, TypeError):
-                    issues.append(f"Event {i}: Invalid timestamp")
-
-            # Check category validity
-            if "category" in event and event["category"] not in self.valid_categories:
-                issues.append(f"Event {i}: Invalid category '{event['category']}'")
+            event_count = len(self._ts)
+            in_order = self._in_order
+            names = list(self._category_names)
+            invalid = any(self._category_counts[len(self.CATEGORIES):])
+            codes = self._cat[:] if invalid else None
+
+        # Check category validity (codes past CATEGORIES were loaded from file)
+        if codes is not None:
+            codes = np.frombuffer(codes, dtype=np.uint8)
+            for i in np.flatnonzero(codes >= len(self.CATEGORIES)):
+                issues.append(f"Event {i}: Invalid category '{names[codes[i]]}'")
 
         # Check chronological order
-        timestamps = [e.get("timestamp", 0) for e in events if "timestamp" in e]
-        if timestamps != sorted(timestamps):
+        if not in_order:
             issues.append("Events are not in chronological order")
 
         return {
             "is_valid": len(issues) == 0,
-            "event_count": len(events),
+            "event_count": event_count,
             "issues": issues,
             "validation_time": time.time()
         }
@@ -6,18 +6,26 @@ It integrates DeviceManager, DataStorage, and EventLogger to provide a unified i
 for recording sessions with real-time data collection, processing, and storage.
 """
 
+import copy
 import os
+import sys
 import time
 import json
 import logging
 import threading
-from typing import Dict, List, Optional, Union, Any
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union, Any
 from pathlib import Path
 from datetime import datetime
 import numpy as np
 
-from device_manager import DeviceManager, DeviceStatus
-from data_storage import DataStorage
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from device_manager import DeviceManager, DeviceStatus, same_score
+from data_storage import DataStorage, SCORE_DTYPE, MISSING_SCORES
 from event_logger import EventLogger
 from config import config
 
@@ -27,6 +35,19 @@ class FrenzCollectorError(Exception):
     pass
 
 
+# dataclass(slots=True) is only available on Python 3.10+
+_STATS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_STATS_OPTIONS)
+class _SessionStats:
+    """Data collection statistics, updated by the worker on every tick."""
+    samples_collected: int = 0
+    errors_count: int = 0
+    last_data_time: Optional[float] = None
+    data_types_seen: Set[str] = field(default_factory=set)
+
+
 class FrenzCollector:
     """
     Main orchestrator for FRENZ data collection.
@@ -41,6 +62,57 @@ class FrenzCollector:
     - Comprehensive error handling and recovery
     """
 
+    # Worker polling interval: POLL_INTERVAL while the streamer delivers new
+    # data, doubling up to MAX_POLL_INTERVAL while it doesn't
+    POLL_INTERVAL = 0.01
+    MAX_POLL_INTERVAL = 0.2
+
+    # Delay before retrying after a failed tick, doubling up to MAX_ERROR_DELAY
+    # while ticks keep failing and reset once data is stored again
+    ERROR_DELAY = 0.1
+    MAX_ERROR_DELAY = 5.0
+
+    # Streamer raw data buffers and the datasets they are stored in
+    _RAW_STREAMS = (("EEG", "raw/eeg"), ("IMU", "raw/imu"), ("PPG", "raw/ppg"))
+
+    # Nominal sample rate (Hz) of each raw buffer, for spacing sample timestamps
+    _SAMPLE_RATES = {"EEG": 125, "IMU": 50, "PPG": 25}
+
+    # Device timestamps further than this (seconds) from the host clock are
+    # not taken to be Unix time
+    _DEVICE_CLOCK_TOLERANCE = 60.0
+
+    # Minimum seconds between error log messages from the collection worker
+    ERROR_LOG_INTERVAL = 1.0
+
+    # Score callbacks get every current score again after this many seconds
+    # without a change, so listeners sampling them (e.g. the dashboard plots)
+    # keep getting points while a score holds steady
+    SCORE_REPEAT_INTERVAL = 1.0
+
+    # Single value streamer scores and their field in the "scores/all" record
+    _SCORES_MAP = (
+        ("focus_score", "focus"),
+        ("poas", "poas"),
+        ("posture", "posture"),
+        ("sleep_stage", "sleep_stage"),
+        ("hr", "hr"),  # Heart rate (BPM)
+        ("spo2", "spo2"),  # Blood oxygen saturation (%)
+    )
+
+    # Numeric codes for the posture strings
+    _POSTURE_MAP = {"upright": 1, "slouching": 2, "unknown": 0}
+
+    # Power band scores and their datasets
+    _POWER_BANDS = ("alpha", "beta", "gamma", "theta", "delta")
+    _POWER_DATASETS = {band: f"power_bands/{band}" for band in _POWER_BANDS}
+
+    # Streamer SCORES keys stored in the "scores/all" record
+    _SCALAR_SCORE_KEYS = frozenset(key for key, _ in _SCORES_MAP)
+
+    # Streamer SCORES keys that process_scores() stores
+    SAVED_SCORE_KEYS = _SCALAR_SCORE_KEYS.union(("sqc_scores",), _POWER_BANDS)
+
     def __init__(self,
                  device_id: Optional[str] = None,
                  product_key: Optional[str] = None,
@@ -74,6 +146,7 @@ class FrenzCollector:
         self.data_dir = Path(data_dir) if data_dir else config.storage["data_dir"]
         self.buffer_size_minutes = buffer_size_minutes
         self.auto_save_interval = auto_save_interval
+        self.worker_cpu: Optional[int] = config.device.get("worker_cpu")
 
         # Initialize core components
         self.device_manager = DeviceManager(
@@ -90,20 +163,39 @@ class FrenzCollector:
         self.is_recording = False
         self.session_id: Optional[str] = None
         self.session_start_time: Optional[float] = None
+        self._session_start_ns: Optional[int] = None  # monotonic clock, for durations
 
         # Worker thread management
         self._data_worker_thread: Optional[threading.Thread] = None
-        self._stop_data_collection = False
-        self._data_collection_lock = threading.RLock()
+        self._stop_event = threading.Event()
+
+        # Rate limiting of the worker's error messages (see _log_worker_error)
+        self._last_error_log = float("-inf")
+        self._suppressed_errors = 0
 
         # Data collection statistics
-        self._stats = {
-            "samples_collected": 0,
-            "errors_count": 0,
-            "last_data_time": None,
-            "data_types_seen": set(),
-            "collection_rate": 0.0
-        }
+        self._stats = _SessionStats()
+
+        # Snapshot of data_types_seen handed out by get_session_stats(), rebuilt
+        # only after the worker has seen a new data type
+        self._data_types: Tuple[str, ...] = ()
+        self._data_types_dirty = False
+
+        # Length and newest row of each streamer raw buffer as last consumed,
+        # so every sample is stored exactly once (see _take_new_rows)
+        self._last_len: Dict[str, int] = {}
+        self._last_row: Dict[str, Optional[np.ndarray]] = {}
+
+        # Reused by process_scores() for array scores; DataStorage copies
+        # appended samples into its own buffers
+        self._sqc_buf = np.empty(4, dtype=np.float32)
+        self._band_buf = np.empty(5, dtype=np.float32)
+        self._score_record = np.empty((), dtype=SCORE_DTYPE)
+
+        # Score listeners (see on_score) and the last value pushed for each key
+        self._score_callbacks: List[Callable[[float, Dict[str, Any]], None]] = []
+        self._last_scores: Dict[str, Any] = {}
+        self._last_scores_push = float("-inf")
 
         self.logger.info("FrenzCollector initialized")
 
@@ -137,6 +229,7 @@ class FrenzCollector:
 
             self.session_id = session_id
             self.session_start_time = time.time()
+            self._session_start_ns = time.monotonic_ns()
 
             # Connect to device (or use existing connection)
             if self.device_manager.is_connected():
@@ -154,7 +247,9 @@ class FrenzCollector:
             self.storage = DataStorage(
                 data_dir=self.data_dir,
                 buffer_size_minutes=self.buffer_size_minutes,
-                auto_save_interval=self.auto_save_interval
+                auto_save_interval=self.auto_save_interval,
+                compression=config.storage["compression"],
+                compression_level=config.storage["compression_level"]
             )
 
             if not self.storage.initialize_session(self.session_id):
@@ -174,6 +269,11 @@ class FrenzCollector:
 
             # Reset statistics
             self._reset_stats()
+            self._last_scores = {}
+            self._last_scores_push = float("-inf")
+
+            # Samples buffered before the session started are not part of it
+            self._mark_raw_consumed()
 
             # Set recording flag BEFORE starting worker to avoid race condition
             self.is_recording = True
@@ -214,6 +314,7 @@ class FrenzCollector:
                     self.event_logger.log_event("Recording session ended", "other")
                 except Exception as e:
                     self.logger.warning(f"Failed to log end event: {e}")
+                self.event_logger.close()
 
             # Stop data collection worker
             try:
@@ -235,7 +336,7 @@ class FrenzCollector:
 
             # Calculate final statistics
             session_end_time = time.time()
-            duration = session_end_time - (self.session_start_time or session_end_time)
+            duration = self._session_duration()
 
             # Create comprehensive session summary
             final_summary = {
@@ -243,10 +344,10 @@ class FrenzCollector:
                 "start_time": self.session_start_time,
                 "end_time": session_end_time,
                 "duration_seconds": duration,
-                "samples_collected": self._stats["samples_collected"],
-                "errors_count": self._stats["errors_count"],
-                "data_types_collected": list(self._stats["data_types_seen"]),
-                "average_collection_rate": self._stats["collection_rate"],
+                "samples_collected": self._stats.samples_collected,
+                "errors_count": self._stats.errors_count,
+                "data_types_collected": list(self._stats.data_types_seen),
+                "average_collection_rate": self._collection_rate(duration),
                 "storage_summary": session_summary,
                 "event_count": self.event_logger.get_event_count() if self.event_logger else 0
             }
@@ -255,12 +356,13 @@ class FrenzCollector:
             self.is_recording = False
             self.session_id = None
             self.session_start_time = None
+            self._session_start_ns = None
             self.streamer = None
             self.storage = None
             self.event_logger = None
 
             self.logger.info(f"Recording session completed successfully")
-            self.logger.info(f"Duration: {duration:.1f}s, Samples: {self._stats['samples_collected']}")
+            self.logger.info(f"Duration: {duration:.1f}s, Samples: {self._stats.samples_collected}")
 
             return final_summary
 
@@ -277,6 +379,27 @@ class FrenzCollector:
 
             return {"error": str(e), "traceback": str(e)}
 
+    def _pin_worker_thread(self) -> None:
+        """
+        Pin the calling (worker) thread to the configured CPU, if any.
+
+        Keeping the worker on one core avoids migrations between polls. This is
+        opt-in via FRENZ_WORKER_CPU and only supported where the OS provides
+        sched_setaffinity (Linux); failures are logged and otherwise ignored.
+        """
+        cpu = self.worker_cpu
+        if cpu is None:
+            return
+        if not hasattr(os, "sched_setaffinity"):
+            self.logger.warning("CPU pinning is not supported on this platform, ignoring FRENZ_WORKER_CPU")
+            return
+        try:
+            # On Linux, pid 0 applies the mask to the calling thread only
+            os.sched_setaffinity(0, {cpu})
+            self.logger.info("Data collection worker pinned to CPU %d", cpu)
+        except OSError as e:  # includes PermissionError
+            self.logger.warning("Could not pin data collection worker to CPU %d: %s", cpu, e)
+
     def collect_data_worker(self) -> None:
         """
         Main loop for data collection in worker thread.
@@ -285,144 +408,357 @@ class FrenzCollector:
         from the streamer, processes it, and stores it via the storage system.
         """
         self.logger.info("Data collection worker started")
+        self._pin_worker_thread()
 
-        last_stats_update = time.time()
-        stats_interval = 30  # Update stats every 30 seconds
+        poll_interval = self.POLL_INTERVAL
+        error_delay = self.ERROR_DELAY
 
         try:
-            while not self._stop_data_collection and self.is_recording:
+            while not self._stop_event.is_set() and self.is_recording:
                 try:
+                    # Resolve the session objects once per tick
+                    streamer = self.streamer
+                    storage = self.storage
+                    if not streamer or not storage:
+                        if self._stop_event.wait(self.MAX_POLL_INTERVAL):
+                            break
+                        continue
                     current_time = time.time()
+                    errors_before = self._stats.errors_count
 
                     # Process raw data
-                    self.process_raw_data()
+                    got_data = self._process_raw(streamer, storage, current_time)
 
                     # Process ML scores
-                    self.process_scores()
-
-                    # Update statistics periodically
-                    if current_time - last_stats_update >= stats_interval:
-                        self._update_collection_stats()
-                        last_stats_update = current_time
-
-                    # Small sleep to prevent excessive CPU usage
-                    time.sleep(0.01)  # 10ms
+                    got_scores = self._process_scores(streamer, storage, current_time)
+
+                    # Poll again soon while data is arriving, back off while it
+                    # isn't, and further while processing keeps failing
+                    if got_data or got_scores:
+                        poll_interval = self.POLL_INTERVAL
+                        error_delay = self.ERROR_DELAY
+                    elif self._stats.errors_count != errors_before:
+                        poll_interval = error_delay
+                        error_delay = min(error_delay * 2, self.MAX_ERROR_DELAY)
+                    else:
+                        poll_interval = min(poll_interval * 2, self.MAX_POLL_INTERVAL)
+                    if self._stop_event.wait(poll_interval):
+                        break
 
                 except Exception as e:
-                    self.logger.error(f"Error in data collection loop: {e}")
-                    self._stats["errors_count"] += 1
-                    time.sleep(0.1)  # Longer sleep on error
+                    self._log_worker_error("Error in data collection loop", e)
+                    self._stats.errors_count += 1
+                    if self._stop_event.wait(error_delay):
+                        break
+                    error_delay = min(error_delay * 2, self.MAX_ERROR_DELAY)
 
         except Exception as e:
-            self.logger.error(f"Fatal error in data collection worker: {e}")
+            self.logger.error("Fatal error in data collection worker: %s", e)
 
         self.logger.info("Data collection worker stopped")
 
-    def process_raw_data(self) -> None:
-        """Extract and organize raw sensor data from streamer."""
+    def process_raw_data(self) -> bool:
+        """
+        Extract and organize raw sensor data from streamer.
+
+        Returns:
+            bool: True if any samples were stored, False otherwise
+        """
         if not self.streamer or not self.storage:
-            return
+            return False
+        return self._process_raw(self.streamer, self.storage, time.time())
 
+    def _process_raw(self, streamer, storage: DataStorage, current_time: float) -> bool:
+        """
+        Store the raw samples that arrived since the previous tick.
+
+        Args:
+            streamer: Connected FRENZ streamer
+            storage: Storage of the current session
+            current_time: Unix time of the current tick
+
+        Returns:
+            bool: True if any samples were stored, False otherwise
+        """
+        stored = False
+        seen = self._stats.data_types_seen  # Only changes in the first ticks
         try:
-            current_time = time.time()
+            raw = streamer.DATA.get("RAW") or {}
 
             # Process EEG data (actual shape is [N, 7] not [N, 4])
-            eeg_data = self.streamer.DATA.get("RAW", {}).get("EEG")
-            if eeg_data is not None and hasattr(eeg_data, 'shape') and eeg_data.shape[0] > 0:
-                if len(eeg_data.shape) == 2:
-                    latest_eeg = eeg_data[-1, :]  # Get last row (all 7 channels)
-                    self.storage.append_data("raw/eeg", latest_eeg, current_time)
-                    self._stats["samples_collected"] += 1
-                    self._stats["data_types_seen"].add("raw/eeg")
+            eeg_data = raw.get("EEG")
+            if isinstance(eeg_data, np.ndarray) and eeg_data.ndim == 2 and eeg_data.shape[0] > 0:
+                new_eeg = self._take_new_rows("EEG", eeg_data)  # All 7 channels
+                if len(new_eeg):
+                    timestamps = self._raw_timestamps("EEG", new_eeg, current_time)
+                    storage.append_batch("raw/eeg", new_eeg, timestamps)
+                    self._stats.samples_collected += len(new_eeg)
+                    if "raw/eeg" not in seen:
+                        seen.add("raw/eeg")
+                        self._data_types_dirty = True
+                    stored = True
 
             # EOG and EMG are not available in this device/firmware version
             # Skipping as they return None
 
             # Process IMU data (shape is [N, 4] not [N, 3])
-            imu_data = self.streamer.DATA.get("RAW", {}).get("IMU")
-            if imu_data is not None and hasattr(imu_data, 'shape') and imu_data.shape[0] > 0:
-                if len(imu_data.shape) == 2:
-                    latest_imu = imu_data[-1, 1:]  # Skip timestamp, take x,y,z
-                    self.storage.append_data("raw/imu", latest_imu, current_time)
-                    self._stats["data_types_seen"].add("raw/imu")
+            imu_data = raw.get("IMU")
+            if isinstance(imu_data, np.ndarray) and imu_data.ndim == 2 and imu_data.shape[0] > 0:
+                new_imu = self._take_new_rows("IMU", imu_data)
+                if len(new_imu):
+                    # Skip timestamp, take x,y,z
+                    timestamps = self._raw_timestamps("IMU", new_imu, current_time, new_imu[:, 0])
+                    storage.append_batch("raw/imu", new_imu[:, 1:], timestamps)
+                    if "raw/imu" not in seen:
+                        seen.add("raw/imu")
+                        self._data_types_dirty = True
+                    stored = True
 
             # Process PPG data (shape is [N, 4] not [N, 3])
-            ppg_data = self.streamer.DATA.get("RAW", {}).get("PPG")
-            if ppg_data is not None and hasattr(ppg_data, 'shape') and ppg_data.shape[0] > 0:
-                if len(ppg_data.shape) == 2:
-                    latest_ppg = ppg_data[-1, 1:]  # Skip timestamp, take G,R,IR
-                    self.storage.append_data("raw/ppg", latest_ppg, current_time)
-                    self._stats["data_types_seen"].add("raw/ppg")
+            ppg_data = raw.get("PPG")
+            if isinstance(ppg_data, np.ndarray) and ppg_data.ndim == 2 and ppg_data.shape[0] > 0:
+                new_ppg = self._take_new_rows("PPG", ppg_data)
+                if len(new_ppg):
+                    # Skip timestamp, take G,R,IR
+                    timestamps = self._raw_timestamps("PPG", new_ppg, current_time, new_ppg[:, 0])
+                    storage.append_batch("raw/ppg", new_ppg[:, 1:], timestamps)
+                    if "raw/ppg" not in seen:
+                        seen.add("raw/ppg")
+                        self._data_types_dirty = True
+                    stored = True
 
             # Skip filtered data - format is incompatible with storage expectations
             # Filtered EEG is 1D array with variable lengths not divisible by channel count
             # Raw EEG is being collected successfully, so filtered data is not critical
 
-            self._stats["last_data_time"] = current_time
+            if stored:
+                self._stats.last_data_time = current_time
 
         except Exception as e:
-            self.logger.error(f"Error processing raw data: {e}")
-            self._stats["errors_count"] += 1
+            self._log_worker_error("Error processing raw data", e)
+            self._stats.errors_count += 1
+
+        return stored
+
+    def _take_new_rows(self, stream: str, data: np.ndarray) -> np.ndarray:
+        """
+        Get the rows of a streamer raw buffer that were not consumed yet.
+
+        Buffers normally grow as samples arrive. When one did not grow (e.g.
+        it dropped its oldest rows, or was restarted after a reconnect), the
+        rows after the newest one consumed last time are new.
+
+        Args:
+            stream: Raw buffer name ("EEG", "IMU" or "PPG")
+            data: The buffer, shape (N, channels)
+
+        Returns:
+            The new rows (a view into data)
+        """
+        n_rows = data.shape[0]
+        last_len = self._last_len.get(stream, 0)
+        last_row = self._last_row.get(stream)
+
+        if n_rows > last_len:
+            new_rows = data[last_len:]
+        elif last_row is not None and np.array_equal(data[-1], last_row):
+            new_rows = data[n_rows:]
+        else:
+            matches = np.flatnonzero((data == last_row).all(axis=1)) if last_row is not None else ()
+            new_rows = data[matches[-1] + 1:] if len(matches) else data
+
+        self._last_len[stream] = n_rows
+        self._last_row[stream] = data[-1].copy() if n_rows else None
+        return new_rows
+
+    def _raw_timestamps(self, stream: str, rows: np.ndarray, current_time: float,
+                        device_times: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Get Unix timestamps for new rows of a streamer raw buffer.
+
+        Uses the device timestamps that come with the rows when they are Unix
+        time in seconds. Otherwise the rows are spaced at the stream's nominal
+        sample rate, the newest one at the current tick.
+
+        Args:
+            stream: Raw buffer name ("EEG", "IMU" or "PPG")
+            rows: The new rows
+            current_time: Unix time of the current tick
+            device_times: Device timestamp of each row, if the buffer has them
 
-    def process_scores(self) -> None:
-        """Extract ML scores from streamer."""
+        Returns:
+            Timestamp of each row, in seconds
+        """
+        if device_times is not None and abs(device_times[-1] - current_time) < self._DEVICE_CLOCK_TOLERANCE:
+            return device_times
+        return current_time - np.arange(len(rows) - 1, -1, -1) / self._SAMPLE_RATES[stream]
+
+    def _mark_raw_consumed(self) -> None:
+        """Treat everything currently in the streamer raw buffers as consumed."""
+        self._last_len = {}
+        self._last_row = {}
+        raw = self.streamer.DATA.get("RAW", {}) if self.streamer else {}
+        for stream, _ in self._RAW_STREAMS:
+            data = raw.get(stream)
+            if isinstance(data, np.ndarray) and data.ndim == 2:
+                self._take_new_rows(stream, data)
+
+    def process_scores(self) -> bool:
+        """
+        Extract ML scores from streamer.
+
+        Returns:
+            bool: True if any scores were stored, False otherwise
+        """
         if not self.streamer or not self.storage:
-            return
+            return False
+        return self._process_scores(self.streamer, self.storage, time.time())
 
-        try:
-            current_time = time.time()
+    def _process_scores(self, streamer, storage: DataStorage, current_time: float) -> bool:
+        """
+        Store the streamer's ML scores that changed since the previous tick.
 
-            # Process individual scores
-            scores_map = {
-                "focus_score": "scores/focus",
-                "poas": "scores/poas",
-                "posture": "scores/posture",
-                "sleep_stage": "scores/sleep_stage",
-                "sqc_scores": "scores/signal_quality",
-                "hr": "scores/hr",  # Heart rate (BPM)
-                "spo2": "scores/spo2"  # Blood oxygen saturation (%)
-            }
+        Args:
+            streamer: Connected FRENZ streamer
+            storage: Storage of the current session
+            current_time: Unix time of the current tick
 
-            for score_key, dataset_name in scores_map.items():
-                score_value = self.streamer.SCORES.get(score_key)
-                if score_value is not None:
-                    # Handle different score types
-                    if score_key == "sqc_scores":
-                        # Signal quality is array of 4 values
-                        if hasattr(score_value, '__len__') and len(score_value) == 4:
-                            self.storage.append_data(dataset_name, np.array(score_value), current_time)
-                            self._stats["data_types_seen"].add(dataset_name)
-                    else:
-                        # Single value scores - convert to float, handle strings
-                        try:
-                            if isinstance(score_value, str):
-                                # Map string values to numeric for posture
-                                if score_key == "posture":
-                                    posture_map = {"upright": 1, "slouching": 2, "unknown": 0}
-                                    score_value = posture_map.get(score_value.lower(), 0)
-                                else:
-                                    # Skip non-numeric strings
-                                    continue
-                            self.storage.append_data(dataset_name, float(score_value), current_time)
-                            self._stats["data_types_seen"].add(dataset_name)
-                        except (ValueError, TypeError):
-                            # Skip invalid values
-                            pass
+        Returns:
+            bool: True if any scores were stored, False otherwise
+        """
+        stored = False
+        seen = self._stats.data_types_seen  # Only changes in the first ticks
+        try:
+            # One copy per tick, so a key can't vanish between lookups
+            scores = dict(streamer.SCORES)
+            changed = self._changed_scores(scores)
+
+            # Process single value scores into one "scores/all" record, filled
+            # in place (scores that are missing or invalid stay NaN or -1).
+            # A record is only stored when one of them changed.
+            record = self._score_record
+            record[...] = MISSING_SCORES
+            found = False
+            scalar_changed = not self._SCALAR_SCORE_KEYS.isdisjoint(changed)
+            for score_key, field in (self._SCORES_MAP if scalar_changed else ()):
+                score_value = scores.get(score_key)
+                if score_value is None:
+                    continue
+                # Convert to float, handle strings
+                try:
+                    if isinstance(score_value, str):
+                        # Map string values to numeric for posture
+                        if score_key == "posture":
+                            score_value = self._POSTURE_MAP.get(score_value.lower(), 0)
+                        else:
+                            # Skip non-numeric strings
+                            continue
+                    record[field] = float(score_value)
+                    found = True
+                except (ValueError, TypeError, OverflowError):
+                    # Skip invalid values
+                    pass
+
+            if found:
+                storage.append_data("scores/all", record, current_time)
+                if "scores/all" not in seen:
+                    seen.add("scores/all")
+                    self._data_types_dirty = True
+                stored = True
+
+            # Signal quality is array of 4 values
+            sqc_scores = changed.get("sqc_scores")
+            if sqc_scores is not None and hasattr(sqc_scores, '__len__') and len(sqc_scores) == 4:
+                self._sqc_buf[:] = sqc_scores
+                storage.append_data("scores/signal_quality", self._sqc_buf, current_time)
+                if "scores/signal_quality" not in seen:
+                    seen.add("scores/signal_quality")
+                    self._data_types_dirty = True
+                stored = True
 
             # Process power band data
-            power_bands = ["alpha", "beta", "gamma", "theta", "delta"]
-            for band in power_bands:
-                band_data = self.streamer.SCORES.get(band)
+            for band, dataset_name in self._POWER_DATASETS.items():
+                band_data = changed.get(band)
                 if band_data is not None:
                     # Power bands are arrays of 5 values (LF, OTEL, RF, OTER, AVG)
                     if hasattr(band_data, '__len__') and len(band_data) == 5:
-                        dataset_name = f"power_bands/{band}"
-                        self.storage.append_data(dataset_name, np.array(band_data), current_time)
-                        self._stats["data_types_seen"].add(dataset_name)
+                        self._band_buf[:] = band_data
+                        storage.append_data(dataset_name, self._band_buf, current_time)
+                        if dataset_name not in seen:
+                            seen.add(dataset_name)
+                            self._data_types_dirty = True
+                        stored = True
+
+            if self._score_callbacks:
+                self._notify_score_callbacks(current_time, changed, scores)
 
         except Exception as e:
-            self.logger.error(f"Error processing scores: {e}")
-            self._stats["errors_count"] += 1
+            self._log_worker_error("Error processing scores", e)
+            self._stats.errors_count += 1
+
+        return stored
+
+    def _log_worker_error(self, message: str, error: Exception) -> None:
+        """
+        Log an error from the collection worker, at most once per ERROR_LOG_INTERVAL.
+
+        Errors in between are counted and reported with the next message, so
+        a persistently failing streamer doesn't flood the log.
+        """
+        now = time.monotonic()
+        if now - self._last_error_log < self.ERROR_LOG_INTERVAL:
+            self._suppressed_errors += 1
+            return
+
+        self._last_error_log = now
+        if self._suppressed_errors:
+            self.logger.error("%s: %s (%d more errors since the last message)",
+                              message, error, self._suppressed_errors)
+            self._suppressed_errors = 0
+        else:
+            self.logger.error("%s: %s", message, error)
+
+    def on_score(self, callback: Callable[[float, Dict[str, Any]], None]) -> None:
+        """
+        Register a callback for new score values.
+
+        The callback runs in the data collection thread once per collection
+        tick that produced new scores, with the tick timestamp and a dict of
+        the streamer SCORES entries whose value changed since the previous
+        call. While no score changes, it gets all current scores every
+        SCORE_REPEAT_INTERVAL seconds.
+
+        Args:
+            callback: Function taking (timestamp, changed_scores)
+        """
+        self._score_callbacks.append(callback)
+
+    def _changed_scores(self, scores: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the streamer scores whose value changed since the previous tick."""
+        changed = {}
+        for score_key, score_value in scores.items():
+            # Compared by value; copies keep arrays updated in place comparable
+            if score_value is not None and not same_score(score_value, self._last_scores.get(score_key)):
+                changed[score_key] = score_value
+                self._last_scores[score_key] = copy.copy(score_value)
+        return changed
+
+    def _notify_score_callbacks(self, current_time: float, changed: Dict[str, Any],
+                                scores: Dict[str, Any]) -> None:
+        """Push changed streamer scores to the registered callbacks."""
+        if not changed:
+            if current_time - self._last_scores_push < self.SCORE_REPEAT_INTERVAL:
+                return
+            changed = {key: value for key, value in scores.items() if value is not None}
+            if not changed:
+                return
+        self._last_scores_push = current_time
+
+        for callback in self._score_callbacks:
+            try:
+                callback(current_time, changed)
+            except Exception as e:
+                self._log_worker_error("Error in score callback", e)
 
     def get_session_stats(self) -> Dict[str, Any]:
         """
@@ -436,7 +772,7 @@ class FrenzCollector:
 
         try:
             current_time = time.time()
-            duration = current_time - (self.session_start_time or current_time)
+            duration = self._session_duration()
 
             # Get storage stats
             storage_stats = {}
@@ -453,24 +789,20 @@ class FrenzCollector:
                 }
 
             # Get device connection stats
-            device_stats = self.device_manager.get_status_info()
-
-            # Calculate collection rate
-            collection_rate = 0.0
-            if duration > 0:
-                collection_rate = self._stats["samples_collected"] / duration
+            device_stats = self.device_manager.get_status_info(include_duration=True)
 
             return {
                 "status": "recording",
                 "session_id": self.session_id,
                 "duration_seconds": duration,
                 "start_time": self.session_start_time,
-                "samples_collected": self._stats["samples_collected"],
-                "collection_rate_hz": collection_rate,
-                "errors_count": self._stats["errors_count"],
-                "data_types_active": list(self._stats["data_types_seen"]),
-                "last_data_time": self._stats["last_data_time"],
-                "time_since_last_data": current_time - (self._stats["last_data_time"] or current_time),
+                "samples_collected": self._stats.samples_collected,
+                "collection_rate_hz": self._collection_rate(duration),
+                "errors_count": self._stats.errors_count,
+                "data_types_active": self._active_data_types(),
+                "last_data_time": self._stats.last_data_time,
+                "time_since_last_data": current_time - (self._stats.last_data_time or current_time),
+                "bytes_written": storage_stats.get("bytes_written", 0),
                 "device_status": device_stats,
                 "storage_stats": storage_stats,
                 "event_stats": event_stats
@@ -508,7 +840,7 @@ class FrenzCollector:
         Get recent data for visualization.
 
         Args:
-            data_type: Type of data to retrieve (e.g., "scores/focus")
+            data_type: Type of data to retrieve (e.g., "scores/all")
             seconds: Number of seconds of recent data to retrieve
 
         Returns:
@@ -523,8 +855,8 @@ class FrenzCollector:
         """Check if device is connected and data is flowing."""
         return (self.device_manager.is_connected() and
                 self.is_recording and
-                self._stats["last_data_time"] is not None and
-                time.time() - self._stats["last_data_time"] < 10)  # Data within last 10 seconds
+                self._stats.last_data_time is not None and
+                time.time() - self._stats.last_data_time < 10)  # Data within last 10 seconds
 
     def get_device_info(self) -> Optional[Dict]:
         """Get information about the connected device."""
@@ -536,8 +868,9 @@ class FrenzCollector:
             if not self.storage or not self.storage.session_path:
                 return
 
+            device_info = self.device_manager.get_device_info() or {}
             metadata = {
-                "device_id": self.device_manager.device_id or "Unknown",
+                "device_id": device_info.get("id") or "Unknown",
                 "session_start_time": time.time(),
                 "imu_calibration": None,
                 "device_configuration": {
@@ -553,12 +886,15 @@ class FrenzCollector:
             if self.streamer and hasattr(self.streamer, 'SCORES'):
                 imu_cal = self.streamer.SCORES.get('imu_calibration')
                 if imu_cal is not None:
-                    metadata["imu_calibration"] = list(imu_cal)
+                    metadata["imu_calibration"] = np.asarray(imu_cal, dtype=float).tolist()
 
             # Save to device_config.json
             config_path = self.storage.session_path / "device_config.json"
-            with open(config_path, 'w') as f:
-                json.dump(metadata, f, indent=2)
+            if orjson is not None:
+                config_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+            else:
+                with open(config_path, 'w') as f:
+                    json.dump(metadata, f, indent=2)
 
             self.logger.info(f"Device metadata saved to {config_path}")
 
@@ -571,7 +907,7 @@ class FrenzCollector:
             self.logger.warning("Data worker thread already running")
             return
 
-        self._stop_data_collection = False
+        self._stop_event.clear()
         self._data_worker_thread = threading.Thread(
             target=self.collect_data_worker,
             name="FrenzCollector-DataWorker",
@@ -582,7 +918,7 @@ class FrenzCollector:
 
     def _stop_data_worker(self) -> None:
         """Stop the data collection worker thread."""
-        self._stop_data_collection = True
+        self._stop_event.set()
 
         if self._data_worker_thread and self._data_worker_thread.is_alive():
             self.logger.info("Stopping data collection worker...")
@@ -595,20 +931,29 @@ class FrenzCollector:
 
     def _reset_stats(self) -> None:
         """Reset collection statistics."""
-        self._stats = {
-            "samples_collected": 0,
-            "errors_count": 0,
-            "last_data_time": None,
-            "data_types_seen": set(),
-            "collection_rate": 0.0
-        }
-
-    def _update_collection_stats(self) -> None:
-        """Update collection statistics."""
-        if self.session_start_time:
-            duration = time.time() - self.session_start_time
-            if duration > 0:
-                self._stats["collection_rate"] = self._stats["samples_collected"] / duration
+        self._stats = _SessionStats()
+        self._data_types = ()
+        self._data_types_dirty = False
+
+    def _active_data_types(self) -> Tuple[str, ...]:
+        """Data types stored so far this session, rebuilt only when one was added."""
+        if self._data_types_dirty:
+            # Clear the flag first so a type added meanwhile marks it dirty again
+            self._data_types_dirty = False
+            self._data_types = tuple(self._stats.data_types_seen)
+        return self._data_types
+
+    def _session_duration(self) -> float:
+        """Seconds since the session started, measured on the monotonic clock."""
+        if self._session_start_ns is None:
+            return 0.0
+        return (time.monotonic_ns() - self._session_start_ns) / 1e9
+
+    def _collection_rate(self, duration: float) -> float:
+        """Average EEG samples per second over ``duration`` seconds."""
+        if duration > 0:
+            return self._stats.samples_collected / duration
+        return 0.0
 
     def _cleanup_failed_start(self) -> None:
         """Cleanup after failed recording start."""
@@ -625,10 +970,39 @@ class FrenzCollector:
             self.is_recording = False
             self.session_id = None
             self.session_start_time = None
+            self._session_start_ns = None
 
         except Exception as e:
             self.logger.error(f"Error during cleanup: {e}")
 
+    def reset_for_next_session(self) -> bool:
+        """
+        Clear per-session state so the collector can record another session.
+
+        The device connection is kept, so the next start_recording() reuses it.
+
+        Returns:
+            bool: True if the collector was reset, False if it is still recording
+        """
+        if self.is_recording:
+            self.logger.warning("Cannot reset while a recording session is active")
+            return False
+
+        self._reset_stats()
+        self._last_scores = {}
+        self._last_scores_push = float("-inf")
+        self._last_len = {}
+        self._last_row = {}
+        self._last_error_log = float("-inf")
+        self._suppressed_errors = 0
+        self.session_id = None
+        self.session_start_time = None
+        self._session_start_ns = None
+        self.streamer = None
+        self.storage = None
+        self.event_logger = None
+        return True
+
     def __del__(self):
         """Cleanup on object destruction."""
         try:
@@ -639,6 +1013,12 @@ class FrenzCollector:
                 self.logger.error(f"Error in destructor: {e}")
 
 
+# Collector shared by quick_recording_session() calls, so repeated sessions
+# reuse its device connection instead of reconnecting every time
+_shared_collector: Optional[FrenzCollector] = None
+_shared_collector_lock = threading.Lock()
+
+
 # Convenience function for quick recording sessions
 def quick_recording_session(duration_seconds: int = 300,
                           device_id: Optional[str] = None,
@@ -646,6 +1026,9 @@ def quick_recording_session(duration_seconds: int = 300,
     """
     Start a quick recording session for a specified duration.
 
+    Sessions run one at a time on a shared collector, which keeps the device
+    connected between calls.
+
     Args:
         duration_seconds: Recording duration in seconds (default: 5 minutes)
         device_id: Device to connect to (uses default if None)
@@ -654,8 +1037,26 @@ def quick_recording_session(duration_seconds: int = 300,
     Returns:
         Dictionary containing session summary
     """
-    collector = FrenzCollector()
-
+    global _shared_collector
+
+    with _shared_collector_lock:
+        collector = _shared_collector
+        if collector is None:
+            collector = _shared_collector = FrenzCollector()
+        else:
+            collector.reset_for_next_session()
+            # A connection to another device can't be reused
+            info = collector.device_manager.get_device_info()
+            if device_id and info and info.get("id") not in (None, device_id):
+                collector.device_manager.disconnect()
+        return _run_quick_session(collector, duration_seconds, device_id, session_id)
+
+
+def _run_quick_session(collector: FrenzCollector,
+                       duration_seconds: int,
+                       device_id: Optional[str],
+                       session_id: Optional[str]) -> Dict[str, Any]:
+    """Record one quick_recording_session() session on the given collector."""
     try:
         # Start recording
         if not collector.start_recording(device_id=device_id, session_id=session_id):
@@ -7,14 +7,17 @@ This should be run while the device is connected and streaming.
 import sys
 import time
 
-# Import the collector - it should already be connected in another session
-from frenz_collector import FrenzCollector
+from inspect_utils import snapshot_scores, summarize_scores
 
 def main():
     print("=" * 70)
     print("INSPECTING ALL AVAILABLE SCORES FROM FRENZ DEVICE")
     print("=" * 70)
 
+    # Import the collector - it should already be connected in another session.
+    # Imported here because it pulls in the FRENZ SDK and TensorFlow
+    from frenz_collector import FrenzCollector
+
     collector = FrenzCollector()
 
     if not collector.device_manager.is_connected():
@@ -39,29 +42,14 @@ def main():
 
     print("\n✅ Connected to device, reading SCORES...\n")
 
-    # Get all keys
-    all_keys = sorted(streamer.SCORES.keys())
+    # Take one snapshot of all scores
+    snapshot = snapshot_scores(streamer)
+    all_keys = snapshot.keys()
 
     print(f"Found {len(all_keys)} total SCORES keys:\n")
 
     # Categorize by type
-    scalars = []
-    arrays = []
-
-    for key in all_keys:
-        value = streamer.SCORES.get(key)
-
-        # Determine type and shape
-        type_name = type(value).__name__
-
-        if hasattr(value, 'shape'):
-            shape_str = f"shape={value.shape}"
-            arrays.append((key, type_name, shape_str, value))
-        elif hasattr(value, '__len__') and not isinstance(value, str):
-            length_str = f"len={len(value)}"
-            arrays.append((key, type_name, length_str, value))
-        else:
-            scalars.append((key, type_name, value))
+    scalars, arrays = summarize_scores(snapshot)
 
     # Display scalars
     print("SCALAR VALUES:")
@@ -74,12 +62,11 @@ def main():
     print("-" * 70)
     for key, type_name, shape_str, value in arrays:
         print(f"  {key:25s} : {type_name:10s} {shape_str:15s}")
-        # Show first few values if array
-        if hasattr(value, '__len__'):
-            if len(value) <= 5:
-                print(f"    → values: {list(value)}")
-            else:
-                print(f"    → values: {list(value[:5])}... (showing first 5)")
+        # Show first few values
+        if len(value) <= 5:
+            print(f"    → values: {list(value)}")
+        else:
+            print(f"    → values: {list(value[:5])}... (showing first 5)")
 
     print("\n" + "=" * 70)
     print(f"SUMMARY: {len(scalars)} scalars, {len(arrays)} arrays")
@@ -87,14 +74,11 @@ def main():
 
     # Check what's currently being saved
     print("\nCURRENTLY SAVED in frenz_collector.py:")
-    currently_saved = [
-        "focus_score", "poas", "posture", "sleep_stage", "sqc_scores",
-        "alpha", "beta", "gamma", "theta", "delta"
-    ]
-    print(f"  {', '.join(currently_saved)}")
+    currently_saved = FrenzCollector.SAVED_SCORE_KEYS
+    print(f"  {', '.join(sorted(currently_saved))}")
 
     # Find what's missing
-    missing = set(all_keys) - set(currently_saved)
+    missing = all_keys - currently_saved
     if missing:
         print(f"\n⚠️  NOT CURRENTLY SAVED ({len(missing)} metrics):")
         for key in sorted(missing):
@@ -2,24 +2,29 @@
 """
 Inspect streamer temp data to find all available channels.
 """
+import os
 import sys
-from pathlib import Path
-from frenztoolkit.reader import load_experiment
 
-# Load most recent streamer data
-streamer_dir = Path("data/frenz_streamer_temp")
-folders = sorted(streamer_dir.glob("*"), key=lambda x: x.stat().st_mtime, reverse=True)
+# Load most recent streamer data (one pass, no sort)
+streamer_dir = "data/frenz_streamer_temp"
+latest = None
+if os.path.isdir(streamer_dir):
+    with os.scandir(streamer_dir) as entries:
+        latest = max((e for e in entries if not e.name.startswith('.')),
+                     key=lambda e: e.stat().st_mtime, default=None)
 
-if not folders:
+if latest is None:
     print("No streamer data found")
     sys.exit(1)
 
-latest = folders[0]
 print(f"Loading: {latest.name}")
 print("=" * 70)
 
 try:
-    data = load_experiment(str(latest))
+    # Imported only once there is something to load
+    from frenztoolkit.reader import load_experiment
+
+    data = load_experiment(latest.path)
 
     print("\n📊 DATA Keys:")
     print("-" * 70)
@@ -0,0 +1,70 @@
+"""
+Helpers shared by the SCORES inspection scripts.
+
+The streamer's SCORES dict is updated by the SDK's own thread, so the scripts
+take one snapshot of it and describe the snapshot, rather than listing the
+keys and looking each one up again (a key could be gone by then).
+"""
+
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+# Score values reported with their length rather than their value
+_SEQUENCE_TYPES = frozenset((list, tuple))
+
+
+def snapshot_scores(streamer) -> Dict[str, Any]:
+    """
+    Copy a streamer's SCORES in one step.
+
+    Args:
+        streamer: Connected FRENZ streamer
+
+    Returns:
+        Shallow copy of the SCORES dict
+    """
+    return dict(streamer.SCORES)
+
+
+def describe_score(value: Any) -> Tuple[str, str]:
+    """
+    Describe a score value for display.
+
+    Args:
+        value: A SCORES entry
+
+    Returns:
+        Tuple of (type name, size info), where the size info is "shape=..." for
+        NumPy arrays, "len=..." for lists and tuples and "" for anything else
+    """
+    value_type = type(value)
+    type_name = value_type.__name__
+    if value_type is np.ndarray:
+        return type_name, f"shape={value.shape}"
+    if value_type in _SEQUENCE_TYPES:
+        return type_name, f"len={len(value)}"
+    return type_name, ""
+
+
+def summarize_scores(snapshot: Dict[str, Any]) -> Tuple[List[Tuple[str, str, Any]],
+                                                        List[Tuple[str, str, str, Any]]]:
+    """
+    Split a SCORES snapshot into scalar and array entries, sorted by key.
+
+    Args:
+        snapshot: Snapshot from snapshot_scores()
+
+    Returns:
+        Tuple of (scalars, arrays): scalars as (key, type name, value) and
+        arrays as (key, type name, size info, value)
+    """
+    scalars = []
+    arrays = []
+    for key, value in sorted(snapshot.items()):
+        type_name, size_info = describe_score(value)
+        if size_info:
+            arrays.append((key, type_name, size_info, value))
+        else:
+            scalars.append((key, type_name, value))
+    return scalars, arrays
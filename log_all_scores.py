@@ -10,20 +10,17 @@ This will show you what metrics are available.
 """
 @app.cell
 def _(collector):
+    from inspect_utils import describe_score, snapshot_scores
+
     if collector.is_recording:
         streamer = collector.device_manager.get_streamer()
         if streamer and hasattr(streamer, 'SCORES'):
             print("\\n" + "="*70)
             print("ALL AVAILABLE SCORES KEYS:")
             print("="*70)
-            for key in sorted(streamer.SCORES.keys()):
-                value = streamer.SCORES.get(key)
-                type_name = type(value).__name__
-                shape_info = ""
-                if hasattr(value, 'shape'):
-                    shape_info = f" shape={value.shape}"
-                elif hasattr(value, '__len__') and not isinstance(value, str):
-                    shape_info = f" len={len(value)}"
+            for key, value in sorted(snapshot_scores(streamer).items()):
+                type_name, size_info = describe_score(value)
+                shape_info = f" {size_info}" if size_info else ""
                 print(f"  {key:25s} : {type_name}{shape_info}")
             print("="*70 + "\\n")
     return
@@ -0,0 +1,133 @@
+"""
+Ring buffer module for FRENZ data collection system.
+
+This module provides a fixed-capacity buffer of timestamped samples backed by
+preallocated NumPy arrays. Timestamps and values are stored as separate columns
+so plotting and storage code can work on array slices instead of unpacking
+Python tuples.
+"""
+
+from typing import Tuple, Union
+
+import numpy as np
+
+
+class RingBuffer:
+    """
+    Fixed-capacity ring buffer of timestamped samples.
+
+    Timestamps are kept in ``t`` with shape (capacity,) and values in ``v`` with
+    shape (capacity,) for single-channel data or (capacity, channels) for
+    multi-channel data. Once full, each new sample overwrites the oldest one.
+
+    ``version`` is incremented on every change, so readers can tell whether the
+    contents changed since they last looked even after the buffer is full.
+    """
+
+    def __init__(self,
+                 capacity: int,
+                 channels: int = 1,
+                 dtype: Union[str, np.dtype] = np.float64,
+                 time_dtype: Union[str, np.dtype] = np.float64):
+        """
+        Initialize the ring buffer.
+
+        Args:
+            capacity: Maximum number of samples kept
+            channels: Number of values per sample
+            dtype: Data type of the value column
+            time_dtype: Data type of the timestamp column (e.g. int64 for nanosecond counters)
+        """
+        if capacity <= 0:
+            raise ValueError("Ring buffer capacity must be positive")
+
+        self.capacity = capacity
+        self.channels = channels
+        self.t = np.empty(capacity, dtype=time_dtype)
+        self.v = np.empty((capacity,) if channels == 1 else (capacity, channels), dtype=dtype)
+        self.head = 0
+        self.full = False
+        self.version = 0
+
+    def __len__(self) -> int:
+        return self.capacity if self.full else self.head
+
+    def append(self, t: float, value) -> None:
+        """
+        Append one sample.
+
+        Args:
+            t: Sample timestamp
+            value: Sample value (scalar, or sequence of length ``channels``)
+        """
+        head = self.head
+        self.t[head] = t
+        self.v[head] = value
+        head += 1
+        if head == self.capacity:
+            head = 0
+            self.full = True
+        self.head = head
+        self.version += 1
+
+    def extend(self, t: np.ndarray, values: np.ndarray) -> None:
+        """
+        Append several samples at once.
+
+        Args:
+            t: Sample timestamps, shape (n,)
+            values: Sample values, shape (n,) or (n, channels)
+        """
+        n = len(t)
+        capacity = self.capacity
+        if n >= capacity:
+            # Only the newest samples fit
+            self.t[:] = t[n - capacity:]
+            self.v[:] = values[n - capacity:]
+            self.head = 0
+            self.full = True
+            self.version += 1
+            return
+
+        head = self.head
+        first = min(n, capacity - head)
+        self.t[head:head + first] = t[:first]
+        self.v[head:head + first] = values[:first]
+        rest = n - first
+        if rest:
+            # Wrap around to the start of the arrays
+            self.t[:rest] = t[first:]
+            self.v[:rest] = values[first:]
+
+        head += n
+        if head >= capacity:
+            head -= capacity
+            self.full = True
+        self.head = head
+        self.version += 1
+
+    def clear(self) -> None:
+        """Drop all samples (the arrays are kept for reuse)."""
+        self.head = 0
+        self.full = False
+        self.version += 1
+
+    def ordered(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the buffered samples in insertion order.
+
+        Returns views into the buffer until it wraps around, and contiguous
+        copies afterwards.
+
+        Returns:
+            Tuple of (timestamps, values), oldest sample first
+        """
+        head = self.head
+        if not self.full:
+            return self.t[:head], self.v[:head]
+        if head == 0:
+            return self.t, self.v
+        return (
+            np.concatenate((self.t[head:], self.t[:head])),
+            np.concatenate((self.v[head:], self.v[:head])),
+        )
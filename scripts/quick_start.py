@@ -6,6 +6,8 @@ Run this to verify all modules are working correctly
 
 import sys
 import os
+import io
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -38,18 +40,18 @@ def check_imports():
 
     return all_good
 
-def check_env_file():
-    """Check if .env file exists and has required variables"""
-    print("\n🔍 Checking environment configuration...")
+def check_env_file(out=None):
+    """Check if .env file exists and has required variables (output goes to out, stdout by default)"""
+    print("\n🔍 Checking environment configuration...", file=out)
 
     env_path = Path('.env')
     if not env_path.exists():
-        print("⚠️  .env file not found. Creating template...")
+        print("⚠️  .env file not found. Creating template...", file=out)
         with open('.env', 'w') as f:
             f.write("# FRENZ Device Credentials\n")
             f.write("FRENZ_ID=your_device_id_here\n")
             f.write("FRENZ_KEY=your_product_key_here\n")
-        print("📝 Created .env template. Please update with your credentials.")
+        print("📝 Created .env template. Please update with your credentials.", file=out)
         return False
 
     # Check for required variables
@@ -64,28 +66,33 @@ def check_env_file():
             missing.append(var)
 
     if missing:
-        print(f"⚠️  Missing or placeholder values for: {', '.join(missing)}")
-        print("📝 Please update .env file with actual credentials")
+        print(f"⚠️  Missing or placeholder values for: {', '.join(missing)}", file=out)
+        print("📝 Please update .env file with actual credentials", file=out)
         return False
 
-    print("✅ Environment variables configured")
+    print("✅ Environment variables configured", file=out)
     return True
 
-def check_directories():
-    """Ensure required directories exist"""
-    print("\n🔍 Checking directory structure...")
+def check_directories(out=None):
+    """Ensure required directories exist (output goes to out, stdout by default)"""
+    print("\n🔍 Checking directory structure...", file=out)
 
     required_dirs = ['data', 'logs']
     for dir_name in required_dirs:
         dir_path = Path(dir_name)
         if not dir_path.exists():
             dir_path.mkdir(parents=True, exist_ok=True)
-            print(f"📁 Created {dir_name}/ directory")
+            print(f"📁 Created {dir_name}/ directory", file=out)
         else:
-            print(f"✅ {dir_name}/ directory exists")
+            print(f"✅ {dir_name}/ directory exists", file=out)
 
     return True
 
+def _run_captured(check):
+    """Run a check with its output captured, returning (result, output)"""
+    out = io.StringIO()
+    return check(out), out.getvalue()
+
 def test_basic_functionality():
     """Test basic functionality of core modules"""
     print("\n🧪 Testing basic functionality...")
@@ -125,10 +132,15 @@ def main():
     print("🧠 FRENZ Data Collection System - Quick Start")
     print("=" * 60)
 
-    # Run checks
-    imports_ok = check_imports()
-    env_ok = check_env_file()
-    dirs_ok = check_directories()
+    # Run checks; the filesystem checks don't depend on the imports, so they
+    # run alongside them and their output is printed afterwards, in order
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        env_check = pool.submit(_run_captured, check_env_file)
+        dirs_check = pool.submit(_run_captured, check_directories)
+        imports_ok = check_imports()
+        env_ok, env_output = env_check.result()
+        dirs_ok, dirs_output = dirs_check.result()
+    sys.stdout.write(env_output + dirs_output)
 
     if imports_ok and dirs_ok:
         functional_ok = test_basic_functionality()
@@ -7,9 +7,12 @@ import os
 # Suppress TensorFlow warnings
 os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'
 
-from frenz_collector import FrenzCollector
+from inspect_utils import describe_score, snapshot_scores
 
 def main():
+    # Imported here: the collector pulls in the FRENZ SDK and TensorFlow
+    from frenz_collector import FrenzCollector
+
     collector = FrenzCollector()
 
     if not collector.device_manager.is_connected():
@@ -21,43 +24,30 @@ def main():
             return 1
         print("✅ Connected successfully!")
 
-        # Wait a moment for data to start flowing
-        import time
+        # Wait for the first scores (up to 5 seconds)
         print("⏳ Waiting for data stream to initialize...")
-        time.sleep(5)
+        collector.device_manager.wait_for_scores(timeout=5)
 
     streamer = collector.device_manager.get_streamer()
     if not streamer or not hasattr(streamer, 'SCORES'):
         print("❌ No SCORES available")
         return 1
 
-    keys = sorted(streamer.SCORES.keys())
+    snapshot = snapshot_scores(streamer)
 
     print("\n" + "="*70)
-    print(f"AVAILABLE SCORES METRICS ({len(keys)} total)")
+    print(f"AVAILABLE SCORES METRICS ({len(snapshot)} total)")
     print("="*70)
 
-    for key in keys:
-        value = streamer.SCORES.get(key)
-        type_name = type(value).__name__
-        shape_info = ""
-
-        if hasattr(value, 'shape'):
-            shape_info = f" shape={value.shape}"
-        elif hasattr(value, '__len__') and not isinstance(value, str):
-            shape_info = f" len={len(value)}"
-
+    for key, value in sorted(snapshot.items()):
+        type_name, size_info = describe_score(value)
+        shape_info = f" {size_info}" if size_info else ""
         print(f"  {key:25s} : {type_name:10s}{shape_info}")
 
     print("="*70)
 
-    # Show what's currently being saved
-    currently_saved = [
-        "focus_score", "poas", "posture", "sleep_stage", "sqc_scores",
-        "alpha", "beta", "gamma", "theta", "delta"
-    ]
-
-    missing = set(keys) - set(currently_saved)
+    # Show what the collector doesn't save
+    missing = snapshot.keys() - FrenzCollector.SAVED_SCORE_KEYS
     if missing:
         print(f"\n⚠️  NOT CURRENTLY SAVED ({len(missing)} metrics):")
         for key in sorted(missing):
@@ -2,9 +2,12 @@
 """Test script to list all available SCORES metrics from the FRENZ device."""
 
 import time
-from frenz_collector import FrenzCollector
+from inspect_utils import describe_score, snapshot_scores
 
 def main():
+    # Imported here: the collector pulls in the FRENZ SDK and TensorFlow
+    from frenz_collector import FrenzCollector
+
     collector = FrenzCollector()
 
     # Check if device is already connected
@@ -27,27 +30,22 @@ def main():
     print("AVAILABLE SCORES METRICS")
     print("=" * 70)
 
-    all_keys = sorted(streamer.SCORES.keys())
-
-    for key in all_keys:
-        value = streamer.SCORES.get(key)
-        type_str = type(value).__name__
+    snapshot = snapshot_scores(streamer)
 
-        extra_info = ''
-        if hasattr(value, '__len__') and not isinstance(value, str):
-            extra_info = f' (len={len(value)})'
-        if hasattr(value, 'shape'):
-            extra_info = f' shape={value.shape}'
+    for key, value in sorted(snapshot.items()):
+        type_str, size_info = describe_score(value)
 
         # Display value for scalars, indicate array for arrays
-        if hasattr(value, '__len__') and not isinstance(value, str):
+        if size_info:
+            extra_info = f' {size_info}'
             value_display = '[array data]'
         else:
+            extra_info = ''
             value_display = str(value)
 
         print(f"  {key:20s} : {type_str:10s}{extra_info:20s} = {value_display}")
 
-    print(f"\nTotal: {len(all_keys)} score metrics available")
+    print(f"\nTotal: {len(snapshot)} score metrics available")
     print("=" * 70)
 
 if __name__ == "__main__":
@@ -4,12 +4,12 @@ Test script to verify live data access from FrenzCollector.
 This simulates what the dashboard does when accessing streaming data.
 """
 
-import time
 import sys
-from frenz_collector import FrenzCollector
 
 def test_live_data_access():
     """Test that we can access live streaming data from the collector."""
+    # Imported here: the collector pulls in the FRENZ SDK and TensorFlow
+    from frenz_collector import FrenzCollector
 
     print("=" * 60)
     print("Testing Live Data Access from FrenzCollector")
@@ -51,33 +51,44 @@ def test_live_data_access():
 
     # Try to access data
     print("\n" + "=" * 60)
-    print("Monitoring live data for 10 seconds...")
+    print("Monitoring the next 10 score updates...")
     print("=" * 60)
 
+    scores = None
     for i in range(10):
-        print(f"\n[{i+1}/10] Reading scores...")
+        # Each update's report goes out in a single write
+        lines = [f"\n[{i+1}/10] Reading scores..."]
 
         try:
-            focus = streamer.SCORES.get("focus_score")
-            poas = streamer.SCORES.get("poas_score")
-            power_bands = streamer.SCORES.get("power_bands", {})
-            signal_quality = streamer.SCORES.get("signal_quality")
-
-            print(f"  Focus: {focus}")
-            print(f"  POAS: {poas}")
-            print(f"  Power bands: {list(power_bands.keys()) if isinstance(power_bands, dict) else 'N/A'}")
-            print(f"  Signal quality: {type(signal_quality)} - {signal_quality if isinstance(signal_quality, (list, tuple)) else 'N/A'}")
+            # Wake up as soon as the streamer publishes new scores
+            update = collector.device_manager.wait_for_scores(scores, timeout=2.0)
+            if update is None:
+                lines.append("  ⚠️  No new scores within 2 seconds")
+                continue
+            scores = update
+
+            focus = scores.get("focus_score")
+            poas = scores.get("poas_score")
+            power_bands = scores.get("power_bands", {})
+            signal_quality = scores.get("signal_quality")
+
+            lines.append(f"  Focus: {focus}")
+            lines.append(f"  POAS: {poas}")
+            lines.append(f"  Power bands: {list(power_bands.keys()) if isinstance(power_bands, dict) else 'N/A'}")
+            lines.append(f"  Signal quality: {type(signal_quality)} - {signal_quality if isinstance(signal_quality, (list, tuple)) else 'N/A'}")
 
             # Check if we're getting non-None values
             if focus is not None or poas is not None:
-                print("  ✅ Getting live data!")
+                lines.append("  ✅ Getting live data!")
             else:
-                print("  ⚠️  All values are None")
+                lines.append("  ⚠️  All values are None")
 
         except Exception as e:
-            print(f"  ❌ Error reading data: {e}")
+            lines.append(f"  ❌ Error reading data: {e}")
 
-        time.sleep(1)
+        finally:
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
 
     print("\n" + "=" * 60)
     print("Test completed!")
@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 """Test what scores are available from the live streamer."""
 
-import time
 from frenz_collector import FrenzCollector
+from inspect_utils import snapshot_scores
 
 collector = FrenzCollector()
 
@@ -10,15 +10,16 @@ collector = FrenzCollector()
 if not collector.device_manager.is_connected():
     print("Device not connected. Connecting...")
     collector.device_manager.connect()
-    time.sleep(5)
+    collector.device_manager.wait_for_scores(timeout=5)
 
 streamer = collector.device_manager.get_streamer()
 
 if streamer and hasattr(streamer, 'SCORES'):
+    snapshot = snapshot_scores(streamer)
     print("Available SCORES keys:")
-    print(list(streamer.SCORES.keys()))
+    print(list(snapshot))
     print("\nSCORES values:")
-    for key, value in streamer.SCORES.items():
+    for key, value in snapshot.items():
         print(f"  {key}: {type(value)} = {value}")
 else:
     print("No streamer or no SCORES attribute")
\ No newline at end of file
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Test script for the config module.
+
+Covers value lookup and override validation without touching the
+module-level configuration instance.
+"""
+
+import sys
+from pathlib import Path
+
+# Add the current directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import Config, ConfigurationError
+
+
+def test_override_validation():
+    """Test that override() rejects invalid values and keeps the old one."""
+    print("Testing override validation...")
+
+    cfg = Config()
+
+    cfg.override("storage", "chunk_size", 5000)
+    assert cfg.get("storage", "chunk_size") == 5000, "Valid override should be applied"
+
+    try:
+        cfg.override("storage", "compression_level", 11)
+        assert False, "Should raise ConfigurationError for compression level > 9"
+    except ConfigurationError:
+        pass  # Expected
+    assert cfg.get("storage", "compression_level") == 4, "Rejected override should not be applied"
+
+    # Nested values have no per-key rule and go through full validation
+    try:
+        cfg.override("display", "update_intervals", {"focus": 0})
+        assert False, "Should raise ConfigurationError for non-positive update interval"
+    except ConfigurationError:
+        pass  # Expected
+
+    # validate() checks every section up front, not on first access
+    import os
+    os.environ["COMPRESSION_LEVEL"] = "11"
+    try:
+        cfg = Config()
+        cfg.validate()
+        assert False, "validate() should raise ConfigurationError for compression level > 9"
+    except ConfigurationError:
+        pass  # Expected
+    finally:
+        del os.environ["COMPRESSION_LEVEL"]
+
+    print("✓ Override validation tests passed")
+
+
+def test_section_access():
+    """Test attribute and mapping access to settings sections."""
+    print("Testing section access...")
+
+    cfg = Config()
+
+    # Sections are only loaded when first used
+    assert "_storage_settings" not in vars(cfg), "Sections should load lazily"
+
+    # Attribute access and the backwards-compatible mapping interface agree
+    assert cfg.storage.chunk_size == cfg.storage["chunk_size"]
+    assert cfg.device.get("missing_key", "fallback") == "fallback"
+    assert "update_intervals" in cfg.display
+
+    # Sections are immutable; override() swaps in an updated copy
+    try:
+        cfg.storage.chunk_size = 1
+        assert False, "Settings sections should be immutable"
+    except AttributeError:
+        pass  # Expected
+
+    section = cfg.get_section("storage", mutable=True)
+    assert isinstance(section, dict), "mutable=True should return a plain dict"
+
+    cfg.override("storage", "chunk_size", 2048)
+    assert cfg.storage.chunk_size == 2048
+    assert cfg.get("storage.chunk_size") == 2048
+
+    print("✓ Section access tests passed")
+
+
+def test_deferred_values():
+    """Test that derived paths are built on access and can be overridden."""
+    print("Testing deferred values...")
+
+    cfg = Config()
+
+    assert cfg.storage.backup_dir == cfg.storage.data_dir / "backups"
+    assert cfg.storage["backup_dir"] == cfg.storage.backup_dir
+    assert "backup_dir" in cfg.storage.copy()
+
+    cfg.override("storage", "backup_dir", Path("/tmp/frenz_backups"))
+    assert cfg.storage.backup_dir == Path("/tmp/frenz_backups")
+
+    assert cfg.logging.log_file_path == cfg.logging.log_dir / cfg.logging.log_file
+
+    print("✓ Deferred value tests passed")
+
+
+def test_initialize_config_reuse():
+    """Test that initialize_config() only rebuilds when the environment changes."""
+    print("Testing initialize_config reuse...")
+
+    import logging
+    import os
+    import tempfile
+    import config as config_module
+
+    # Run in an empty directory, so no .env is read and the data and log
+    # directories it creates are cleaned up; restore the module state after
+    # (vars() skips the module __getattr__, which would create the global config)
+    module_state = vars(config_module)
+    saved_state = {name: module_state.get(name) for name in ("config", "_initialized", "_applied_logging_settings")}
+    saved_dirs = set(Config._created_dirs)
+    root_logger = logging.getLogger()
+    saved_logging = (root_logger.handlers[:], root_logger.level)
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as work_dir:
+        os.chdir(work_dir)
+        try:
+            first = config_module.initialize_config()
+            assert config_module.initialize_config() is first, "Unchanged environment should reuse the instance"
+            assert Path(work_dir, "logs").is_dir()
+
+            os.environ["HDF5_CHUNK_SIZE"] = "2048"
+            try:
+                second = config_module.initialize_config()
+                assert second is not first, "Changed environment should rebuild the configuration"
+                assert second.storage.chunk_size == 2048
+            finally:
+                del os.environ["HDF5_CHUNK_SIZE"]
+        finally:
+            os.chdir(cwd)
+            for handler in root_logger.handlers:
+                handler.close()
+            root_logger.handlers[:], root_logger.level = saved_logging
+            Config._created_dirs = saved_dirs
+            module_state.update(saved_state)
+            if saved_state["config"] is None:
+                del module_state["config"]
+
+    print("✓ initialize_config reuse tests passed")
+
+
+def test_export():
+    """Test that exports are independent copies and refreshed after an override."""
+    print("Testing configuration export...")
+
+    import json
+
+    cfg = Config()
+
+    exported = cfg.to_dict()
+    exported["display"]["update_intervals"]["focus"] = -1
+    assert cfg.display.update_intervals["focus"] > 0, "Modifying an export should not change the config"
+    assert cfg.to_dict() is not exported
+    assert json.loads(cfg.to_json())["storage"]["chunk_size"] == exported["storage"]["chunk_size"]
+
+    cfg.override("storage", "chunk_size", 4096)
+    assert cfg.to_dict()["storage"]["chunk_size"] == 4096
+    assert json.loads(cfg.to_json())["storage"]["chunk_size"] == 4096
+
+    print("✓ Configuration export tests passed")
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Test script for the data storage module.
+
+Records a short session into a temporary directory and reads it back.
+"""
+
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import h5py
+import numpy as np
+
+# Add the current directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data_storage import DataStorage
+
+
+def test_buffer_and_flush():
+    """Test that appended samples are buffered, flushed, and written back in order."""
+    print("Testing buffering and flush...")
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        storage = DataStorage(data_dir=data_dir, buffer_size_minutes=1)
+        assert storage.initialize_session("test_session")
+
+        eeg = np.arange(21, dtype=np.float32).reshape(3, 7) / 10
+        eeg[0, 0] = 5000.0  # Beyond the int16 range of filtered EEG
+        for i, row in enumerate(eeg):
+            assert storage.append_data("raw/eeg", row, timestamp=100.0 + i)
+            assert storage.append_scores({"focus": float(i)}, timestamp=100.0 + i)
+
+        stats = storage.get_session_stats()
+        assert stats["buffered_samples"] == 6, "Samples should be held in the buffer"
+        assert stats["saved_samples"] == 0
+
+        assert storage.flush_buffer()
+        assert storage.get_session_stats()["buffered_samples"] == 0, "Flush should empty the buffer"
+
+        # Appending after a flush reuses the buffers
+        assert storage.append_scores({"focus": 3.0, "hr": 60}, timestamp=103.0)
+        assert not storage.append_scores({"heart_rate": 60}), "Unknown score fields should be rejected"
+
+        # Filtered EEG is stored as int16 counts; values out of range are clipped
+        # and NaN is stored as the missing value, both counted
+        filtered_eeg = eeg.copy()
+        filtered_eeg[1, 1] = np.nan
+        assert storage.append_batch("filtered/eeg", filtered_eeg, [100.0, 101.0, 102.0])
+
+        h5_path = storage.session_path / "session_data.h5"
+        summary = storage.finalize_session()
+        assert summary["data_stats"]["datasets"]["scores/all"] == 4
+        assert summary["data_stats"]["clipped_values"] == {"filtered/eeg": 1}
+        assert summary["data_stats"]["nan_values"] == {"filtered/eeg": 1}
+
+        with open(storage.session_path / "session_info.json") as f:
+            assert json.load(f)["data_stats"] == summary["data_stats"]
+
+        # Finalizing gives back the disk space reserved up front
+        assert h5_path.stat().st_size < 1 << 20
+
+        # Finalizing trims the preallocated rows
+        with h5py.File(h5_path, "r") as f:
+            assert not f["raw/eeg"].fletcher32, "High-rate signals skip checksums"
+            assert f["scores/all"].fletcher32
+            assert f["raw/eeg"].dtype == np.float32
+            np.testing.assert_allclose(f["raw/eeg"][:], eeg, atol=1e-6)
+            counts = f["filtered/eeg"][:]
+            assert counts[1, 1] == f["filtered/eeg"].attrs["missing_value"] == np.iinfo(np.int16).min
+            filtered = np.where(counts == counts[1, 1], np.nan, counts * f["filtered/eeg"].attrs["scale_uv"])
+            np.testing.assert_allclose(filtered[0, 0], 3276.7, rtol=1e-6)
+            np.testing.assert_allclose(filtered.ravel()[1:], filtered_eeg.ravel()[1:], atol=0.05)
+            scores = f["scores/all"][:]
+            np.testing.assert_array_equal(scores["focus"], [0.0, 1.0, 2.0, 3.0])
+            np.testing.assert_array_equal(scores["hr"], [-1, -1, -1, 60])  # Missing integer scores are -1
+            assert np.isnan(scores["poas"]).all(), "Missing float scores should be NaN"
+            np.testing.assert_array_equal(f["scores/all_ts"][:], [100.0, 101.0, 102.0, 103.0])
+            assert "timestamps" not in f, "Timestamps are stored per stream"
+
+    print("✓ Buffering and flush tests passed")
+
+
+def test_buffer_growth():
+    """Test that a buffer grows instead of dropping samples when it fills up."""
+    print("Testing buffer growth...")
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        storage = DataStorage(data_dir=data_dir, buffer_size_minutes=1)
+        assert storage.initialize_session("test_session")
+
+        capacity = storage._data_buffers["raw/imu"].shape[0]
+        for i in range(capacity + 10):
+            storage._buffer_append("raw/imu", i)
+
+        assert storage._buffer_index["raw/imu"] == capacity + 10
+        assert (storage._data_buffers["raw/imu"][capacity + 9] == capacity + 9).all()
+
+        storage.finalize_session()
+
+    print("✓ Buffer growth tests passed")
+
+
+def test_append_batch():
+    """Test that a batch of samples is buffered like the same samples appended one by one."""
+    print("Testing batch append...")
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        storage = DataStorage(data_dir=data_dir, buffer_size_minutes=1)
+        assert storage.initialize_session("test_session")
+
+        # A batch larger than the buffer makes it grow
+        capacity = storage._data_buffers["raw/ppg"].shape[0]
+        ppg = np.random.rand(capacity + 5, 3).astype(np.float32)
+        timestamps = 100.0 + np.arange(len(ppg)) / 25
+        assert storage.append_batch("raw/ppg", ppg, timestamps)
+
+        assert not storage.append_batch("raw/ppg", np.zeros((2, 4)), timestamps[:2]), "Wrong sample shape"
+        assert not storage.append_batch("raw/ppg", ppg[:2], timestamps[:3]), "Wrong number of timestamps"
+
+        h5_path = storage.session_path / "session_data.h5"
+        storage.finalize_session()
+
+        with h5py.File(h5_path, "r") as f:
+            np.testing.assert_array_equal(f["raw/ppg"][:], ppg)
+            np.testing.assert_allclose(f["raw/ppg_ts"][:], timestamps)
+
+    print("✓ Batch append tests passed")
+
+
+def test_fast_path():
+    """Test that append_data_fast() buffers samples and timestamps like append_data()."""
+    print("Testing fast append path...")
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        storage = DataStorage(data_dir=data_dir, buffer_size_minutes=1)
+        assert storage.initialize_session("test_session")
+
+        imu = np.ones(3, dtype=np.float32)
+        storage.append_data_fast("raw/imu", imu, timestamp_ns=100_000_000_000)
+        before = time.time()
+        storage.append_data_fast("raw/imu", imu * 2)
+        after = time.time()
+
+        h5_path = storage.session_path / "session_data.h5"
+        storage.finalize_session()
+
+        with h5py.File(h5_path, "r") as f:
+            np.testing.assert_array_equal(f["raw/imu"][:], [imu, imu * 2])
+            timestamps = f["raw/imu_ts"][:]
+            assert timestamps[0] == 100.0, "Nanosecond timestamps should be saved as seconds"
+            assert before - 0.01 <= timestamps[1] <= after + 0.01, "Default timestamp should be wall-clock time"
+
+    print("✓ Fast append path tests passed")
+
+
+def test_live_read():
+    """Test that flushed samples can be read while the session is still open."""
+    print("Testing live SWMR read...")
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        storage = DataStorage(data_dir=data_dir, buffer_size_minutes=1)
+        assert storage.initialize_session("test_session")
+        h5_path = storage.session_path / "session_data.h5"
+
+        with h5py.File(h5_path, "r", libver="latest", swmr=True) as reader:
+            for i in range(3):
+                assert storage.append_scores({"focus": float(i)}, timestamp=100.0 + i)
+            assert storage.flush_buffer()
+
+            # Datasets are preallocated, so readers go by n_valid
+            dataset = reader["scores/all"]
+            dataset.refresh()
+            assert dataset.shape[0] > 3
+            n_valid = dataset.attrs["n_valid"]
+            np.testing.assert_array_equal(dataset[:n_valid]["focus"], [0.0, 1.0, 2.0])
+
+        storage.finalize_session()
+
+    print("✓ Live SWMR read tests passed")
+
+
+def test_background_flush():
+    """Test that a full buffer is flushed by the I/O worker, not the appending thread."""
+    print("Testing background flush...")
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        storage = DataStorage(data_dir=data_dir, buffer_size_minutes=1)
+        assert storage.initialize_session("test_session")
+
+        # Pretend the buffers fill up after two samples
+        storage._flush_thresholds["scores/signal_quality"] = 2
+        assert storage.append_data("scores/signal_quality", np.ones(4), timestamp=100.0)
+        assert storage.append_data("scores/signal_quality", np.ones(4), timestamp=101.0)
+
+        deadline = time.time() + 5
+        while storage.get_session_stats()["saved_samples"] < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        assert storage.get_session_stats()["saved_samples"] == 2, "I/O worker should flush the full buffer"
+
+        # Samples appended after the swap land in the other buffer
+        assert storage.append_data("scores/signal_quality", np.ones(4), timestamp=102.0)
+        summary = storage.finalize_session()
+        assert summary["data_stats"]["datasets"]["scores/signal_quality"] == 3
+
+    print("✓ Background flush tests passed")
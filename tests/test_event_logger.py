@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Test script for the event logger module.
+
+Logs events into a temporary directory and checks what ends up on disk.
+"""
+
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add the current directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from event_logger import EventLogger
+
+
+def _saved_events(event_logger):
+    """Read back the events currently saved to disk."""
+    if not event_logger.events_file.exists():
+        return []
+    with open(event_logger.events_file, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_coalesced_auto_save():
+    """Test that auto-saves are batched and written by the writer thread."""
+    print("Testing coalesced auto-save...")
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        event_logger = EventLogger(session_id="test_session", data_dir=data_dir)
+
+        for i in range(3):
+            event_logger.log_event(f"event {i}", "stimulus")
+        assert len(_saved_events(event_logger)) < 3, "Events should not be saved one by one"
+
+        # The scheduled save picks up the whole burst
+        deadline = time.time() + 5
+        while len(_saved_events(event_logger)) < 3 and time.time() < deadline:
+            time.sleep(0.01)
+        assert len(_saved_events(event_logger)) == 3
+
+        # A full batch is saved without waiting out the delay
+        event_logger.AUTO_SAVE_DELAY = 60
+        for i in range(EventLogger.AUTO_SAVE_BATCH):
+            event_logger.log_event(f"batch {i}")
+        deadline = time.time() + 5
+        while len(_saved_events(event_logger)) < 3 + EventLogger.AUTO_SAVE_BATCH and time.time() < deadline:
+            time.sleep(0.01)
+        assert len(_saved_events(event_logger)) == 3 + EventLogger.AUTO_SAVE_BATCH
+
+        # flush() saves whatever is pending
+        event_logger.log_event("last", "response")
+        event_logger.flush()
+        saved = _saved_events(event_logger)
+        assert saved[-1]["description"] == "last"
+        assert saved[-1]["category"] == "response"
+
+        # A new logger for the same session picks up the saved events
+        reloaded = EventLogger(session_id="test_session", data_dir=data_dir)
+        assert reloaded.get_event_count() == len(saved)
+
+        # close() stops the writer after it saved what was queued
+        event_logger.log_event("closing")
+        writer = event_logger._writer
+        event_logger.close()
+        assert not writer.is_alive()
+        assert _saved_events(event_logger)[-1]["description"] == "closing"
+
+        # An idle writer exits on its own and is restarted by the next event
+        reloaded.WRITER_IDLE_TIMEOUT = 0.05
+        reloaded.AUTO_SAVE_DELAY = 0.01
+        reloaded.log_event("idle")
+        writer = reloaded._writer
+        writer.join(timeout=5)
+        assert not writer.is_alive() and reloaded._writer is None
+        reloaded.log_event("restarted")
+        reloaded.close()
+        assert [e["description"] for e in _saved_events(reloaded)[-2:]] == ["idle", "restarted"]
+
+    print("✓ Coalesced auto-save tests passed")
+
+
+def test_append_only_file():
+    """Test that saves append to the JSON Lines file and clearing starts it over."""
+    print("Testing append-only events file...")
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        event_logger = EventLogger(session_id="test_session", data_dir=data_dir, auto_save=False)
+
+        event_logger.log_event("first")
+        assert event_logger.save_events()
+        event_logger.log_event("second", "stimulus")
+        assert event_logger.save_events()
+        assert event_logger.save_events(), "Saving with nothing new should be a no-op"
+        assert [e["description"] for e in _saved_events(event_logger)] == ["first", "second"]
+
+        assert event_logger.clear_events(confirm=True)
+        event_logger.log_event("third")
+        assert event_logger.save_events()
+        assert [e["description"] for e in _saved_events(event_logger)] == ["third"]
+
+        # A line cut short by a crash is dropped and the file rewritten
+        with open(event_logger.events_file, "a", encoding="utf-8") as f:
+            f.write('{"timestamp": 1')
+        event_logger.close()
+        reloaded = EventLogger(session_id="test_session", data_dir=data_dir)
+        assert reloaded.get_event_count() == 1
+        reloaded.log_event("fourth")
+        reloaded.close()
+        assert [e["description"] for e in _saved_events(reloaded)] == ["third", "fourth"]
+
+        with open(reloaded.info_file, encoding="utf-8") as f:
+            assert json.load(f)["total_events"] == 2
+
+        # A checkpoint rewrites the file from memory
+        with open(reloaded.events_file, "a", encoding="utf-8") as f:
+            f.write('{"stray": true}\n')
+        assert reloaded.checkpoint()
+        assert [e["description"] for e in _saved_events(reloaded)] == ["third", "fourth"]
+        reloaded.log_event("fifth")
+        reloaded.close()
+        assert [e["description"] for e in _saved_events(reloaded)] == ["third", "fourth", "fifth"]
+
+    print("✓ Append-only events file tests passed")
+
+
+def test_lazy_load():
+    """Test that existing events are counted up front and read only when needed."""
+    print("Testing lazy loading...")
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        event_logger = EventLogger(session_id="test_session", data_dir=data_dir)
+        for i in range(3):
+            event_logger.log_event(f"old {i}", "stimulus")
+        event_logger.close()
+
+        reloaded = EventLogger(session_id="test_session", data_dir=data_dir)
+        assert reloaded.get_event_count() == 3
+        assert reloaded._unloaded == 3, "Existing events should not be parsed yet"
+
+        # New events are appended without reading the old ones
+        reloaded.log_event("new", "response")
+        reloaded.flush()
+        assert reloaded._unloaded == 3
+        assert reloaded.get_recent_events(1)[0]["description"] == "new"
+
+        descriptions = [e["description"] for e in reloaded.get_events()]
+        assert descriptions == ["old 0", "old 1", "old 2", "new"]
+        assert reloaded.get_session_info()["category_counts"]["stimulus"] == 3
+
+        # Saving after the load appends nothing twice
+        reloaded.log_event("newer")
+        reloaded.close()
+        assert [e["description"] for e in _saved_events(reloaded)] == descriptions + ["newer"]
+
+        eager = EventLogger(session_id="test_session", data_dir=data_dir, lazy_load=False)
+        assert eager._unloaded == 0 and eager.get_event_count() == 5
+
+    print("✓ Lazy loading tests passed")
+
+
+def test_legacy_events_file():
+    """Test that events saved as a single JSON document are loaded and carried over."""
+    print("Testing legacy events file...")
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        session_dir = Path(data_dir) / "test_session"
+        session_dir.mkdir()
+        legacy_events = [
+            {"timestamp": 1.0, "iso_time": "1970-01-01T00:00:01Z",
+             "description": "legacy", "category": "other", "session_id": "test_session"},
+            {"timestamp": 2.0, "description": "renamed", "category": "note"},
+            {"description": "no timestamp", "category": "other"},
+        ]
+        with open(session_dir / "events.json", "w", encoding="utf-8") as f:
+            json.dump({"session_info": {}, "events": legacy_events}, f)
+
+        event_logger = EventLogger(session_id="test_session", data_dir=data_dir)
+        assert event_logger.get_event_count() == 2, "Events without a timestamp are skipped"
+        validation = event_logger.validate_event_integrity()
+        assert validation["issues"] == ["Event 1: Invalid category 'note'"]
+
+        event_logger.log_event("new")
+        event_logger.close()
+        assert [e["description"] for e in _saved_events(event_logger)] == ["legacy", "renamed", "new"]
+
+    print("✓ Legacy events file tests passed")
+
+
+def test_get_events_filters():
+    """Test time range and category filtering, in and out of chronological order."""
+    print("Testing event filtering...")
+
+    from unittest import mock
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        event_logger = EventLogger(session_id="test_session", data_dir=data_dir, auto_save=False)
+
+        def log_at(timestamp, description, category):
+            with mock.patch("event_logger.time.time_ns", return_value=round(timestamp * 1e9)):
+                event_logger.log_event(description, category)
+
+        for i, category in enumerate(["stimulus", "response", "stimulus", "other"]):
+            log_at(100.0 + i, f"event {i}", category)
+
+        def descriptions(**filters):
+            return [e["description"] for e in event_logger.get_events(**filters)]
+
+        assert descriptions(start_time=101.0, end_time=102.0) == ["event 1", "event 2"], "Range is inclusive"
+        assert descriptions(start_time=102.5) == ["event 3"]
+        assert descriptions(category="stimulus") == ["event 0", "event 2"]
+        assert descriptions(end_time=101.0, category="stimulus") == ["event 0"]
+        assert event_logger.get_session_info()["category_counts"] == {
+            "stimulus": 2, "response": 1, "subjective": 0, "other": 1
+        }
+
+        event = event_logger.get_events(category="response")[0]
+        assert event == {"timestamp": 101.0, "iso_time": event["iso_time"], "description": "event 1",
+                         "category": "response", "session_id": "test_session"}
+        assert [e["description"] for e in event_logger.get_recent_events(2)] == ["event 2", "event 3"]
+
+        try:
+            event_logger.get_events(category="invalid_category")
+            assert False, "Should raise ValueError for invalid category"
+        except ValueError:
+            pass  # Expected
+
+        # Out-of-order timestamps (e.g. after a clock change) fall back to a scan
+        log_at(99.5, "event 4", "stimulus")
+        assert descriptions(end_time=100.0) == ["event 0", "event 4"]
+        assert descriptions(end_time=100.0, category="stimulus") == ["event 0", "event 4"]
+        assert not event_logger.validate_event_integrity()["is_valid"]
+
+    # Ranges match the reported timestamps exactly, whatever the nanoseconds were
+    with tempfile.TemporaryDirectory() as data_dir:
+        event_logger = EventLogger(session_id="test_session", data_dir=data_dir, auto_save=False)
+        events = [event_logger.log_event(f"event {i}") for i in range(20)]
+        for event in events:
+            found = event_logger.get_events(start_time=event["timestamp"], end_time=event["timestamp"])
+            assert [e["description"] for e in found] == [event["description"]]
+        assert event_logger.get_events() == events
+
+    print("✓ Event filtering tests passed")
+
+
+def test_concurrent_logging():
+    """Test that events logged from several threads are each saved exactly once."""
+    print("Testing concurrent logging...")
+
+    import threading
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        event_logger = EventLogger(session_id="test_session", data_dir=data_dir)
+
+        def log_many(thread_index):
+            for i in range(100):
+                event_logger.log_event(f"thread {thread_index} event {i}")
+
+        threads = [threading.Thread(target=log_many, args=(t,)) for t in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        event_logger.close()
+
+        saved = [e["description"] for e in _saved_events(event_logger)]
+        assert len(saved) == 400
+        assert len(set(saved)) == 400, "No event should be saved twice"
+
+    print("✓ Concurrent logging tests passed")
+
+
+def test_export():
+    """Test CSV and JSON exports of the logged events."""
+    print("Testing event export...")
+
+    import csv
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        event_logger = EventLogger(session_id="test_session", data_dir=data_dir, auto_save=False)
+        event_logger.log_event("Stimulus \"A\", shown", "stimulus")
+        event_logger.log_event("Réponse", "response")
+
+        csv_path = event_logger.export_events("csv", Path(data_dir) / "events.csv")
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert [row["description"] for row in rows] == ["Stimulus \"A\", shown", "Réponse"]
+        assert float(rows[0]["timestamp"]) == event_logger.get_events()[0]["timestamp"]
+
+        json_path = event_logger.export_events("json", Path(data_dir) / "events.json", category="response")
+        with open(json_path, encoding="utf-8") as f:
+            exported = json.load(f)
+        assert exported["export_info"]["event_count"] == 1
+        assert exported["events"] == event_logger.get_events(category="response")
+
+    print("✓ Event export tests passed")
+
+
+def test_iso_time():
+    """Test that the cached ISO formatter matches datetime.isoformat()."""
+    print("Testing ISO time formatting...")
+
+    from datetime import datetime
+    from event_logger import _iso_time
+
+    now = time.time()
+    for timestamp in [now, now + 0.5, 1700000000.0, 1700000000.0000005, 1700000000.9999996, 1.25]:
+        assert _iso_time(timestamp) == datetime.fromtimestamp(timestamp).isoformat() + "Z", timestamp
+
+    print("✓ ISO time formatting tests passed")
@@ -53,7 +53,8 @@ def test_dashboard_compatibility():
         'get_session_stats',
         'is_connected',
         'get_device_info',
-        'log_event'
+        'log_event',
+        'on_score'
     ]
 
     for method_name in methods_to_test:
@@ -175,9 +176,9 @@ def test_data_structure_compatibility():
     expected_datasets = [
         "raw/eeg", "raw/eog", "raw/emg", "raw/imu", "raw/ppg",
         "filtered/eeg", "filtered/eog", "filtered/emg",
-        "scores/poas", "scores/focus", "scores/posture", "scores/sleep_stage", "scores/signal_quality",
+        "scores/all", "scores/signal_quality",
         "power_bands/alpha", "power_bands/beta", "power_bands/gamma", "power_bands/theta", "power_bands/delta",
-        "timestamps"
+        "raw/eeg_ts", "scores/all_ts"
     ]
 
     for dataset in expected_datasets:
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test script for the ring buffer module.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add the current directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ring_buffer import RingBuffer
+
+
+def test_append_and_wrap():
+    """Test that samples come back oldest first, before and after wrapping."""
+    print("Testing ring buffer append and wrap-around...")
+
+    buffer = RingBuffer(4)
+    assert len(buffer) == 0, "New buffer should be empty"
+
+    for i in range(3):
+        buffer.append(float(i), i * 10.0)
+    t, v = buffer.ordered()
+    assert list(t) == [0.0, 1.0, 2.0]
+    assert list(v) == [0.0, 10.0, 20.0]
+
+    for i in range(3, 6):
+        buffer.append(float(i), i * 10.0)
+    assert len(buffer) == 4, "Full buffer should report its capacity"
+    t, v = buffer.ordered()
+    assert list(t) == [2.0, 3.0, 4.0, 5.0], "Oldest samples should be overwritten"
+    assert list(v) == [20.0, 30.0, 40.0, 50.0]
+
+    buffer.clear()
+    assert len(buffer) == 0, "Cleared buffer should be empty"
+
+    print("✓ Ring buffer append and wrap-around tests passed")
+
+
+def test_multichannel():
+    """Test buffers holding several values per sample."""
+    print("Testing multi-channel ring buffer...")
+
+    buffer = RingBuffer(3, channels=3)
+    for i in range(4):
+        buffer.append(float(i), np.array([i, i + 0.5, i + 1.0]))
+
+    t, v = buffer.ordered()
+    assert v.shape == (3, 3), "Values should have one column per channel"
+    assert list(t) == [1.0, 2.0, 3.0]
+    assert list(v[:, 2]) == [2.0, 3.0, 4.0]
+
+    print("✓ Multi-channel ring buffer tests passed")
+
+
+def test_extend():
+    """Test appending blocks of samples, including blocks that wrap around."""
+    print("Testing ring buffer extend...")
+
+    buffer = RingBuffer(5, channels=2)
+    buffer.extend(np.arange(3.0), np.arange(6.0).reshape(3, 2))
+    buffer.extend(np.arange(3.0, 7.0), np.arange(6.0, 14.0).reshape(4, 2))
+
+    t, v = buffer.ordered()
+    assert list(t) == [2.0, 3.0, 4.0, 5.0, 6.0], "Block should wrap around the buffer"
+    assert list(v[:, 0]) == [4.0, 6.0, 8.0, 10.0, 12.0]
+
+    buffer.extend(np.arange(10.0, 20.0), np.zeros((10, 2)))
+    t, _ = buffer.ordered()
+    assert list(t) == [15.0, 16.0, 17.0, 18.0, 19.0], "Oversized block should keep its newest samples"
+
+    print("✓ Ring buffer extend tests passed")
+
+
+def test_version():
+    """Test that every change bumps the version, including once the buffer is full."""
+    print("Testing ring buffer version...")
+
+    buffer = RingBuffer(2)
+    versions = [buffer.version]
+    for i in range(3):
+        buffer.append(float(i), float(i))
+        versions.append(buffer.version)
+    buffer.extend(np.arange(2.0), np.arange(2.0))
+    versions.append(buffer.version)
+    buffer.clear()
+    versions.append(buffer.version)
+
+    assert len(set(versions)) == len(versions), "Each change should produce a new version"
+
+    print("✓ Ring buffer version tests passed")